@@ -0,0 +1,33 @@
+"""Add content_hash to files
+
+Revision ID: 074b5c9eb451
+Revises: b12b69a02d57
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "074b5c9eb451"
+down_revision: Union[str, None] = "b12b69a02d57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "files", sa.Column("content_hash", sa.String(length=256), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_files_content_hash"), "files", ["content_hash"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_files_content_hash"), table_name="files")
+    op.drop_column("files", "content_hash")
@@ -0,0 +1,49 @@
+"""Add lower() lookup indexes
+
+Revision ID: 13a5ceed154d
+Revises: 26af8ae4e376
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "13a5ceed154d"
+down_revision: Union[str, None] = "26af8ae4e376"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Колонки, которые ищутся через func.lower(column) == value
+LOWER_INDEX_COLUMNS = {
+    "factories": ["sap_id"],
+    "workshops": ["sap_id"],
+    "materials": ["sap_id"],
+    "workshop_schedules": ["workshop_sap_id"],
+    "orders": ["zakaz", "status"],
+    "users": ["sid", "preferred_username"],
+    "vehicles": ["registration_number"],
+    "organizations": ["bin", "email", "phone"],
+}
+
+
+def index_name(table: str, column: str) -> str:
+    return f"ix_{table}_{column}_lower"
+
+
+def upgrade() -> None:
+    for table, columns in LOWER_INDEX_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                index_name(table, column), table, [sa.func.lower(sa.column(column))]
+            )
+
+
+def downgrade() -> None:
+    for table, columns in LOWER_INDEX_COLUMNS.items():
+        for column in columns:
+            op.drop_index(index_name(table, column), table_name=table)
@@ -0,0 +1,33 @@
+"""Add storage_key to files for content-addressed storage
+
+Revision ID: 1522646b624f
+Revises: 074b5c9eb451
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1522646b624f"
+down_revision: Union[str, None] = "074b5c9eb451"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "files", sa.Column("storage_key", sa.String(length=256), nullable=True)
+    )
+    op.create_index(
+        op.f("ix_files_storage_key"), "files", ["storage_key"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_files_storage_key"), table_name="files")
+    op.drop_column("files", "storage_key")
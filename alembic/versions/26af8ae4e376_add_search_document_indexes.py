@@ -0,0 +1,141 @@
+"""Add search document columns and search indexes
+
+Revision ID: 26af8ae4e376
+Revises: 9f24e08e7b30
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "26af8ae4e376"
+down_revision: Union[str, None] = "9f24e08e7b30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Поля поискового документа на момент миграции (см. app/infrastructure/search_registry.py)
+SEARCH_COLUMNS = {
+    "orders": [
+        "status",
+        "factory_sap_id",
+        "workshop_sap_id",
+        "material_sap_id",
+        "zakaz",
+        "txn_id",
+        "iin",
+        "owner_sid",
+        "owner_username",
+        "owner_email",
+        "owner_mobile",
+        "name",
+        "adr_index",
+        "adr_city",
+        "adr_str",
+        "adr_dom",
+        "bin",
+        "dogovor",
+        "canceled_by_sid",
+    ],
+    "files": ["filename", "file_path", "content_type"],
+    "users": [
+        "sid",
+        "iin",
+        "name",
+        "given_name",
+        "family_name",
+        "preferred_username",
+        "email",
+        "phone",
+        "tabn",
+    ],
+    "organization_employees": ["bin", "sid"],
+    "vehicles": ["registration_number", "car_model", "vehicle_info"],
+    "verified_users": [
+        "sid",
+        "iin",
+        "verified_by",
+        "verified_by_sid",
+        "description",
+        "response",
+    ],
+    "organizations": [
+        "full_name",
+        "short_name",
+        "bin",
+        "bik",
+        "kbe",
+        "email",
+        "phone",
+        "address",
+    ],
+    "verified_vehicles": [
+        "car_number",
+        "verified_by",
+        "verified_by_sid",
+        "description",
+        "response",
+    ],
+    "employee_requests": [
+        "employee_name",
+        "employee_email",
+        "employee_sid",
+        "organization_full_name",
+        "organization_bin",
+        "owner_name",
+        "owner_sid",
+    ],
+}
+
+
+def is_postgresql() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def document_expression(columns: list[str]) -> str:
+    if is_postgresql():
+        return "lower({})".format(
+            " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        )
+    return f"lower(concat_ws(' ', {', '.join(columns)}))"
+
+
+def index_name(table: str) -> str:
+    return f"ix_{table}_search_document"
+
+
+def upgrade() -> None:
+    if is_postgresql():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, columns in SEARCH_COLUMNS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_document",
+                sa.Text(),
+                sa.Computed(document_expression(columns), persisted=True),
+                nullable=True,
+            ),
+        )
+        if is_postgresql():
+            op.create_index(
+                index_name(table),
+                table,
+                ["search_document"],
+                postgresql_using="gin",
+                postgresql_ops={"search_document": "gin_trgm_ops"},
+            )
+        else:
+            op.create_index(
+                index_name(table), table, ["search_document"], mysql_prefix="FULLTEXT"
+            )
+
+
+def downgrade() -> None:
+    for table in SEARCH_COLUMNS:
+        op.drop_index(index_name(table), table_name=table)
+        op.drop_column(table, "search_document")
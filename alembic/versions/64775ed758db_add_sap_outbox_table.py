@@ -0,0 +1,67 @@
+"""Add sap_outbox table for background SAP 088 order submission
+
+Revision ID: 64775ed758db
+Revises: c1bd79c9b55d
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "64775ed758db"
+down_revision: Union[str, None] = "c1bd79c9b55d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sap_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("order_id", sa.Integer(), nullable=False),
+        sa.Column("sap_request_id", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(length=256), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["order_id"], ["orders.id"], onupdate="cascade", ondelete="cascade"
+        ),
+        sa.ForeignKeyConstraint(
+            ["sap_request_id"],
+            ["sap_requests.id"],
+            onupdate="cascade",
+            ondelete="set null",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sap_outbox_order_id", "sap_outbox", ["order_id"])
+    op.create_index(
+        "ix_sap_outbox_status_next_attempt_at",
+        "sap_outbox",
+        ["status", "next_attempt_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sap_outbox_status_next_attempt_at", table_name="sap_outbox")
+    op.drop_index("ix_sap_outbox_order_id", table_name="sap_outbox")
+    op.drop_table("sap_outbox")
@@ -0,0 +1,39 @@
+"""Add file_id to sap_requests for SAP order PDFs
+
+Revision ID: b12b69a02d57
+Revises: 13a5ceed154d
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b12b69a02d57"
+down_revision: Union[str, None] = "13a5ceed154d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEY_NAME = "fk_sap_requests_file_id_files"
+
+
+def upgrade() -> None:
+    op.add_column("sap_requests", sa.Column("file_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        FOREIGN_KEY_NAME,
+        "sap_requests",
+        "files",
+        ["file_id"],
+        ["id"],
+        onupdate="cascade",
+        ondelete="set null",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(FOREIGN_KEY_NAME, "sap_requests", type_="foreignkey")
+    op.drop_column("sap_requests", "file_id")
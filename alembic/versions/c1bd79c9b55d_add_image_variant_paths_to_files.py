@@ -0,0 +1,29 @@
+"""Add image variant paths to files
+
+Revision ID: c1bd79c9b55d
+Revises: 1522646b624f
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c1bd79c9b55d"
+down_revision: Union[str, None] = "1522646b624f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("files", sa.Column("thumbnail_path", sa.Text(), nullable=True))
+    op.add_column("files", sa.Column("preview_path", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("files", "preview_path")
+    op.drop_column("files", "thumbnail_path")
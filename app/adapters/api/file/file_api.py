@@ -1,16 +1,29 @@
 from typing import Optional
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.file.file_dto import FileRDTO
 from app.adapters.dto.pagination_dto import PaginationFileRDTO
+from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.filters.file.file_filter import FileFilter
+from app.core.api_middleware_core import check_admin
 from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.database import get_db
+from app.infrastructure.services.file_service import FileService
+from app.infrastructure.services.image_variant_service import ImageVariant
 from app.shared.path_constants import AppPathConstants
 from app.use_cases.file.delete_file_case import DeleteFileCase
 from app.use_cases.file.get_file_by_id_case import GetFileByIdCase
+from app.use_cases.file.get_file_content_case import GetFileContentCase
 from app.use_cases.file.paginate_file_case import PaginateFileCase
 from app.use_cases.file.save_file_case import SaveFileCase
 from app.use_cases.file.update_file_case import UpdateFileCase
@@ -52,6 +65,16 @@ class FileApi:
             summary="Получить файл по уникальному ID",
             description="Получение файла по уникальному идентификатору",
         )(self.get)
+        self.router.get(
+            f"{AppPathConstants.DownloadFilePathName}",
+            summary="Скачать файл по уникальному ID",
+            description="Выдача содержимого файла администратору с ETag/Last-Modified и поддержкой Range",
+        )(self.download)
+        self.router.get(
+            f"{AppPathConstants.GetFileVariantPathName}",
+            summary="Получить уменьшенную копию изображения",
+            description="Миниатюра или превью изображения в webp администратору; пока копия не построена, отдается оригинал изображения",
+        )(self.get_variant)
 
     async def get_all(
         self, parameters: FileFilter = Depends(), db: AsyncSession = Depends(get_db)
@@ -134,3 +157,49 @@ class FileApi:
                 extra={"id": id, "details": str(exc)},
                 is_custom=True,
             )
+
+    async def download(
+        self,
+        id: AppPathConstants.IDPath,
+        request: Request,
+        user: UserWithRelationsDTO = Depends(check_admin),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetFileContentCase(db)
+        try:
+            file = await use_case.execute(id=id)
+            return await FileService.response(file=file, request=request)
+        except HTTPException as exc:
+            raise exc
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при скачивании файла",
+                extra={"id": id, "details": str(exc)},
+                is_custom=True,
+            )
+
+    async def get_variant(
+        self,
+        id: AppPathConstants.IDPath,
+        request: Request,
+        variant: str = Query(
+            default=ImageVariant.THUMBNAIL,
+            description="Вариант изображения: thumbnail или preview",
+        ),
+        user: UserWithRelationsDTO = Depends(check_admin),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetFileContentCase(db)
+        try:
+            file = await use_case.execute(id=id, variant=variant)
+            return await FileService.variant_response(
+                file=file, variant=variant, request=request
+            )
+        except HTTPException as exc:
+            raise exc
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при получении копии изображения",
+                extra={"id": id, "details": str(exc)},
+                is_custom=True,
+            )
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends
+
+from app.adapters.dto.user.user_dto import UserWithRelationsDTO
+from app.core.api_middleware_core import check_admin
+from app.infrastructure.http_transport import http_transport
+from app.infrastructure.redis_client import redis_cache
+from app.infrastructure.services.sap_contract_cache import sap_contract_cache
+from app.shared.path_constants import AppPathConstants
+
+
+class MonitoringApi:
+    def __init__(self) -> None:
+        self.router = APIRouter()
+        self._add_routes()
+
+    def _add_routes(self) -> None:
+        self.router.get(
+            f"{AppPathConstants.HttpPoolsPathName}",
+            response_model=dict[str, dict],
+            summary="Состояние пулов HTTP-соединений",
+            description=(
+                "Насыщение пулов соединений, bulkhead, повторы и состояние "
+                "circuit breaker для SAP, Kaspi и других сервисов"
+            ),
+        )(self.http_pools)
+        self.router.get(
+            f"{AppPathConstants.HealthPathName}",
+            response_model=dict[str, bool],
+            summary="Проверка доступности зависимостей",
+            description="Проверка доступности Redis",
+        )(self.health)
+        self.router.get(
+            f"{AppPathConstants.SapContractCachePathName}",
+            response_model=dict[str, int],
+            summary="Кэш договоров SAP 083",
+            description="Попадания, устаревшие попадания и промахи кэша договоров по БИН",
+        )(self.sap_contract_cache)
+
+    async def http_pools(self, user: UserWithRelationsDTO = Depends(check_admin)):
+        return http_transport.get_stats()
+
+    async def health(self, user: UserWithRelationsDTO = Depends(check_admin)):
+        return {"redis": await redis_cache.health_check()}
+
+    async def sap_contract_cache(
+        self, user: UserWithRelationsDTO = Depends(check_admin)
+    ):
+        return sap_contract_cache.get_stats()
@@ -1,28 +1,36 @@
 import traceback
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.order.create_order_dto import CreateOrderDTO
 from app.adapters.dto.order.order_dto import OrderWithRelationsDTO
 from app.adapters.dto.order_status.order_status_dto import OrderStatusWithRelationsDTO
 from app.adapters.dto.pagination_dto import PaginationOrderWithRelationsDTO
+from app.adapters.dto.sap.sap_outbox_dto import SapOrderStatusDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.filters.order.client.order_client_filter import OrderClientFilter
 from app.core.api_middleware_core import check_client
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.http_cache_core import etag_json_response
 from app.infrastructure.config import app_config
 from app.infrastructure.database import get_db
+from app.infrastructure.services.sap_outbox_queue import (
+    SapOrderStatusSubscription,
+    sap_outbox_queue,
+)
+from app.infrastructure.unit_of_work import unit_of_work
 from app.shared.path_constants import AppPathConstants
-from app.use_cases.order.client.add_sap_id_to_order_case import AddSapIdToOrderCase
 from app.use_cases.order.client.all_order_case import AllClientOrderCase
 from app.use_cases.order.client.create_order_case import CreateClientOrderCase
 from app.use_cases.order.client.get_order_by_id_case import GetClientOrderByIdCase
 from app.use_cases.order.client.get_order_by_value_case import GetClientOrderByValueCase
 from app.use_cases.order.client.paginate_order_case import PaginateClientOrderCase
-from app.use_cases.sap.client.create_client_sap_order_case import (
-    CreateClientSapOrderCase,
+from app.use_cases.sap.client.get_client_sap_order_status_case import (
+    GetClientSapOrderStatusCase,
 )
+from app.use_cases.sap.outbox.enqueue_sap_order_case import EnqueueSapOrderCase
 
 
 class OrderApi:
@@ -63,6 +71,17 @@ class OrderApi:
             summary="Получить заказ клиента по значению",
             description="Получение заказа клиента по значению",
         )(self.get_client_order_by_value)
+        self.router.get(
+            f"{AppPathConstants.GetClientOrderSapStatusPathName}",
+            response_model=SapOrderStatusDTO,
+            summary="Статус отправки заказа клиента в SAP",
+            description="Опрос статуса формирования заказа в SAP (поддерживает If-None-Match)",
+        )(self.get_client_order_sap_status)
+        self.router.get(
+            f"{AppPathConstants.StreamClientOrderSapStatusPathName}",
+            summary="Подписка на статус отправки заказа клиента в SAP",
+            description="Server-Sent Events: текущий статус и его изменения до завершения отправки",
+        )(self.stream_client_order_sap_status)
 
     async def create_client_order(
         self,
@@ -71,15 +90,17 @@ class OrderApi:
         db: AsyncSession = Depends(get_db),
     ):
         use_case = CreateClientOrderCase(db)
-        sap_case = CreateClientSapOrderCase(db)
-        update_order_case = AddSapIdToOrderCase(db)
+        enqueue_case = EnqueueSapOrderCase(db)
         try:
-            order = await use_case.execute(dto=dto, user=user)
-            if app_config.sap_create_order_after_order:
-                sap_request = await sap_case.execute(order_id=order.id, user=user)
-                order = await update_order_case.execute(
-                    sap_id=sap_request.id, user=user
-                )
+            # Заказ и запись outbox фиксируются одной транзакцией; заявку в
+            # SAP отправляет воркер, статус — GetClientOrderSapStatusPathName
+            outbox = None
+            async with unit_of_work(db):
+                order = await use_case.execute(dto=dto, user=user)
+                if app_config.sap_create_order_after_order:
+                    outbox = await enqueue_case.execute(order_id=order.id)
+            if outbox:
+                await sap_outbox_queue.push(outbox.id)
             return order
         except HTTPException as exc:
             raise exc
@@ -166,3 +187,76 @@ class OrderApi:
                 extra={"details": f"{str(exc)}"},
                 is_custom=True,
             )
+
+    async def get_client_order_sap_status(
+        self,
+        id: AppPathConstants.IDPath,
+        request: Request,
+        user: UserWithRelationsDTO = Depends(check_client),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetClientSapOrderStatusCase(db)
+        try:
+            status = await use_case.execute(order_id=id, user=user)
+            return etag_json_response(request=request, payload=status)
+        except HTTPException as exc:
+            raise exc
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при получении статуса отправки заказа в SAP",
+                extra={"details": f"{str(exc)}"},
+                is_custom=True,
+            )
+
+    async def stream_client_order_sap_status(
+        self,
+        id: AppPathConstants.IDPath,
+        user: UserWithRelationsDTO = Depends(check_client),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetClientSapOrderStatusCase(db)
+        # Подписка до чтения статуса: иначе итог, опубликованный между
+        # чтением и подпиской, до клиента бы не дошел
+        subscription = await sap_outbox_queue.subscribe(order_id=id)
+        try:
+            status = await use_case.execute(order_id=id, user=user)
+            return StreamingResponse(
+                self._sap_status_events(status, subscription),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
+        except HTTPException as exc:
+            subscription.close()
+            raise exc
+        except Exception as exc:
+            subscription.close()
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при подписке на статус отправки заказа в SAP",
+                extra={"details": f"{str(exc)}"},
+                is_custom=True,
+            )
+
+    @staticmethod
+    async def _sap_status_events(
+        status: SapOrderStatusDTO, subscription: SapOrderStatusSubscription
+    ):
+        try:
+            yield f"data: {status.model_dump_json()}\n\n"
+            if status.is_final:
+                return
+            async for update in subscription.updates(
+                timeout=app_config.sap_outbox_status_stream_timeout_sec
+            ):
+                if update is None:
+                    # Комментарий SSE не дает прокси закрыть простаивающее соединение
+                    yield ": keep-alive\n\n"
+                    continue
+                if update == status:
+                    # Опубликовано до чтения статуса и уже отправлено клиенту
+                    continue
+                status = update
+                yield f"data: {update.model_dump_json()}\n\n"
+                if update.is_final:
+                    return
+        finally:
+            subscription.close()
@@ -1,18 +1,29 @@
 import traceback
 
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.order.order_dto import OrderWithRelationsDTO
+from app.adapters.dto.sap.sap_contract_dto import SapContractForResponseDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.core.api_middleware_core import check_client
 from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.database import get_db
+from app.infrastructure.services.file_service import FileService
 from app.shared.path_constants import AppPathConstants
 from app.use_cases.order.client.add_sap_id_to_order_case import AddSapIdToOrderCase
 from app.use_cases.sap.client.create_client_sap_order_case import (
     CreateClientSapOrderCase,
 )
+from app.use_cases.sap.client.get_client_company_contracts_case import (
+    GetClientCompanyContractsCase,
+)
+from app.use_cases.sap.client.get_client_sap_request_pdf_case import (
+    GetClientSapRequestPdfCase,
+)
 
 
 class SapRequestApi:
@@ -27,6 +38,18 @@ class SapRequestApi:
             summary="Пересоздать заказ SAP",
             description="Создание заказа SAP",
         )(self.recreate_sap_order)
+        self.router.get(
+            f"{AppPathConstants.GetClientSapRequestPdfPathName}",
+            response_class=FileResponse,
+            summary="Скачать PDF заказа SAP",
+            description="Потоковая выдача PDF заказа, сформированного SAP",
+        )(self.get_client_pdf)
+        self.router.get(
+            f"{AppPathConstants.GetClientCompanyContractsPathName}",
+            response_model=List[SapContractForResponseDTO],
+            summary="Договоры организации в SAP",
+            description="Договоры и остатки организации клиента по БИН из SAP 083",
+        )(self.get_client_company_contracts)
 
     async def recreate_sap_order(
         self,
@@ -49,3 +72,41 @@ class SapRequestApi:
                 extra={"details": f"{str(exc)}"},
                 is_custom=True,
             )
+
+    async def get_client_pdf(
+        self,
+        id: AppPathConstants.IDPath,
+        request: Request,
+        user: UserWithRelationsDTO = Depends(check_client),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetClientSapRequestPdfCase(db)
+        try:
+            file = await use_case.execute(id=id, user=user)
+            return await FileService.response(file=file, request=request)
+        except HTTPException as exc:
+            raise exc
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при получении PDF заказа",
+                extra={"details": f"{str(exc)}"},
+                is_custom=True,
+            )
+
+    async def get_client_company_contracts(
+        self,
+        id: AppPathConstants.IDPath,
+        user: UserWithRelationsDTO = Depends(check_client),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetClientCompanyContractsCase(db)
+        try:
+            return await use_case.execute(organization_id=id, user=user)
+        except HTTPException as exc:
+            raise exc
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при получении договоров организации",
+                extra={"details": f"{str(exc)}"},
+                is_custom=True,
+            )
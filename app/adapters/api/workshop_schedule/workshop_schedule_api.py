@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.workshop_schedule.workshop_schedule_by_day_dto import WorkshopScheduleByDayDTO
+from app.adapters.dto.workshop_schedule.workshop_schedule_calendar_dto import (
+    WorkshopScheduleCalendarDTO,
+    WorkshopScheduleCalendarFilterDTO,
+)
 from app.adapters.dto.workshop_schedule.workshop_schedule_dto import (
     WorkshopScheduleCDTO,
     WorkshopScheduleWithRelationsDTO,
 )
 from app.adapters.dto.workshop_schedule.workshop_schedule_space_dto import WorkshopScheduleSpaceDTO
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.http_cache_core import etag_json_response
 from app.infrastructure.database import get_db
 from app.shared.path_constants import AppPathConstants
 from app.use_cases.workshop_schedule.all_workshop_schedule_case import (
@@ -20,6 +25,9 @@ from app.use_cases.workshop_schedule.delete_workshop_schedule_case import (
     DeleteWorkshopScheduleCase,
 )
 from app.use_cases.workshop_schedule.get_workshop_schedule_by_day_case import GetWorkshopScheduleByDayCase
+from app.use_cases.workshop_schedule.get_workshop_schedule_calendar_case import (
+    GetWorkshopScheduleCalendarCase,
+)
 from app.use_cases.workshop_schedule.get_workshop_schedule_by_id_case import (
     GetWorkshopScheduleByIdCase,
 )
@@ -79,6 +87,12 @@ class WorkshopScheduleApi:
             summary="Получить расписание цеха",
             description="Получение расписаний цеха",
         )(self.get_free_space_path)
+        self.router.get(
+            f"{AppPathConstants.GetWorkshopScheduleCalendarPathName}",
+            response_model=WorkshopScheduleCalendarDTO,
+            summary="Получить свободные слоты цеха за период",
+            description="Свободные слоты цеха по дням за период; поддерживает ETag/If-None-Match",
+        )(self.get_calendar)
 
     async def get_all(self, db: AsyncSession = Depends(get_db)):
         use_case = AllWorkshopScheduleCase(db)
@@ -184,4 +198,23 @@ class WorkshopScheduleApi:
                 message="Ошибка при получении расписания цеха",
                 extra={"details": str(exc)},
                 is_custom=True,
-            )
\ No newline at end of file
+            )
+
+    async def get_calendar(
+        self,
+        request: Request,
+        dto: WorkshopScheduleCalendarFilterDTO = Depends(),
+        db: AsyncSession = Depends(get_db),
+    ):
+        use_case = GetWorkshopScheduleCalendarCase(db)
+        try:
+            calendar = await use_case.execute(dto=dto)
+            return etag_json_response(request=request, payload=calendar)
+        except HTTPException as exc:
+            raise exc
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при получении свободных слотов цеха за период",
+                extra={"details": str(exc)},
+                is_custom=True,
+            )
@@ -26,6 +26,13 @@ class FileRDTO(FileDTO):
     file_path: DTOConstant.StandardTextField()
     file_size: DTOConstant.StandardIntegerField()
     content_type: DTOConstant.StandardVarcharField()
+    content_hash: DTOConstant.StandardNullableVarcharField()
+    thumbnail_path: DTOConstant.StandardNullableTextField(
+        description="Путь к миниатюре изображения"
+    )
+    preview_path: DTOConstant.StandardNullableTextField(
+        description="Путь к уменьшенной копии изображения"
+    )
     created_at: DTOConstant.StandardCreatedAt
     updated_at: DTOConstant.StandardUpdatedAt
 
@@ -20,6 +20,16 @@ class OrderDTO(BaseModel):
         from_attributes = True
 
 
+# Колоночная проекция заказа для оплаты (без загрузки модели и связей)
+class OrderPaymentDTO(BaseModel):
+    id: DTOConstant.StandardID()
+    zakaz: DTOConstant.StandardNullableVarcharField()
+    price_with_taxes: DTOConstant.StandardPriceField()
+
+    class Config:
+        from_attributes = True
+
+
 class OrderCDTO(BaseModel):
     status_id: DTOConstant.StandardIntegerField()
     status: DTOConstant.StandardVarcharField()
@@ -36,6 +36,7 @@ class OrderStatusRDTO(OrderStatusDTO):
     next_value: DTOConstant.StandardNullableVarcharField()
     is_first: DTOConstant.StandardNullableBooleanField()
     is_last: DTOConstant.StandardNullableBooleanField()
+    status: DTOConstant.StandardBooleanTrueField()
     created_at: DTOConstant.StandardCreatedAt
     updated_at: DTOConstant.StandardUpdatedAt
 
@@ -1,4 +1,4 @@
-from typing import Generic, List, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel
 
@@ -28,6 +28,7 @@ class Pagination(Generic[T]):
     last_page: int
     total_pages: int
     total_items: int
+    next_cursor: Optional[str]
     items: list[T]
 
     def __init__(
@@ -37,12 +38,14 @@ class Pagination(Generic[T]):
         total_items: int,
         per_page: int,
         page: int,
+        next_cursor: Optional[str] = None,
     ) -> None:
         self.items = items
         self.total_pages = total_pages
         self.total_items = total_items
         self.current_page = page
         self.last_page = (total_pages + per_page - 1) // per_page
+        self.next_cursor = next_cursor
 
 
 class BasePageModel(BaseModel):
@@ -50,6 +53,7 @@ class BasePageModel(BaseModel):
     last_page: int
     total_pages: int
     total_items: int
+    next_cursor: Optional[str] = None
 
 
 class PaginationUserWithRelationsDTO(BasePageModel):
@@ -65,3 +65,8 @@ class SapContractForResponseDTO(BaseModel):
     quan_t_left: DTOConstant.StandardNullablePriceField(
         description="Оставшийся остаток"
     )
+
+
+class SapContractCacheDTO(BaseModel):
+    fetched_at: float
+    contracts: List[SapContractForResponseDTO]
@@ -0,0 +1,59 @@
+from pydantic import BaseModel
+
+from app.shared.dto_constants import DTOConstant
+
+
+class SapOutboxDTO(BaseModel):
+    id: DTOConstant.StandardID()
+
+    class Config:
+        from_attributes = True
+
+
+class SapOutboxCDTO(BaseModel):
+    order_id: DTOConstant.StandardIntegerField()
+    sap_request_id: DTOConstant.StandardNullableIntegerField()
+    status: DTOConstant.StandardVarcharField()
+    attempts: DTOConstant.StandardIntegerField()
+    next_attempt_at: DTOConstant.StandardNullableDateTimeField()
+    last_error: DTOConstant.StandardNullableTextField()
+    sent_at: DTOConstant.StandardNullableDateTimeField()
+
+    class Config:
+        from_attributes = True
+
+
+class SapOutboxRDTO(SapOutboxDTO):
+    order_id: DTOConstant.StandardIntegerField()
+    sap_request_id: DTOConstant.StandardNullableIntegerField()
+    status: DTOConstant.StandardVarcharField()
+    attempts: DTOConstant.StandardIntegerField()
+    next_attempt_at: DTOConstant.StandardNullableDateTimeField()
+    last_error: DTOConstant.StandardNullableTextField()
+    sent_at: DTOConstant.StandardNullableDateTimeField()
+    created_at: DTOConstant.StandardCreatedAt
+    updated_at: DTOConstant.StandardUpdatedAt
+
+    class Config:
+        from_attributes = True
+
+
+class SapOrderStatusDTO(BaseModel):
+    """Состояние отправки заказа в SAP для клиента (опрос или подписка)."""
+
+    order_id: DTOConstant.StandardIntegerField()
+    order_status: DTOConstant.StandardNullableVarcharField(description="Статус заказа")
+    zakaz: DTOConstant.StandardNullableVarcharField(description="Номер заказа SAP")
+    sap_request_id: DTOConstant.StandardNullableIntegerField()
+    outbox_status: DTOConstant.StandardNullableVarcharField(
+        description="Статус отправки в SAP: pending, processing, sent, failed, review"
+    )
+    attempts: DTOConstant.StandardIntegerField()
+    next_attempt_at: DTOConstant.StandardNullableDateTimeField()
+    last_error: DTOConstant.StandardNullableTextField()
+    is_final: DTOConstant.StandardBooleanFalseField(
+        description="Отправка завершена, дальнейших изменений не будет"
+    )
+
+    class Config:
+        from_attributes = True
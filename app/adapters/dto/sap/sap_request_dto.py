@@ -23,7 +23,7 @@ class SapRequestCDTO(BaseModel):
     status: DTOConstant.StandardNullableVarcharField()
     zakaz: DTOConstant.StandardNullableVarcharField()
     text: DTOConstant.StandardNullableTextField()
-    pdf: DTOConstant.StandardNullableTextField()
+    file_id: DTOConstant.StandardNullableIntegerField()
     date: DTOConstant.StandardNullableDateField()
     time: DTOConstant.StandardNullableTimeField()
 
@@ -48,7 +48,7 @@ class SapRequestRDTO(SapRequestDTO):
     status: DTOConstant.StandardNullableVarcharField()
     zakaz: DTOConstant.StandardNullableVarcharField()
     text: DTOConstant.StandardNullableTextField()
-    pdf: DTOConstant.StandardNullableTextField()
+    file_id: DTOConstant.StandardNullableIntegerField()
     date: DTOConstant.StandardNullableDateField()
     time: DTOConstant.StandardNullableTimeField()
 
@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.shared.dto_constants import DTOConstant
+from app.shared.query_constants import AppQueryConstants
+
+
+class WorkshopScheduleCalendarFilterDTO(BaseModel):
+    workshop_sap_id: str = AppQueryConstants.StandardOptionalStringQuery(
+        description="SAP ID цеха"
+    )
+    date_from: Optional[date] = AppQueryConstants.StandardOptionalDateQuery(
+        description="Начало периода (по умолчанию первый доступный для записи день)"
+    )
+    date_to: Optional[date] = AppQueryConstants.StandardOptionalDateQuery(
+        description="Конец периода (по умолчанию последний доступный для записи день)"
+    )
+
+    class Config:
+        from_attributes = True
+
+
+class WorkshopScheduleCalendarSlotDTO(BaseModel):
+    start_at: DTOConstant.StandardTimeField(description="Начало бронирования")
+    end_at: DTOConstant.StandardTimeField(description="Конец бронирования")
+    free_space: DTOConstant.StandardIntegerField(description="Свободных мест")
+
+
+class WorkshopScheduleCalendarDTO(BaseModel):
+    workshop_schedule_id: DTOConstant.StandardNullableIntegerField(
+        description="Идентификатор расписания цеха"
+    )
+    date_from: DTOConstant.StandardDateField(description="Начало периода")
+    date_to: DTOConstant.StandardDateField(description="Конец периода")
+    days: Dict[date, List[WorkshopScheduleCalendarSlotDTO]] = {}
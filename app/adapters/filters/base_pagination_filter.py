@@ -4,6 +4,8 @@ from typing import Any, Generic, List, Optional, TypeVar
 from sqlalchemy import or_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
+from app.infrastructure.search_registry import search_registry
+
 T = TypeVar("T")
 
 
@@ -16,6 +18,7 @@ class BasePaginationFilter(Generic[T], ABC):
         search: Optional[str] = None,
         order_by: Optional[str] = None,
         order_direction: str = "asc",
+        cursor: Optional[str] = None,
     ) -> None:
         self.model = model
         self.per_page = per_page
@@ -23,10 +26,19 @@ class BasePaginationFilter(Generic[T], ABC):
         self.search = search
         self.order_by = order_by
         self.order_direction = order_direction
+        self.cursor = cursor
 
-    @abstractmethod
-    def get_search_filters(self) -> Optional[List[str]]:
-        pass
+    def get_search_condition(self) -> Optional[Any]:
+        """Условие строкового поиска по индексу из реестра поиска."""
+        if not self.search:
+            return None
+        return search_registry.condition(self.model, self.search)
+
+    def get_search_relevance(self) -> Optional[Any]:
+        """Релевантность для сортировки результатов поиска."""
+        if not self.search:
+            return None
+        return search_registry.relevance(self.model, self.search)
 
     @abstractmethod
     def apply(self) -> List[SQLAlchemyQuery]:
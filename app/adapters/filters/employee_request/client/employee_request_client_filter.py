@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
@@ -20,6 +20,7 @@ class EmployeeRequestClientFilter(BasePaginationFilter[EmployeeRequestModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         status: bool = AppQueryConstants.StandardOptionalIntegerQuery(
             description="Статус ответа 1 - Положительный, 0 - ожидание, -1 - Отказ"
         ),
@@ -29,38 +30,17 @@ class EmployeeRequestClientFilter(BasePaginationFilter[EmployeeRequestModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
         self.status = status
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "employee_name",
-            "employee_email",
-            "employee_sid",
-            "organization_full_name",
-            "organization_bin",
-            "owner_name",
-            "owner_sid",
-        ]
-
     def apply(self, user: UserWithRelationsDTO) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.status:
             filters.append(and_(self.model.status == self.status))
         if user.user_type.value == AppDbValueConstants.LEGAL_VALUE:
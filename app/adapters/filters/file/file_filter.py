@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from fastapi import Depends
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
@@ -19,6 +19,7 @@ class FileFilter(BasePaginationFilter[FileModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         file_size_more_than_byte: Optional[
             int
         ] = AppQueryConstants.StandardOptionalIntegerQuery(
@@ -30,34 +31,17 @@ class FileFilter(BasePaginationFilter[FileModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
         self.file_size_more_than_byte = file_size_more_than_byte
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "filename",
-            "file_path",
-            "content_type",
-        ]
-
     def apply(self) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.file_size_more_than_byte:
             filters.append(and_(self.model.file_size >= self.file_size_more_than_byte))
         return filters
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
@@ -19,6 +19,7 @@ class OrderClientFilter(BasePaginationFilter[OrderModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         status_values: Optional[List[str]] = AppQueryConstants.StandardOptionalStringArrayQuery(),
         status_ids: Optional[List[int]] = AppQueryConstants.StandardOptionalIntegerArrayQuery(),
         factory_ids: Optional[List[int]] = AppQueryConstants.StandardOptionalIntegerArrayQuery(),
@@ -39,6 +40,7 @@ class OrderClientFilter(BasePaginationFilter[OrderModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
@@ -57,30 +59,6 @@ class OrderClientFilter(BasePaginationFilter[OrderModel]):
         self.is_paid = is_paid
         self.is_cancel = is_cancel
 
-    def get_search_filters(self) -> List[str]:
-        return [
-            "status",
-            "factory_sap_id",
-            "workshop_sap_id",
-            "material_sap_id",
-            "zakaz",
-            "txn_id",
-            "iin",
-            "owner_sid",
-            "owner_username",
-            "owner_email",
-            "owner_mobile",
-            "name",
-            "adr_index",
-            "adr_city",
-            "adr_str",
-            "adr_dom",
-            "bin",
-            "dogovor",
-            "canceled_by_sid",
-            "checked_payment_by",
-        ]
-
     def apply(self, user: UserWithRelationsDTO) -> List[SQLAlchemyQuery]:
         filters = [
             or_(
@@ -90,21 +68,9 @@ class OrderClientFilter(BasePaginationFilter[OrderModel]):
             )
         ]
 
-        # Поиск по строке
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            model_columns = {column.key for column in inspect(self.model).columns}
-            valid_fields = [
-                field for field in self.get_search_filters() if field in model_columns
-            ]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
 
         # Автоматическая генерация фильтров
         conditions = [
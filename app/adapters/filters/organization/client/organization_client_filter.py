@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
@@ -18,6 +18,7 @@ class OrganizationClientFilter(BasePaginationFilter[OrganizationModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         type_ids: Optional[
             list[int]
         ] = AppQueryConstants.StandardOptionalIntegerArrayQuery(
@@ -35,6 +36,7 @@ class OrganizationClientFilter(BasePaginationFilter[OrganizationModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
@@ -42,34 +44,11 @@ class OrganizationClientFilter(BasePaginationFilter[OrganizationModel]):
         self.status = status
         self.is_verified = is_verified
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "full_name",
-            "short_name",
-            "bin",
-            "bik",
-            "kbe",
-            "email",
-            "phone",
-            "address",
-        ]
-
     def apply(self, client_id: int) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         filters.append(and_(self.model.owner_id == client_id))
         if self.type_ids:
             filters.append(and_(self.model.type_id.in_(self.type_ids)))
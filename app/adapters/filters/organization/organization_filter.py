@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
@@ -18,6 +18,7 @@ class OrganizationFilter(BasePaginationFilter[OrganizationModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         owner_ids: Optional[
             list[int]
         ] = AppQueryConstants.StandardOptionalIntegerArrayQuery(
@@ -40,6 +41,7 @@ class OrganizationFilter(BasePaginationFilter[OrganizationModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
@@ -48,34 +50,11 @@ class OrganizationFilter(BasePaginationFilter[OrganizationModel]):
         self.status = status
         self.is_verified = is_verified
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "full_name",
-            "short_name",
-            "bin",
-            "bik",
-            "kbe",
-            "email",
-            "phone",
-            "address",
-        ]
-
     def apply(self) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.owner_ids:
             filters.append(and_(self.model.owner_id.in_(self.owner_ids)))
         if self.type_ids:
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
@@ -20,6 +20,7 @@ class OrganizationEmployeeClientFilter(BasePaginationFilter[OrganizationEmployee
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         employee_ids: Optional[
             list[int]
         ] = AppQueryConstants.StandardOptionalIntegerArrayQuery(
@@ -41,6 +42,7 @@ class OrganizationEmployeeClientFilter(BasePaginationFilter[OrganizationEmployee
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
@@ -48,28 +50,11 @@ class OrganizationEmployeeClientFilter(BasePaginationFilter[OrganizationEmployee
         self.organization_ids = organization_ids
         self.request_ids = request_ids
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "bin",
-            "sid",
-        ]
-
     def apply(self, user: UserWithRelationsDTO) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if user.user_type.value == AppDbValueConstants.LEGAL_VALUE:
             organization_ids = [org.id for org in user.organizations]
             filters.append(and_(self.model.organization_id.in_(organization_ids)))
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from fastapi import Depends
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
@@ -19,6 +19,7 @@ class UserFilter(BasePaginationFilter[UserModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         role_ids: Optional[
             list[int]
         ] = AppQueryConstants.StandardOptionalIntegerArrayQuery(
@@ -35,41 +36,18 @@ class UserFilter(BasePaginationFilter[UserModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
         self.role_ids = role_ids
         self.type_ids = type_ids
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "sid",
-            "iin",
-            "name",
-            "given_name",
-            "family_name",
-            "preferred_username",
-            "email",
-            "phone",
-            "tabn",
-        ]
-
     def apply(self) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.role_ids:
             filters.append(and_(self.model.role_id.in_(self.role_ids)))
         if self.type_ids:
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
@@ -20,6 +20,7 @@ class VehicleClientFilter(BasePaginationFilter[VehicleModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         category_ids: Optional[
             list[int]
         ] = AppQueryConstants.StandardOptionalIntegerArrayQuery(
@@ -47,6 +48,7 @@ class VehicleClientFilter(BasePaginationFilter[VehicleModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
@@ -56,31 +58,13 @@ class VehicleClientFilter(BasePaginationFilter[VehicleModel]):
         self.organization_ids = organization_ids
         self.is_trailer = is_trailer
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "registration_number",
-            "car_model",
-            "vehicle_info",
-        ]
-
     def apply(
         self, user: UserWithRelationsDTO, check_verified: bool = False
     ) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.category_ids:
             filters.append(and_(self.model.category_id.in_(self.category_ids)))
         if self.colors_ids:
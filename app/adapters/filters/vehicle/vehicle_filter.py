@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_, select
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
@@ -18,6 +18,7 @@ class VehicleFilter(BasePaginationFilter[VehicleModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         category_ids: Optional[
             list[int]
         ] = AppQueryConstants.StandardOptionalIntegerArrayQuery(
@@ -49,6 +50,7 @@ class VehicleFilter(BasePaginationFilter[VehicleModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
@@ -60,29 +62,11 @@ class VehicleFilter(BasePaginationFilter[VehicleModel]):
         self.owner_iin = owner_iin
         self.organization_bin = organization_bin
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "registration_number",
-            "car_model",
-            "vehicle_info",
-        ]
-
     def apply(self) -> List[SQLAlchemyQuery]:
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.category_ids:
             filters.append(and_(self.model.category_id.in_(self.category_ids)))
         if self.colors_ids:
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
@@ -19,6 +19,7 @@ class VerifiedVehicleFilter(BasePaginationFilter[VerifiedVehicleModel]):
         ),
         order_by: Optional[str] = AppQueryConstants.StandardSortFieldQuery(),
         order_direction: Optional[str] = AppQueryConstants.StandardSortDirectionQuery(),
+        cursor: Optional[str] = AppQueryConstants.StandardOptionalCursorQuery(),
         is_active: bool = AppQueryConstants.StandardOptionalBooleanQuery(
             description="Активно"
         ),
@@ -28,37 +29,18 @@ class VerifiedVehicleFilter(BasePaginationFilter[VerifiedVehicleModel]):
             search=search,
             order_by=order_by,
             order_direction=order_direction,
+            cursor=cursor,
             page=page,
             per_page=per_page,
         )
         self.is_active = is_active
 
-    def get_search_filters(self) -> Optional[List[str]]:
-        return [
-            "car_number",
-            "verified_by",
-            "verified_by_sid",
-            "description",
-            "response",
-        ]
-
     def apply(self) -> List[SQLAlchemyQuery]:
         now = datetime.now()
         filters = []
+        # Поиск по строке (индексированный поисковый документ)
         if self.search:
-            # Проверяем существование полей в модели
-            model_columns = {column.key for column in inspect(self.model).columns}
-            search_fields = self.get_search_filters()
-            valid_fields = [field for field in search_fields if field in model_columns]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).like(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
+            filters.append(self.get_search_condition())
         if self.is_active is not None:
             filters.append(
                 and_(self.model.is_verified == True, self.model.will_act_at > now)
@@ -1,15 +1,30 @@
 from typing import Any, Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import and_, asc, desc, func, or_, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query
 
 from app.adapters.dto.pagination_dto import Pagination
+from app.adapters.repositories.pagination_cursor import PaginationCursor
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.config import app_config
+from app.infrastructure.unit_of_work import is_commit_deferred
 
 T = TypeVar("T")
+D = TypeVar("D", bound=BaseModel)
+
+
+class LoadProfile:
+    """Именованные профили подгрузки связей репозитория."""
+
+    # Только связи, без которых не обойтись при чтении/записи строки
+    MINIMAL = "minimal"
+    # Связи для списков и пагинации
+    LIST = "list"
+    # Все связи карточки сущности (default_relationships)
+    DETAIL = "detail"
 
 
 class BaseRepository(Generic[T]):
@@ -27,6 +42,15 @@ class BaseRepository(Generic[T]):
         result = await self.db.execute(query)
         return result.scalars().first()
 
+    async def get_for_update(self, id: int) -> Optional[T]:
+        """
+        Получение объекта по ID с блокировкой строки (SELECT ... FOR UPDATE)
+        до конца текущей транзакции.
+        """
+        query = select(self.model).filter(self.model.id == id).with_for_update()
+        result = await self.db.execute(query)
+        return result.scalars().first()
+
     async def get_all(
         self,
         options: Optional[List[Any]] = None,
@@ -72,6 +96,18 @@ class BaseRepository(Generic[T]):
         result = await self.db.execute(query)
         return result.scalars().first()
 
+    async def get_first_projection(
+        self, dto: type[D], filters: List[Any]
+    ) -> Optional[D]:
+        """
+        Первая строка в виде DTO: выбираются только колонки, перечисленные
+        в полях DTO, без загрузки модели и ее связей.
+        """
+        columns = [getattr(self.model, field) for field in dto.model_fields]
+        result = await self.db.execute(select(*columns).filter(*filters).limit(1))
+        row = result.first()
+        return dto.model_validate(row._mapping) if row else None
+
     async def paginate(
         self,
         dto: BaseModel,
@@ -81,29 +117,75 @@ class BaseRepository(Generic[T]):
         options: Optional[List[Any]] = None,
         order_by: Optional[str] = None,
         order_direction: str = "asc",
+        cursor: Optional[str] = None,
+        relevance: Optional[Any] = None,
     ) -> Pagination:
-        """Пагинация объектов с фильтрацией и сортировкой."""
+        """
+        Пагинация объектов с фильтрацией и сортировкой.
+
+        Без `cursor` — обычный OFFSET и COUNT(*). В ответе всегда есть
+        `next_cursor`: с ним следующая страница выбирается по ключу
+        (поле сортировки + id) без OFFSET, а общее количество берется из
+        курсора, поэтому глубокие страницы стоят столько же, сколько первая.
+
+        `relevance` — выражение релевантности строкового поиска: результаты
+        сортируются по нему в первую очередь, курсор в этом режиме не выдается.
+        """
+        order_by = order_by or "id"
+        order_direction = "desc" if order_direction.lower() == "desc" else "asc"
+        sort_column = getattr(self.model, order_by)
+
         query = select(self.model)
         if filters:
             query = query.filter(*filters)
         if options:
             query = query.options(*options)
 
-        if order_by:
-            query = self._apply_order_by(query, order_by, order_direction)
-
-        # Подсчёт общего количества элементов
-        total_items = await self.db.scalar(
-            select(func.count()).select_from(query.subquery())
-        )
+        if cursor and relevance is not None:
+            raise AppExceptionResponse.bad_request(
+                message="Курсор пагинации не поддерживается вместе с поиском"
+            )
+        if cursor:
+            state = PaginationCursor.decode(cursor, column=sort_column)
+            if (state.order_by, state.order_direction) != (order_by, order_direction):
+                raise AppExceptionResponse.bad_request(
+                    message="Курсор пагинации не соответствует сортировке"
+                )
+            page = state.page + 1
+            total_items = state.total_items
+            query = query.filter(
+                self._keyset_filter(sort_column, order_direction, state)
+            )
+        else:
+            # Подсчёт общего количества элементов
+            total_items = await self.db.scalar(
+                select(func.count()).select_from(query.subquery())
+            )
+            query = query.offset((page - 1) * per_page)
         total_pages = (total_items + per_page - 1) // per_page
 
-        # Элементы текущей страницы
-        results = await self.db.execute(
-            query.limit(per_page).offset((page - 1) * per_page)
+        # Элементы текущей страницы (id — для однозначного порядка)
+        if relevance is not None:
+            query = query.order_by(desc(relevance))
+        query = self._apply_order_by(query, order_by, order_direction)
+        query = query.order_by(
+            desc(self.model.id) if order_direction == "desc" else asc(self.model.id)
         )
+        results = await self.db.execute(query.limit(per_page))
         items = results.scalars().all()
 
+        next_cursor = None
+        if relevance is None and len(items) == per_page and page < total_pages:
+            last = items[-1]
+            next_cursor = PaginationCursor(
+                order_by=order_by,
+                order_direction=order_direction,
+                last_value=getattr(last, order_by),
+                last_id=last.id,
+                page=page,
+                total_items=total_items,
+            ).encode()
+
         # Преобразование в DTO
         dto_items = [dto.from_orm(item) for item in items]
         return Pagination(
@@ -112,56 +194,131 @@ class BaseRepository(Generic[T]):
             page=page,
             total_pages=total_pages,
             total_items=total_items,
+            next_cursor=next_cursor,
         )
 
-    async def create(self, obj: T) -> T:
-        """Создание объекта."""
+    async def create(self, obj: T, options: Optional[List[Any]] = None) -> T:
+        """
+        Создание объекта.
+
+        id и серверные значения по умолчанию возвращаются тем же
+        INSERT ... RETURNING (eager_defaults), поэтому отдельный refresh
+        не нужен. `options` — связи, подгружаемые в возвращаемый объект.
+        """
         try:
             self.db.add(obj)
-            await self.db.commit()
-            await self.db.refresh(obj)
-            return obj
+            await self.db.flush()
+            await self._commit()
         except IntegrityError as e:
-            await self.db.rollback()
+            await self._rollback()
             raise ValueError(self._parse_integrity_error(e))
+        return await self._load_options(obj, options)
 
-    async def update(self, obj: T, dto: BaseModel) -> T:
+    async def update(
+        self, obj: T, dto: BaseModel, options: Optional[List[Any]] = None
+    ) -> T:
         """Обновление объекта."""
         try:
             # Обновляем только те поля, которые заданы в DTO
             for field, value in dto.dict(exclude_unset=True).items():
                 if hasattr(obj, field):
                     setattr(obj, field, value)
-            await self.db.commit()
-            await self.db.refresh(obj)
-            return obj
+            await self.db.flush()
+            await self._commit()
         except IntegrityError as e:
-            await self.db.rollback()
+            await self._rollback()
             raise ValueError(self._parse_integrity_error(e))
+        return await self._load_options(obj, options)
 
     async def delete(self, id: int) -> bool:
-        """Удаление объекта."""
-        obj = await self.get(id)
+        """
+        Удаление объекта. Удаление идет через ORM, чтобы сработали каскады
+        связей; объект берется из identity map, если он уже загружен.
+        """
+        obj = await self.db.get(self.model, id)
         if not obj:
             raise AppExceptionResponse.not_found(message="Не найдено")
         await self.db.delete(obj)
-        await self.db.commit()
-        # Проверяем, что объект больше не существует
-        deleted_obj = await self.get(id)
-        return deleted_obj is None
+        await self.db.flush()
+        await self._commit()
+        return True
+
+    async def _commit(self) -> None:
+        """Commit, если use case не работает в режиме отложенного commit."""
+        if not is_commit_deferred(self.db):
+            await self.db.commit()
+
+    async def _rollback(self) -> None:
+        """
+        Откат после ошибки записи. В единице работы откатом (всей транзакции
+        или SAVEPOINT) управляет владелец блока.
+        """
+        if not is_commit_deferred(self.db):
+            await self.db.rollback()
+
+    async def _load_options(self, obj: T, options: Optional[List[Any]]) -> T:
+        """Подгружает связи в только что записанный объект одним запросом."""
+        if not options:
+            return obj
+        query = (
+            select(self.model)
+            .filter(self.model.id == obj.id)
+            .options(*options)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        return result.scalars().first()
 
     def _parse_integrity_error(self, error: IntegrityError) -> str:
         """Парсинг ошибок уникальности."""
         orig_msg = str(error.orig)
         return f"IntegrityError: {orig_msg.split(':')[-1].strip()}"
 
+    def _keyset_filter(
+        self, sort_column: Any, order_direction: str, state: PaginationCursor
+    ) -> Any:
+        """
+        Условие «после последнего элемента» для сортировки (поле, id).
+        Порядок NULL задает `_apply_order_by`: в конце при ASC, в начале при DESC.
+        """
+        value, last_id = state.last_value, state.last_id
+        if order_direction == "desc":
+            if value is None:
+                return or_(
+                    sort_column.is_not(None),
+                    and_(sort_column.is_(None), self.model.id < last_id),
+                )
+            return or_(
+                sort_column < value,
+                and_(sort_column == value, self.model.id < last_id),
+            )
+        if value is None:
+            return and_(sort_column.is_(None), self.model.id > last_id)
+        return or_(
+            sort_column > value,
+            sort_column.is_(None),
+            and_(sort_column == value, self.model.id > last_id),
+        )
+
     def _apply_order_by(
         self, query: Query, order_by: str, order_direction: str
     ) -> Query:
-        """Применяет сортировку к запросу."""
-        if order_direction.lower() == "desc":
-            return query.order_by(desc(getattr(self.model, order_by)))
-        return query.order_by(asc(getattr(self.model, order_by)))
+        """
+        Применяет сортировку к запросу. NULL — в конце при ASC и в начале
+        при DESC на любой СУБД (на этом порядке строится `_keyset_filter`):
+        в PostgreSQL это порядок по умолчанию, MySQL сортирует NULL как
+        наименьшее значение, поэтому там порядок задается через `IS NULL`.
+        """
+        column = getattr(self.model, order_by)
+        is_desc = order_direction.lower() == "desc"
+        if app_config.app_database.lower() == "mysql":
+            is_null = column.is_(None)
+            if is_desc:
+                return query.order_by(desc(is_null), desc(column))
+            return query.order_by(asc(is_null), asc(column))
+        if is_desc:
+            return query.order_by(desc(column).nulls_first())
+        return query.order_by(asc(column).nulls_last())
 
     def default_relationships(self) -> List[Any]:
         """
@@ -169,3 +326,19 @@ class BaseRepository(Generic[T]):
         Дети могут переопределить это или использовать как есть.
         """
         return []
+
+    def load_profile(self, profile: str) -> List[Any]:
+        """Опции подгрузки связей по имени профиля (см. LoadProfile)."""
+        if profile == LoadProfile.MINIMAL:
+            return self.minimal_relationships()
+        if profile == LoadProfile.LIST:
+            return self.list_relationships()
+        return self.default_relationships()
+
+    def minimal_relationships(self) -> List[Any]:
+        """Профиль MINIMAL: по умолчанию связи не подгружаются."""
+        return []
+
+    def list_relationships(self) -> List[Any]:
+        """Профиль LIST: по умолчанию совпадает с default_relationships."""
+        return self.default_relationships()
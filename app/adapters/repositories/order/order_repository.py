@@ -1,7 +1,7 @@
 from typing import Any, List
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.adapters.repositories.base_repository import BaseRepository
 from app.entities import OrderModel
@@ -28,3 +28,30 @@ class OrderRepository(BaseRepository[OrderModel]):
             selectinload(self.model.kaspi_payments),
             selectinload(self.model.schedules),
         ]
+
+    def minimal_relationships(self) -> List[Any]:
+        # Тем же запросом (JOIN): материал для вебхуков Kaspi и
+        # checked_payment_by, который читает OrderCDTO
+        return [
+            joinedload(self.model.material),
+            joinedload(self.model.checked_payment_by),
+        ]
+
+    def list_relationships(self) -> List[Any]:
+        # Связи «многие к одному» — JOIN в основном запросе,
+        # коллекции OrderWithRelationsDTO — по одному запросу на страницу
+        return [
+            joinedload(self.model.factory),
+            joinedload(self.model.workshop),
+            joinedload(self.model.material),
+            joinedload(self.model.sap),
+            joinedload(self.model.kaspi),
+            joinedload(self.model.owner),
+            joinedload(self.model.organization),
+            joinedload(self.model.canceled_by),
+            joinedload(self.model.checked_payment_by),
+            joinedload(self.model.payment_return),
+            joinedload(self.model.order_status),
+            selectinload(self.model.sap_requests),
+            selectinload(self.model.kaspi_payments),
+        ]
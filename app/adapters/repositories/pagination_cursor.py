@@ -0,0 +1,79 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Optional
+
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.app_exception_response import AppExceptionResponse
+
+
+@dataclass(frozen=True)
+class PaginationCursor:
+    """
+    Непрозрачный курсор keyset-пагинации: значение поля сортировки и id
+    последнего элемента страницы.
+
+    В курсоре также переносятся номер страницы и общее количество
+    элементов, посчитанное на первой странице, поэтому следующие страницы
+    не выполняют ни OFFSET, ни COUNT(*).
+    """
+
+    order_by: str
+    order_direction: str
+    last_value: Any
+    last_id: int
+    page: int
+    total_items: int
+
+    def encode(self) -> str:
+        payload = {
+            "o": self.order_by,
+            "d": self.order_direction,
+            "v": self.last_value,
+            "i": self.last_id,
+            "p": self.page,
+            "t": self.total_items,
+        }
+        raw = json.dumps(payload, separators=(",", ":"), default=str)
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, column: InstrumentedAttribute) -> "PaginationCursor":
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            return cls(
+                order_by=str(payload["o"]),
+                order_direction=str(payload["d"]),
+                last_value=cls._parse_value(payload["v"], column),
+                last_id=int(payload["i"]),
+                page=int(payload["p"]),
+                total_items=int(payload["t"]),
+            )
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise AppExceptionResponse.bad_request(
+                message="Некорректный курсор пагинации"
+            )
+
+    @staticmethod
+    def _parse_value(value: Any, column: InstrumentedAttribute) -> Any:
+        """Восстанавливает тип значения сортировки по типу колонки."""
+        if value is None:
+            return None
+        try:
+            python_type: Optional[type] = column.type.python_type
+        except NotImplementedError:
+            return value
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        if python_type is time:
+            return time.fromisoformat(value)
+        if python_type is Decimal:
+            return Decimal(value)
+        return value
@@ -0,0 +1,84 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repositories.base_repository import BaseRepository
+from app.entities import SapOutboxModel
+from app.shared.db_constants import AppDbValueConstants
+
+
+class SapOutboxRepository(BaseRepository[SapOutboxModel]):
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(SapOutboxModel, db)
+
+    def _is_due(self, now: datetime):
+        """Ожидающие записи с подошедшим сроком и записи с истекшей арендой."""
+        return (
+            self.model.status.in_(
+                [
+                    AppDbValueConstants.SAP_OUTBOX_PENDING_STATUS,
+                    AppDbValueConstants.SAP_OUTBOX_PROCESSING_STATUS,
+                ]
+            ),
+            or_(
+                self.model.next_attempt_at.is_(None),
+                self.model.next_attempt_at <= now,
+            ),
+        )
+
+    async def get_due_ids(self, now: datetime, limit: int) -> List[int]:
+        result = await self.db.execute(
+            select(self.model.id)
+            .filter(*self._is_due(now))
+            .order_by(self.model.next_attempt_at, self.model.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def claim(
+        self, id: int, now: datetime, lease_until: datetime
+    ) -> Optional[str]:
+        """
+        Захват записи воркером UPDATE'ом: из нескольких воркеров запись
+        получает только один, остальные видят rowcount 0.
+
+        Returns:
+            Статус до захвата: pending или processing (аренда предыдущего
+            воркера истекла до завершения); None, если запись не захвачена.
+        """
+        for status in (
+            AppDbValueConstants.SAP_OUTBOX_PENDING_STATUS,
+            AppDbValueConstants.SAP_OUTBOX_PROCESSING_STATUS,
+        ):
+            result = await self.db.execute(
+                update(self.model)
+                .where(
+                    self.model.id == id,
+                    self.model.status == status,
+                    *self._is_due(now),
+                )
+                .values(
+                    status=AppDbValueConstants.SAP_OUTBOX_PROCESSING_STATUS,
+                    attempts=self.model.attempts + 1,
+                    next_attempt_at=lease_until,
+                    updated_at=now,
+                )
+            )
+            if result.rowcount == 1:
+                await self._commit()
+                return status
+        await self._commit()
+        return None
+
+    async def get_latest_for_order(self, order_id: int) -> Optional[SapOutboxModel]:
+        result = await self.db.execute(
+            select(self.model)
+            .filter(self.model.order_id == order_id)
+            .order_by(self.model.id.desc())
+            .limit(1)
+            # Статус меняется UPDATE'ами воркера мимо identity map
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().first()
@@ -1,5 +1,7 @@
-from typing import Any, List
+from datetime import datetime
+from typing import Any, Dict, List
 
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -25,3 +27,46 @@ class ScheduleRepository(BaseRepository[ScheduleModel]):
             selectinload(self.model.canceled_by_user),
             selectinload(self.model.histories),
         ]
+
+    async def get_slot_occupancy(
+        self, workshop_schedule_id: int, date_start: datetime, date_end: datetime
+    ) -> Dict[datetime, int]:
+        """
+        Количество активных бронирований по началу слота одним GROUP BY запросом.
+        """
+        query = (
+            select(self.model.start_at, func.count(self.model.id))
+            .filter(
+                self.model.workshop_schedule_id == workshop_schedule_id,
+                self.model.is_active.is_(True),
+                self.model.is_canceled.is_(False),
+                self.model.start_at >= date_start,
+                self.model.start_at <= date_end,
+            )
+            .group_by(self.model.start_at)
+        )
+        result = await self.db.execute(query)
+        return {start_at: count for start_at, count in result.all()}
+
+    async def count_slot_bookings(
+        self, workshop_schedule_id: int, start_at: datetime
+    ) -> int:
+        """
+        Количество активных бронирований одного слота.
+
+        Чтение блокирующее (FOR UPDATE): на MySQL (REPEATABLE READ) обычный
+        SELECT видит снимок начала транзакции, а не брони, зафиксированные
+        после получения блокировки расписания цеха.
+        """
+        query = (
+            select(self.model.id)
+            .filter(
+                self.model.workshop_schedule_id == workshop_schedule_id,
+                self.model.is_active.is_(True),
+                self.model.is_canceled.is_(False),
+                self.model.start_at == start_at,
+            )
+            .with_for_update()
+        )
+        result = await self.db.execute(query)
+        return len(result.all())
@@ -4,6 +4,7 @@ from app.adapters.api.factory.factory_api import FactoryApi
 from app.adapters.api.file.file_api import FileApi
 from app.adapters.api.kaspi.kaspi_payment_api import KaspiPaymentApi
 from app.adapters.api.material.material_api import MaterialApi
+from app.adapters.api.monitoring.monitoring_api import MonitoringApi
 from app.adapters.api.operation.operation_api import OperationApi
 from app.adapters.api.order.order_api import OrderApi
 from app.adapters.api.order_status.order_status_api import OrderStatusApi
@@ -151,6 +152,11 @@ def include_routers(app) -> None:
         prefix=f"/{AppPathConstants.AuthPathName}",
         tags=[AppPathConstants.AuthTagName],
     )
+    app.include_router(
+        MonitoringApi().router,
+        prefix=f"/{AppPathConstants.MonitoringPathName}",
+        tags=[AppPathConstants.MonitoringTagName],
+    )
     app.include_router(
         TestApi().router,
         prefix=f"/{AppPathConstants.TestPathName}",
@@ -1,8 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from http.client import HTTPException
-from typing import Callable, Dict, List
+from typing import Callable, Dict, FrozenSet, List, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -51,45 +52,69 @@ def create_refresh_token(data: int) -> str:
 
 
 # === Получение текущего пользователя ===
-async def get_current_user(
-    token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-) -> UserWithRelationsDTO:
+@dataclass(frozen=True)
+class AuthPrincipal:
+    """
+    Авторизованный пользователь запроса с заранее вычисленными наборами
+    ролей и типов, чтобы проверка доступа сводилась к поиску во множестве.
+    """
+
+    user: UserWithRelationsDTO
+    roles: FrozenSet[str]
+    user_types: FrozenSet[str]
+
+    @classmethod
+    def from_user(cls, user: UserWithRelationsDTO) -> "AuthPrincipal":
+        is_keycloak = app_config.is_keycloak_auth()
+
+        def values(item) -> FrozenSet[str]:
+            if item is None:
+                return frozenset()
+            return frozenset([item.keycloak_value if is_keycloak else item.value])
+
+        return cls(
+            user=user, roles=values(user.role), user_types=values(user.user_type)
+        )
+
+
+async def get_current_principal(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> AuthPrincipal:
+    """
+    Проверка токена и загрузка пользователя выполняются один раз за запрос:
+    результат сохраняется в `request.state.principal`.
+    """
+    principal: Optional[AuthPrincipal] = getattr(request.state, "principal", None)
+    if principal is not None:
+        return principal
     use_case = GetCurrentUserCase(db)
     user = await use_case.execute(token)
     if not user:
         raise AppExceptionResponse.unauthorized(message="Не авторизован")
-    return user
+    principal = AuthPrincipal.from_user(user)
+    request.state.principal = principal
+    return principal
+
+
+async def get_current_user(
+    principal: AuthPrincipal = Depends(get_current_principal),
+) -> UserWithRelationsDTO:
+    return principal.user
 
 
 def role_and_type_checker(
     required_roles: List[str], required_user_type: str = None
 ) -> Callable:
-    def checker(current_user: UserWithRelationsDTO = Depends(get_current_user)):
-        if app_config.is_keycloak_auth():
-            if current_user.role.keycloak_value not in required_roles:
-                raise AppExceptionResponse.forbidden(
-                    detail="Отказано в доступе",
-                )
-            if (
-                required_user_type
-                and current_user.user_type.keycloak_value != required_user_type
-            ):
-                raise AppExceptionResponse.forbidden(
-                    detail="Отказано в доступе",
-                )
-        else:
-            if current_user.role.value not in required_roles:
-                raise AppExceptionResponse.forbidden(
-                    detail="Отказано в доступе",
-                )
-            if (
-                required_user_type
-                and current_user.user_type.value != required_user_type
-            ):
-                raise AppExceptionResponse.forbidden(
-                    detail="Отказано в доступе",
-                )
-        return current_user
+    allowed_roles = frozenset(required_roles)
+
+    def checker(principal: AuthPrincipal = Depends(get_current_principal)):
+        if allowed_roles.isdisjoint(principal.roles):
+            raise AppExceptionResponse.forbidden(message="Отказано в доступе")
+        if required_user_type and required_user_type not in principal.user_types:
+            raise AppExceptionResponse.forbidden(message="Отказано в доступе")
+        return principal.user
 
     return checker
 
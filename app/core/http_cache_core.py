@@ -0,0 +1,104 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from starlette import status
+from starlette.responses import FileResponse
+
+# Год кеширования: URL содержит хеш содержимого и никогда не меняет смысл
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Кешировать можно, но перед использованием сверить ETag с сервером
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+PRIVATE_REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(content: bytes) -> str:
+    """Сильный ETag по содержимому ответа."""
+    return f'"{hashlib.sha1(content).hexdigest()}"'
+
+
+def content_etag(content_hash: str, suffix: Optional[str] = None) -> str:
+    """Сильный ETag по уже посчитанному хешу (FileModel.content_hash)."""
+    return f'"{content_hash}-{suffix}"' if suffix else f'"{content_hash}"'
+
+
+def format_http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Проверяет заголовок If-None-Match (список тегов, `*`, слабые теги W/)."""
+    if_none_match: Optional[str] = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates
+
+
+def is_fresh(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    Условный запрос по заголовкам ответа: If-None-Match сверяется с ETag,
+    If-Modified-Since учитывается только без If-None-Match (RFC 9110).
+    """
+    if request.headers.get("if-none-match"):
+        return "ETag" in headers and is_not_modified(request, headers["ETag"])
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or "Last-Modified" not in headers:
+        return False
+    try:
+        return parsedate_to_datetime(headers["Last-Modified"]) <= (
+            parsedate_to_datetime(if_modified_since)
+        )
+    except (TypeError, ValueError):
+        return False
+
+
+def requested_range(request: Request, etag: Optional[str]) -> Optional[str]:
+    """
+    Заголовок Range, если он применим: при If-Range с другим ETag
+    (содержимое изменилось) отдается весь файл.
+    """
+    http_range = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if http_range and if_range and if_range != etag:
+        return None
+    return http_range
+
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+class CachedFileResponse(FileResponse):
+    """
+    FileResponse, у которого If-Range сверяется и с переданным ETag
+    (по хешу содержимого), а не только с ETag по mtime/размеру.
+    """
+
+    def _should_use_range(self, http_if_range: str, stat_result) -> bool:
+        if http_if_range == self.headers.get("etag"):
+            return True
+        return super()._should_use_range(http_if_range, stat_result)
+
+
+def etag_json_response(
+    request: Request,
+    payload: BaseModel,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """
+    JSON-ответ с ETag: если у клиента актуальная версия, отдается 304 без тела.
+    """
+    content = payload.model_dump_json().encode("utf-8")
+    etag = make_etag(content)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if is_not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -1,6 +1,22 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+import aiohttp
+from jose import jwt
+from jose.exceptions import JOSEError
 from keycloak import KeycloakOpenID
 
+from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.config import app_config
+from app.infrastructure.http_transport import (
+    HttpStatusError,
+    HttpUpstream,
+    http_transport,
+)
+
+logger = logging.getLogger(__name__)
 
 keycloak_openid = KeycloakOpenID(
     server_url=app_config.keycloak_server_url,
@@ -13,3 +29,189 @@ keycloak_openid = KeycloakOpenID(
 
 def get_openid_config():
     return keycloak_openid.well_known()
+
+
+def get_realm_url() -> str:
+    return (
+        f"{app_config.keycloak_server_url.rstrip('/')}"
+        f"/realms/{app_config.keycloak_realm}"
+    )
+
+
+class KeycloakTokenVerifier:
+    """
+    Локальная проверка подписи JWT Keycloak по закэшированному набору ключей (JWKS).
+
+    - Ключи загружаются при старте и обновляются в фоне раз в
+      `keycloak_jwks_refresh_sec`.
+    - Если в токене неизвестный `kid` (ротация ключей в Keycloak), ключи
+      перечитываются сразу, но не чаще `keycloak_jwks_min_refetch_sec`.
+    """
+
+    def __init__(self) -> None:
+        self._keys: Dict[str, dict] = {}
+        self._fetched_at: float = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def certs_url(self) -> str:
+        return f"{get_realm_url()}/protocol/openid-connect/certs"
+
+    async def start(self) -> None:
+        try:
+            await self.refresh_keys()
+        except Exception as e:
+            # Ключи подгрузятся при первом запросе или в фоне
+            logger.warning(f"Не удалось загрузить JWKS Keycloak при старте: {e}")
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        if self._refresh_task and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(app_config.keycloak_jwks_refresh_sec)
+            try:
+                await self.refresh_keys()
+            except Exception as e:
+                logger.warning(f"Фоновое обновление JWKS Keycloak не удалось: {e}")
+
+    async def refresh_keys(self) -> None:
+        response = await http_transport.get(
+            HttpUpstream.KEYCLOAK,
+            self.certs_url,
+            read_timeout=app_config.keycloak_read_timeout_sec,
+            verify_ssl=app_config.keycloak_verify_ssl,
+        )
+        response.raise_for_status()
+        keys = {
+            key["kid"]: key
+            for key in response.json().get("keys", [])
+            if key.get("kid") and key.get("use", "sig") == "sig"
+        }
+        self._keys = keys
+        self._fetched_at = time.monotonic()
+
+    async def _get_key(self, kid: str) -> Optional[dict]:
+        key = self._keys.get(kid)
+        if key is not None:
+            return key
+        async with self._lock:
+            key = self._keys.get(kid)
+            if key is not None:
+                return key
+            elapsed = time.monotonic() - self._fetched_at
+            if self._keys and elapsed < app_config.keycloak_jwks_min_refetch_sec:
+                return None
+            try:
+                await self.refresh_keys()
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.error(f"Не удалось загрузить JWKS Keycloak: {e}")
+                return None
+            return self._keys.get(kid)
+
+    async def verify(self, token: str) -> dict:
+        """
+        Проверяет подпись, срок действия, издателя (realm) и тип (access-токен),
+        возвращает claims.
+
+        Raises:
+            HTTPException: 401, если токен не прошел проверку.
+        """
+        try:
+            header = jwt.get_unverified_header(token)
+        except JOSEError as e:
+            raise AppExceptionResponse.unauthorized(
+                message=f"Не удалось проверить токен {e!s}"
+            )
+        key = await self._get_key(header.get("kid") or "")
+        if key is None:
+            raise AppExceptionResponse.unauthorized(
+                message="Не удалось проверить токен: неизвестный ключ подписи"
+            )
+        try:
+            claims = jwt.decode(
+                token,
+                key,
+                algorithms=[key.get("alg", "RS256")],
+                issuer=get_realm_url(),
+                options={"verify_aud": False, "verify_at_hash": False},
+            )
+        except JOSEError as e:
+            raise AppExceptionResponse.unauthorized(
+                message=f"Не удалось проверить токен {e!s}"
+            )
+        # ID- и refresh-токены подписаны тем же ключом realm
+        if claims.get("typ") != "Bearer":
+            raise AppExceptionResponse.unauthorized(
+                message="Не удалось проверить токен: ожидается access-токен"
+            )
+        return claims
+
+
+keycloak_token_verifier = KeycloakTokenVerifier()
+
+
+async def get_keycloak_userinfo(token: str) -> dict:
+    """
+    Асинхронный запрос userinfo через общий HTTP-транспорт.
+
+    Raises:
+        HTTPException: 401, если Keycloak не принял токен.
+        aiohttp.ClientError, asyncio.TimeoutError: Ошибка соединения с Keycloak.
+    """
+    try:
+        response = await http_transport.get(
+            HttpUpstream.KEYCLOAK,
+            f"{get_realm_url()}/protocol/openid-connect/userinfo",
+            headers={"Authorization": f"Bearer {token}"},
+            read_timeout=app_config.keycloak_read_timeout_sec,
+            verify_ssl=app_config.keycloak_verify_ssl,
+        )
+        response.raise_for_status()
+    except HttpStatusError as e:
+        if e.status == 401:
+            raise AppExceptionResponse.unauthorized(message="Токен не действителен")
+        raise
+    return response.json()
+
+
+async def request_keycloak_token(username: str, password: str) -> dict:
+    """
+    Получение токенов по логину и паролю (password grant) через общий
+    HTTP-транспорт: с таймаутом, ограничением параллельности и автоматом
+    отключения для Keycloak.
+
+    Raises:
+        HTTPException: 400, если Keycloak не принял логин или пароль.
+        aiohttp.ClientError, asyncio.TimeoutError: Ошибка соединения с Keycloak.
+    """
+    try:
+        response = await http_transport.post(
+            HttpUpstream.KEYCLOAK,
+            f"{get_realm_url()}/protocol/openid-connect/token",
+            data={
+                "grant_type": "password",
+                "client_id": app_config.keycloak_client_id,
+                "client_secret": app_config.keycloak_client_secret,
+                "username": username,
+                "password": password,
+            },
+            read_timeout=app_config.keycloak_read_timeout_sec,
+            verify_ssl=app_config.keycloak_verify_ssl,
+        )
+        response.raise_for_status()
+    except HttpStatusError as e:
+        # Keycloak отвечает 401 (invalid_grant) или 400 на неверные данные
+        if e.status in (400, 401):
+            raise AppExceptionResponse.bad_request(message="Неверные данные")
+        raise
+    return response.json()
@@ -102,6 +102,20 @@ def assign_roles(app) -> None:
         path=f"/{AppPathConstants.FilePathName}{AppPathConstants.GetByIdPathName}",
         roles=[AppRouteConstant.AdministratorTagName],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.FilePathName}{AppPathConstants.DownloadFilePathName}",
+        roles=[AppRouteConstant.AdministratorTagName],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.FilePathName}{AppPathConstants.GetFileVariantPathName}",
+        roles=[
+            AppRouteConstant.AdministratorTagName,
+            AppRouteConstant.ClientTagName,
+            AppRouteConstant.EmployeesTagName,
+        ],
+    )
     # Material
     assign_roles_to_route(
         app=app,
@@ -214,6 +228,20 @@ def assign_roles(app) -> None:
             AppRouteConstant.ClientTagName,
         ],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.OrderPathName}{AppPathConstants.GetClientOrderSapStatusPathName}",
+        roles=[
+            AppRouteConstant.ClientTagName,
+        ],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.OrderPathName}{AppPathConstants.StreamClientOrderSapStatusPathName}",
+        roles=[
+            AppRouteConstant.ClientTagName,
+        ],
+    )
     # Schedule
     assign_roles_to_route(
         app=app,
@@ -252,6 +280,20 @@ def assign_roles(app) -> None:
             AppRouteConstant.ClientTagName,
         ],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.SapRequestPathName}{AppPathConstants.GetClientSapRequestPdfPathName}",
+        roles=[
+            AppRouteConstant.ClientTagName,
+        ],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.SapRequestPathName}{AppPathConstants.GetClientCompanyContractsPathName}",
+        roles=[
+            AppRouteConstant.ClientTagName,
+        ],
+    )
     # Order Status
     assign_roles_to_route(
         app=app,
@@ -792,3 +834,28 @@ def assign_roles(app) -> None:
             AppRouteConstant.EmployeesTagName,
         ],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.WorkshopSchedulePathName}{AppPathConstants.GetWorkshopScheduleCalendarPathName}",
+        roles=[
+            AppRouteConstant.AdministratorTagName,
+            AppRouteConstant.ClientTagName,
+            AppRouteConstant.EmployeesTagName,
+        ],
+    )
+    # Monitoring
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.MonitoringPathName}{AppPathConstants.HttpPoolsPathName}",
+        roles=[AppRouteConstant.AdministratorTagName],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.MonitoringPathName}{AppPathConstants.HealthPathName}",
+        roles=[AppRouteConstant.AdministratorTagName],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"/{AppPathConstants.MonitoringPathName}{AppPathConstants.SapContractCachePathName}",
+        roles=[AppRouteConstant.AdministratorTagName],
+    )
@@ -0,0 +1,132 @@
+import asyncio
+import gzip
+import logging
+import mimetypes
+import os
+import stat
+from typing import Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.core.http_cache_core import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    CachedFileResponse,
+)
+
+logger = logging.getLogger(__name__)
+
+# Текстовые ресурсы, для которых ищутся заранее сжатые копии
+COMPRESSIBLE_EXTENSIONS = {".css", ".js", ".svg", ".json", ".map", ".txt"}
+# Кодировка -> суффикс файла; brotli предпочтительнее gzip
+PRECOMPRESSED_ENCODINGS: Tuple[Tuple[str, str], ...] = (("br", ".br"), ("gzip", ".gz"))
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    Раздача static/ с кешированием в браузерах и прокси.
+
+    - Пути с префиксом из `immutable_prefixes` (хранилище по хешу
+      содержимого) отдаются с `immutable` на год: новый файл получает
+      новый URL.
+    - Остальные файлы кешируются с обязательной перепроверкой ETag,
+      который Starlette считает по mtime и размеру.
+    - Для css/js рядом ищутся `.br`/`.gz` копии (см.
+      precompress_static_assets) и отдаются клиентам, принимающим сжатие.
+    """
+
+    def __init__(self, *args, immutable_prefixes: Iterable[str] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable_prefixes = tuple(
+            prefix.strip("/") + "/" for prefix in immutable_prefixes
+        )
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await self._precompressed_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        if response.status_code in (200, 206, 304):
+            response.headers["Cache-Control"] = self._cache_control(path)
+            if self._is_compressible(path):
+                response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _cache_control(self, path: str) -> str:
+        normalized = path.replace(os.sep, "/").lstrip("/")
+        if normalized.startswith(self.immutable_prefixes):
+            return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+    @staticmethod
+    def _is_compressible(path: str) -> bool:
+        return os.path.splitext(path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+
+    async def _precompressed_response(
+        self, path: str, scope: Scope
+    ) -> Optional[Response]:
+        if scope["method"] not in ("GET", "HEAD") or not self._is_compressible(path):
+            return None
+        request_headers = Headers(scope=scope)
+        accepted = {
+            value.split(";")[0].strip().lower()
+            for value in request_headers.get("accept-encoding", "").split(",")
+        }
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            full_path, stat_result = await asyncio.to_thread(
+                self.lookup_path, path + suffix
+            )
+            if not stat_result or not stat.S_ISREG(stat_result.st_mode):
+                continue
+            response = CachedFileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=mimetypes.guess_type(path)[0],
+                headers={"Content-Encoding": encoding},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return None
+
+
+def precompress_static_assets(directory: str, skip: Iterable[str] = ()) -> int:
+    """
+    Создает `.gz` рядом с css/js, если копии нет или она старше исходника.
+    `.br` stdlib не умеет: их кладет сборка, и они будут отданы при наличии.
+
+    Returns:
+        int: Количество созданных копий.
+    """
+    skipped = {os.path.normpath(os.path.join(directory, path)) for path in skip}
+    created = 0
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) not in skipped]
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS:
+                continue
+            source = os.path.join(root, name)
+            target = f"{source}.gz"
+            if os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(
+                source
+            ):
+                continue
+            with open(source, "rb") as f:
+                content = gzip.compress(f.read(), compresslevel=9, mtime=0)
+            with open(target, "wb") as f:
+                f.write(content)
+            created += 1
+    return created
+
+
+async def precompress_static(directory: str, skip: Iterable[str] = ()) -> None:
+    try:
+        created = await asyncio.to_thread(precompress_static_assets, directory, skip)
+        if created:
+            logger.info(f"Сжато статических файлов: {created}")
+    except OSError as e:
+        logger.warning(f"Не удалось подготовить сжатые копии статики: {e}")
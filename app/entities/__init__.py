@@ -15,6 +15,7 @@ from .organization_type import OrganizationTypeModel
 from .payment_document import PaymentDocumentModel
 from .return_payment import PaymentReturnModel
 from .role import RoleModel
+from .sap_outbox import SapOutboxModel
 from .sap_request import SapRequestModel
 from .sap_transfer import SAPTransferModel
 from .schedule import ScheduleModel
@@ -47,6 +48,7 @@ __all__ = [
     "OrderStatusModel",
     "OrderModel",
     "SapRequestModel",
+    "SapOutboxModel",
     "KaspiPaymentModel",
     "PaymentDocumentModel",
     "WorkshopScheduleModel",
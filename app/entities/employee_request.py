@@ -4,7 +4,11 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class EmployeeRequestModel(Base):
@@ -57,6 +61,13 @@ class EmployeeRequestModel(Base):
     # Таймстампы создания и обновления
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(
+                AppTableNames.EmployeeRequestTableName
+            )
+        )
+    ]
 
     # Relations
     organization: Mapped[AppModelNames.OrganizationModelName] = (
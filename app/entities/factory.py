@@ -4,11 +4,18 @@ from sqlalchemy.orm import Mapped, relationship
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbIndexConstants,
+    DbRelationshipConstants,
+)
 
 
 class FactoryModel(Base):
     __tablename__ = AppTableNames.FactoryTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.FactoryTableName, "sap_id"
+    )
     id: Mapped[DbColumnConstants.ID]
     file_id: Mapped[
         DbColumnConstants.ForeignKeyNullableInteger(
@@ -4,7 +4,11 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class FileModel(Base):
@@ -14,8 +18,20 @@ class FileModel(Base):
     file_path: Mapped[DbColumnConstants.StandardText]
     file_size: Mapped[DbColumnConstants.StandardInteger]
     content_type: Mapped[DbColumnConstants.StandardVarchar]
+    # SHA-256 содержимого, считается при потоковой записи
+    content_hash: Mapped[DbColumnConstants.StandardNullableVarcharIndex]
+    # Ключ в хранилище по хешу; записи с одним ключом делят содержимое
+    storage_key: Mapped[DbColumnConstants.StandardNullableVarcharIndex]
+    # Уменьшенные копии изображения (webp), строятся в фоне после загрузки
+    thumbnail_path: Mapped[DbColumnConstants.StandardNullableText]
+    preview_path: Mapped[DbColumnConstants.StandardNullableText]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(AppTableNames.FileTableName)
+        )
+    ]
 
     factories: Mapped[List[AppModelNames.FactoryModelName]] = (
         DbRelationshipConstants.one_to_many(
@@ -45,6 +61,13 @@ class FileModel(Base):
             foreign_keys=f"{AppModelNames.PaymentDocumentModelName}.file_id",
         )
     )
+    sap_requests: Mapped[List[AppModelNames.SAPRequestModelName]] = (
+        DbRelationshipConstants.one_to_many(
+            target=AppModelNames.SAPRequestModelName,
+            back_populates="file",
+            foreign_keys=f"{AppModelNames.SAPRequestModelName}.file_id",
+        )
+    )
     users: Mapped[List[AppModelNames.UserModelName]] = (
         DbRelationshipConstants.one_to_many(
             target=AppModelNames.UserModelName,
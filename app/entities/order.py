@@ -8,6 +8,7 @@ from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
 from app.shared.db_constants import (
     DbColumnConstants,
+    DbIndexConstants,
     DbModelValue,
     DbRelationshipConstants,
 )
@@ -15,6 +16,9 @@ from app.shared.db_constants import (
 
 class OrderModel(Base):
     __tablename__ = AppTableNames.OrderTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.OrderTableName, "zakaz", "status"
+    )
 
     id: Mapped[DbColumnConstants.ID]
     status_id: Mapped[
@@ -159,6 +163,11 @@ class OrderModel(Base):
 
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(AppTableNames.OrderTableName)
+        )
+    ]
 
     # Relations
     act_weights: Mapped[List[AppModelNames.ActWeightModelName]] = (
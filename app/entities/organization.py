@@ -4,11 +4,19 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbIndexConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class OrganizationModel(Base):
     __tablename__ = AppTableNames.OrganizationTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.OrganizationTableName, "bin", "email", "phone"
+    )
     id: Mapped[DbColumnConstants.ID]
     file_id: Mapped[
         DbColumnConstants.ForeignKeyNullableInteger(
@@ -41,6 +49,13 @@ class OrganizationModel(Base):
     ]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(
+                AppTableNames.OrganizationTableName
+            )
+        )
+    ]
 
     # Relations
     employee_requests: Mapped[List[AppModelNames.EmployeeRequestModelName]] = (
@@ -2,7 +2,11 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class OrganizationEmployeeModel(Base):
@@ -37,6 +41,13 @@ class OrganizationEmployeeModel(Base):
     ]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(
+                AppTableNames.OrganizationEmployeeTableName
+            )
+        )
+    ]
 
     # Relations
     organization: Mapped[AppModelNames.OrganizationModelName] = (
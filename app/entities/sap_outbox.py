@@ -0,0 +1,42 @@
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped
+
+from app.infrastructure.database import Base
+from app.shared.app_constants import AppTableNames
+from app.shared.db_constants import DbColumnConstants
+
+
+class SapOutboxModel(Base):
+    """
+    Outbox заявок на создание заказа в SAP 088: строка пишется в одной
+    транзакции с заказом, а отправку в SAP выполняет воркер с повторами.
+    """
+
+    __tablename__ = AppTableNames.SAPOutboxTableName
+    __table_args__ = (
+        Index("ix_sap_outbox_order_id", "order_id"),
+        # Выборка воркера: ожидающие и зависшие записи, у которых подошел срок
+        Index("ix_sap_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[DbColumnConstants.ID]
+    order_id: Mapped[
+        DbColumnConstants.ForeignKeyInteger(
+            AppTableNames.OrderTableName, onupdate="cascade", ondelete="cascade"
+        )
+    ]
+    sap_request_id: Mapped[
+        DbColumnConstants.ForeignKeyNullableInteger(
+            AppTableNames.SAPRequestTableName, onupdate="cascade", ondelete="set null"
+        )
+    ]
+    # pending -> processing -> sent | failed | review (AppDbValueConstants.SAP_OUTBOX_*)
+    status: Mapped[DbColumnConstants.StandardVarchar]
+    attempts: Mapped[DbColumnConstants.StandardIntegerDefaultZero]
+    # Срок следующей попытки; для processing — срок аренды воркером
+    next_attempt_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+    last_error: Mapped[DbColumnConstants.StandardNullableText]
+    sent_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+
+    created_at: Mapped[DbColumnConstants.CreatedAt]
+    updated_at: Mapped[DbColumnConstants.UpdatedAt]
@@ -28,7 +28,13 @@ class SapRequestModel(Base):
     status: Mapped[DbColumnConstants.StandardNullableVarchar]
     zakaz: Mapped[DbColumnConstants.StandardNullableVarcharIndex]
     text: Mapped[DbColumnConstants.StandardNullableText]
-    pdf: Mapped[DbColumnConstants.StandardNullableText]
+    # PDF заказа хранится файлом; колонка — только для старых записей в base64
+    pdf: Mapped[DbColumnConstants.StandardNullableDeferredText]
+    file_id: Mapped[
+        DbColumnConstants.ForeignKeyNullableInteger(
+            AppTableNames.FileTableName, onupdate="cascade", ondelete="set null"
+        )
+    ]
     date: Mapped[DbColumnConstants.StandardNullableDate]  # Дата переноса
     time: Mapped[DbColumnConstants.StandardNullableTime]
     # Статусы
@@ -53,3 +59,8 @@ class SapRequestModel(Base):
         back_populates="sap_requests",
         foreign_keys=f"{AppModelNames.SAPRequestModelName}.order_id",
     )
+    file: Mapped[AppModelNames.FileModelName] = DbRelationshipConstants.many_to_one(
+        target=AppModelNames.FileModelName,
+        back_populates="sap_requests",
+        foreign_keys=f"{AppModelNames.SAPRequestModelName}.file_id",
+    )
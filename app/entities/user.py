@@ -4,11 +4,19 @@ from sqlalchemy.orm import Mapped, relationship
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbIndexConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class UserModel(Base):
     __tablename__ = AppTableNames.UserTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.UserTableName, "sid", "preferred_username"
+    )
     id: Mapped[DbColumnConstants.ID]
     sid: Mapped[DbColumnConstants.StandardUniqueValue]
     iin: Mapped[DbColumnConstants.StandardNullableVarchar]
@@ -44,6 +52,11 @@ class UserModel(Base):
     password_hash: Mapped[DbColumnConstants.StandardNullableText]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(AppTableNames.UserTableName)
+        )
+    ]
 
     # Relations
     role: Mapped[AppModelNames.RoleModelName] = DbRelationshipConstants.many_to_one(
@@ -4,11 +4,19 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbIndexConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class VehicleModel(Base):
     __tablename__ = AppTableNames.VehicleTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.VehicleTableName, "registration_number"
+    )
     id: Mapped[DbColumnConstants.ID]
     category_id: Mapped[
         DbColumnConstants.ForeignKeyNullableInteger(
@@ -52,6 +60,11 @@ class VehicleModel(Base):
     status: Mapped[DbColumnConstants.StandardBooleanTrue]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(AppTableNames.VehicleTableName)
+        )
+    ]
 
     # Relations
 
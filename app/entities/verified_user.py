@@ -2,7 +2,11 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbModelValue,
+    DbRelationshipConstants,
+)
 
 
 class VerifiedUserModel(Base):
@@ -30,6 +34,13 @@ class VerifiedUserModel(Base):
     verified_by_sid: Mapped[DbColumnConstants.StandardNullableVarcharIndex]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    search_document: Mapped[
+        DbColumnConstants.StandardComputedSearchDocument(
+            table_exp=DbModelValue().search_document(
+                AppTableNames.VerifiedUserTableName
+            )
+        )
+    ]
     # Relations
     user: Mapped[AppModelNames.UserModelName] = DbRelationshipConstants.many_to_one(
         target=AppModelNames.UserModelName,
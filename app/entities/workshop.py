@@ -5,11 +5,18 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbIndexConstants,
+    DbRelationshipConstants,
+)
 
 
 class WorkshopModel(Base):
     __tablename__ = AppTableNames.WorkshopTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.WorkshopTableName, "sap_id"
+    )
     id: Mapped[DbColumnConstants.ID]
     file_id: Mapped[
         DbColumnConstants.ForeignKeyNullableInteger(
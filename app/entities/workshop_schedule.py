@@ -4,11 +4,18 @@ from sqlalchemy.orm import Mapped
 
 from app.infrastructure.database import Base
 from app.shared.app_constants import AppModelNames, AppTableNames
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import (
+    DbColumnConstants,
+    DbIndexConstants,
+    DbRelationshipConstants,
+)
 
 
 class WorkshopScheduleModel(Base):
     __tablename__ = AppTableNames.WorkshopScheduleTableName
+    __table_args__ = DbIndexConstants.lower_indexes(
+        AppTableNames.WorkshopScheduleTableName, "workshop_sap_id"
+    )
 
     # ID
     id: Mapped[DbColumnConstants.ID]
@@ -1,4 +1,6 @@
-import requests
+import asyncio
+
+import aiohttp
 
 from app.adapters.dto.kaspi.kaspi_request_dto import (
     KaspiFastPaymentDTO,
@@ -6,6 +8,7 @@ from app.adapters.dto.kaspi.kaspi_request_dto import (
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.config import app_config
+from app.infrastructure.http_transport import HttpUpstream, http_transport
 
 
 class KaspiPaymentApiClient:
@@ -27,12 +30,18 @@ class KaspiPaymentApiClient:
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(kaspi_url, json=payload, headers=headers)
+            response = await http_transport.post(
+                HttpUpstream.KASPI,
+                kaspi_url,
+                json=payload,
+                headers=headers,
+                read_timeout=app_config.kaspi_read_timeout_sec,
+            )
             response.raise_for_status()  # Проверка статуса HTTP
             data = response.json()
             order_data = KaspiFastPaymentResponseDTO.parse_obj(data)
             return order_data
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise AppExceptionResponse.internal_error(
                 message=f"Ошибка при оплате Каспи попробуйте позже"
             )
@@ -1,33 +1,63 @@
+import asyncio
 import random
 from datetime import date, datetime
-from typing import Optional, Union
+from typing import List, Union
 
-import requests
+import aiohttp
+from fastapi import HTTPException
 
 from app.adapters.dto.sap.create_sap_order_dto import (
     CreateIndividualSapOrderDTO,
     CreateLegalSapOrderDTO,
     SapStatusDTO,
 )
-from app.adapters.dto.sap.sap_bearer_token_dto import SapBearerTokenDTO
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.api_clients.sap.sap_token_manager import sap_088_token_manager
 from app.infrastructure.config import app_config
-from app.infrastructure.redis_client import redis_client
+from app.infrastructure.http_transport import (
+    HttpStatusError,
+    HttpUpstream,
+    http_transport,
+    is_outcome_unknown,
+)
+
+
+SapOrderData = Union[CreateLegalSapOrderDTO, CreateIndividualSapOrderDTO]
+# Признак в `detail` ошибки: заявка могла дойти до SAP и создать заказ
+OUTCOME_UNKNOWN_KEY = "outcome_unknown"
+
+
+def is_order_outcome_unknown(error: BaseException) -> bool:
+    """Ошибка SAP 088, после которой неизвестно, создан ли заказ."""
+    return (
+        isinstance(error, HTTPException)
+        and isinstance(error.detail, dict)
+        and bool(error.detail.get(OUTCOME_UNKNOWN_KEY))
+    )
 
 
 class SapCreateOrderApiClient:
-    ACCESS_TOKEN_SAP088 = "access_token_sap088"
+    async def create_sap_order(self, order_data: SapOrderData) -> SapStatusDTO:
+        return await self.create_sap_orders(orders=[order_data])
 
-    async def create_sap_order(
-        self, order_data: Union[CreateLegalSapOrderDTO, CreateIndividualSapOrderDTO]
-    ) -> SapStatusDTO:
+    async def create_sap_orders(self, orders: List[SapOrderData]) -> SapStatusDTO:
+        """
+        Заявки на несколько заказов одним вызовом: интерфейс RubbleOrder
+        принимает список `items.item` и отвечает по элементу на заказ
+        (сопоставляются по ORDER_ID).
+        """
         if app_config.sap_use_fake_service:
-            data = self._fake_create_order_response(order_data=order_data)
-            items_list_data = {
-                "items": [data["items"]["item"]]  # Преобразуем `item` в список
+            data = {
+                "items": {
+                    "item": [
+                        self._fake_create_order_response(order_data=order_data)[
+                            "items"
+                        ]["item"]
+                        for order_data in orders
+                    ]
+                }
             }
-            order_data = SapStatusDTO.parse_obj(items_list_data)
-            return order_data
+            return self._parse_response(data)
         else:
             token: str = await self.get_access_token()
             basic_url = app_config.sap_088_create_order_http_url
@@ -37,24 +67,41 @@ class SapCreateOrderApiClient:
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {token}",
             }
-            payload = self._create_sap_order_payload(order_data=order_data)
+            payload = self._create_sap_order_payload(orders=orders)
             try:
-                response = requests.post(basic_url, json=payload, headers=headers)
+                response = await http_transport.post(
+                    HttpUpstream.SAP_088,
+                    basic_url,
+                    json=payload,
+                    headers=headers,
+                    read_timeout=app_config.sap_088_read_timeout_sec,
+                )
                 response.raise_for_status()  # Проверка статуса HTTP
-                data = response.json()
-                items_list_data = {
-                    "items": [data["items"]["item"]]  # Преобразуем `item` в список
-                }
-                order_data = SapStatusDTO.parse_obj(items_list_data)
-                return order_data
-            except requests.exceptions.RequestException as e:
+                return self._parse_response(response.json())
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, HttpStatusError) and e.status == 401:
+                    # Токен отозван на стороне SAP — следующий запрос получит новый
+                    await sap_088_token_manager.invalidate()
+                raise AppExceptionResponse.internal_error(
+                    message=f"Ошибка при создании заказа в системе SAP 088 {str(e)}",
+                    extra={OUTCOME_UNKNOWN_KEY: is_outcome_unknown(e)},
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                # Ответ 2xx не разобран: SAP мог создать заказ
                 raise AppExceptionResponse.internal_error(
-                    message=f"Ошибка при создании заказа в системе SAP 088 {str(e)}"
+                    message=f"Некорректный ответ SAP 088 {str(e)}",
+                    extra={OUTCOME_UNKNOWN_KEY: True},
                 )
 
-    def _fake_create_order_response(
-        self, order_data: Union[CreateLegalSapOrderDTO, CreateIndividualSapOrderDTO]
-    ):
+    @staticmethod
+    def _parse_response(data: dict) -> SapStatusDTO:
+        # Один элемент SAP отдает объектом, несколько — списком
+        items = data["items"]["item"]
+        if not isinstance(items, list):
+            items = [items]
+        return SapStatusDTO.parse_obj({"items": items})
+
+    def _fake_create_order_response(self, order_data: SapOrderData):
         zakaz = random.randint(1000000000, 9999999999)
         percentage = random.randint(0, 100)
         now = datetime.now()
@@ -91,73 +138,38 @@ class SapCreateOrderApiClient:
                 }
             }
 
-    def _create_sap_order_payload(
-        self, order_data: Union[CreateLegalSapOrderDTO, CreateIndividualSapOrderDTO]
-    ) -> dict:
-        if isinstance(order_data, CreateLegalSapOrderDTO):
-            payload = {
-                "items": {
-                    "item": [
-                        {
-                            "DOGOVOR": order_data.DOGOVOR,
-                            "MATNR": order_data.MATNR,
-                            "QUAN": order_data.QUAN,
-                            "ORDER_ID": order_data.ORDER_ID,
-                        }
-                    ]
-                }
-            }
-        else:
-            payload = {
-                "items": {
-                    "item": [
-                        {
-                            "WERKS": order_data.WERKS,
-                            "MATNR": order_data.MATNR,
-                            "KUN_NAME": order_data.KUN_NAME,
-                            "ADR_INDEX": order_data.ADR_INDEX,
-                            "ADR_CITY": order_data.ADR_CITY,
-                            "ADR_STR": order_data.ADR_STR,
-                            "ADR_DOM": order_data.ADR_DOM,
-                            "IIN": order_data.IIN,
-                            "QUAN": order_data.QUAN,
-                            "PRICE": order_data.PRICE,
-                            "ORDER_ID": order_data.ORDER_ID,
-                        }
-                    ]
-                }
+    def _create_sap_order_payload(self, orders: List[SapOrderData]) -> dict:
+        return {
+            "items": {
+                "item": [
+                    self._create_sap_order_item(order_data=order_data)
+                    for order_data in orders
+                ]
             }
-        return payload
-
-    async def get_access_token(self) -> str:
-        access_token: Optional[str] = redis_client.get(self.ACCESS_TOKEN_SAP088)
-        if not access_token:
-            token_dto = await self._make_call_to_sap_auth()
-            return token_dto.access_token
-        return access_token
-
-    async def _make_call_to_sap_auth(self) -> SapBearerTokenDTO:
-        payload = {
-            "grant_type": app_config.sap_088_grant_type,
-            "client_id": app_config.sap_088_client_id,
-            "client_secret": app_config.sap_088_client_secret,
         }
-        basic_url = app_config.sap_auth_http_url
-        if app_config.auth_contract_https_enabled:
-            basic_url = app_config.sap_auth_https_url
 
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+    @staticmethod
+    def _create_sap_order_item(order_data: SapOrderData) -> dict:
+        if isinstance(order_data, CreateLegalSapOrderDTO):
+            return {
+                "DOGOVOR": order_data.DOGOVOR,
+                "MATNR": order_data.MATNR,
+                "QUAN": order_data.QUAN,
+                "ORDER_ID": order_data.ORDER_ID,
+            }
+        return {
+            "WERKS": order_data.WERKS,
+            "MATNR": order_data.MATNR,
+            "KUN_NAME": order_data.KUN_NAME,
+            "ADR_INDEX": order_data.ADR_INDEX,
+            "ADR_CITY": order_data.ADR_CITY,
+            "ADR_STR": order_data.ADR_STR,
+            "ADR_DOM": order_data.ADR_DOM,
+            "IIN": order_data.IIN,
+            "QUAN": order_data.QUAN,
+            "PRICE": order_data.PRICE,
+            "ORDER_ID": order_data.ORDER_ID,
+        }
 
-        try:
-            response = requests.post(basic_url, data=payload, headers=headers)
-            response.raise_for_status()
-            token_data = response.json()
-            token_dto = SapBearerTokenDTO.parse_obj(token_data)
-            redis_client.setex(
-                self.ACCESS_TOKEN_SAP088, token_dto.expires_in, token_dto.access_token
-            )
-            return token_dto
-        except requests.exceptions.RequestException as e:
-            raise AppExceptionResponse.internal_error(
-                message=f"Ошибка при генерации токена SAP 083 {str(e)}"
-            )
+    async def get_access_token(self) -> str:
+        return await sap_088_token_manager.get_access_token()
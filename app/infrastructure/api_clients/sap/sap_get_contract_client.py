@@ -1,21 +1,24 @@
+import asyncio
 from typing import List, Optional
 
-import requests
+import aiohttp
 
-from app.adapters.dto.sap.sap_bearer_token_dto import SapBearerTokenDTO
 from app.adapters.dto.sap.sap_contract_dto import (
     SapContractDTO,
     SapContractForResponseDTO,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.api_clients.sap.sap_token_manager import sap_083_token_manager
 from app.infrastructure.config import app_config
-from app.infrastructure.redis_client import redis_client
+from app.infrastructure.http_transport import (
+    HttpStatusError,
+    HttpUpstream,
+    http_transport,
+)
 from app.shared.dto_constants import DTOConstant
 
 
 class SapGetContractApiClient:
-    ACCESS_TOKEN_SAP083 = "access_token_sap083"
-
     async def get_organization_contracts_by_bin_response(
         self, bin: DTOConstant.StandardUniqueBINField()
     ) -> List[SapContractForResponseDTO]:
@@ -68,46 +71,26 @@ class SapGetContractApiClient:
         }
         payload = {"BIN_PARTNER": bin}
         try:
-            response = requests.post(basic_url, json=payload, headers=headers)
+            response = await http_transport.post(
+                HttpUpstream.SAP_083,
+                basic_url,
+                json=payload,
+                headers=headers,
+                read_timeout=app_config.sap_083_read_timeout_sec,
+                # Запрос только читает договоры
+                idempotent=True,
+            )
             response.raise_for_status()  # Проверка статуса HTTP
             data = response.json()
             contracts_dto = SapContractDTO.parse_obj(data)
             return contracts_dto
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if isinstance(e, HttpStatusError) and e.status == 401:
+                # Токен отозван на стороне SAP — следующий запрос получит новый
+                await sap_083_token_manager.invalidate()
             raise AppExceptionResponse.internal_error(
                 message=f"Ошибка при получении договоров организации SAP 083 {str(e)}"
             )
 
     async def get_access_token(self) -> str:
-        access_token: Optional[str] = redis_client.get(self.ACCESS_TOKEN_SAP083)
-        if not access_token:
-            token_dto = await self._make_call_to_sap_auth()
-            return token_dto.access_token
-        return access_token
-
-    async def _make_call_to_sap_auth(self) -> SapBearerTokenDTO:
-        payload = {
-            "grant_type": app_config.sap_083_grant_type,
-            "client_id": app_config.sap_083_client_id,
-            "client_secret": app_config.sap_083_client_secret,
-            "scope": app_config.sap_083_scope,
-        }
-        basic_url = app_config.sap_auth_http_url
-        if app_config.auth_contract_https_enabled:
-            basic_url = app_config.sap_auth_https_url
-
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        try:
-            response = requests.post(basic_url, data=payload, headers=headers)
-            response.raise_for_status()
-            token_data = response.json()
-            token_dto = SapBearerTokenDTO.parse_obj(token_data)
-            redis_client.setex(
-                self.ACCESS_TOKEN_SAP083, token_dto.expires_in, token_dto.access_token
-            )
-            return token_dto
-        except requests.exceptions.RequestException as e:
-            raise AppExceptionResponse.internal_error(
-                message=f"Ошибка при генерации токена SAP 083 {str(e)}"
-            )
+        return await sap_083_token_manager.get_access_token()
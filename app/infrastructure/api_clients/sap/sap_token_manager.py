@@ -0,0 +1,223 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import aiohttp
+from redis.exceptions import LockError, RedisError
+
+from app.adapters.dto.sap.sap_bearer_token_dto import SapBearerTokenDTO
+from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.config import app_config
+from app.infrastructure.http_transport import HttpUpstream, http_transport
+from app.infrastructure.redis_client import redis_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SapCachedToken:
+    access_token: str
+    expires_at: float  # unix time, когда SAP перестанет принимать токен
+    refresh_at: float  # unix time, после которого токен обновляется заранее
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.refresh_at
+
+    @property
+    def is_valid(self) -> bool:
+        # Небольшой запас, чтобы токен не истек на лету во время запроса
+        return time.time() < self.expires_at - app_config.sap_token_expiry_margin_sec
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "access_token": self.access_token,
+                "expires_at": self.expires_at,
+                "refresh_at": self.refresh_at,
+            }
+        )
+
+    @staticmethod
+    def from_json(value: Optional[str]) -> Optional["SapCachedToken"]:
+        if not value:
+            return None
+        try:
+            data = json.loads(value)
+            return SapCachedToken(
+                access_token=data["access_token"],
+                expires_at=float(data["expires_at"]),
+                refresh_at=float(data["refresh_at"]),
+            )
+        except (ValueError, TypeError, KeyError):
+            # Старый формат (голая строка токена) — считаем промахом
+            return None
+
+
+class SapTokenManager:
+    """
+    Менеджер OAuth-токена SAP для одного scope.
+
+    - Горячий путь читает токен из памяти процесса, без обращения к Redis.
+    - Токен обновляется заранее, по достижении `sap_token_refresh_ratio`
+      от `expires_in`; пока он еще действителен, обновление идет в фоне.
+    - Конкурентные обновления схлопываются в один запрос: asyncio.Lock внутри
+      процесса и блокировка Redis между воркерами.
+    """
+
+    def __init__(
+        self, cache_key: str, title: str, payload_factory: Callable[[], dict]
+    ) -> None:
+        self.cache_key = cache_key
+        self.lock_key = f"{cache_key}:lock"
+        self.title = title
+        self.payload_factory = payload_factory
+        self._token: Optional[SapCachedToken] = None
+        self._lock = asyncio.Lock()
+        self._background_refresh: Optional[asyncio.Task] = None
+
+    async def get_access_token(self) -> str:
+        token = self._token
+        if token and token.is_fresh:
+            return token.access_token
+        if token and token.is_valid:
+            self._schedule_background_refresh()
+            return token.access_token
+        token = await self._refresh()
+        return token.access_token
+
+    async def invalidate(self) -> None:
+        """Сбрасывает токен, например, если SAP ответил 401."""
+        self._token = None
+        try:
+            await redis_cache.delete(self.cache_key)
+        except RedisError as e:
+            logger.warning(f"Не удалось удалить токен {self.title} из Redis: {e}")
+
+    def _schedule_background_refresh(self) -> None:
+        if self._background_refresh and not self._background_refresh.done():
+            return
+        self._background_refresh = asyncio.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self._refresh()
+        except Exception as e:
+            # Текущий токен еще действителен, поэтому ошибка не критична
+            logger.warning(f"Фоновое обновление токена {self.title} не удалось: {e}")
+
+    async def _refresh(self) -> SapCachedToken:
+        async with self._lock:
+            # Пока ждали блокировку, токен мог обновить другой запрос
+            if self._token and self._token.is_fresh:
+                return self._token
+            token = await self._read_shared_token()
+            if token and token.is_fresh:
+                self._token = token
+                return token
+            token = await self._refresh_across_workers()
+            self._token = token
+            return token
+
+    async def _refresh_across_workers(self) -> SapCachedToken:
+        try:
+            lock = redis_cache.lock(
+                self.lock_key,
+                timeout=app_config.sap_token_lock_timeout_sec,
+                blocking_timeout=app_config.sap_token_lock_timeout_sec,
+            )
+            acquired = await lock.acquire()
+        except RedisError as e:
+            logger.warning(f"Redis недоступен, токен {self.title} без блокировки: {e}")
+            return await self._request_token()
+
+        if not acquired:
+            # Другой воркер так и не отдал токен — пробуем его результат,
+            # иначе запрашиваем сами, чтобы не блокировать запрос навсегда
+            token = await self._read_shared_token()
+            if token and token.is_valid:
+                return token
+            return await self._request_token()
+
+        try:
+            token = await self._read_shared_token()
+            if token and token.is_fresh:
+                return token
+            token = await self._request_token()
+            await self._write_shared_token(token)
+            return token
+        finally:
+            try:
+                await lock.release()
+            except (LockError, RedisError):
+                pass
+
+    async def _read_shared_token(self) -> Optional[SapCachedToken]:
+        try:
+            return SapCachedToken.from_json(await redis_cache.get(self.cache_key))
+        except RedisError as e:
+            logger.warning(f"Не удалось прочитать токен {self.title} из Redis: {e}")
+            return None
+
+    async def _write_shared_token(self, token: SapCachedToken) -> None:
+        ttl = max(1, int(token.expires_at - time.time()))
+        try:
+            await redis_cache.setex(self.cache_key, ttl, token.to_json())
+        except RedisError as e:
+            logger.warning(f"Не удалось сохранить токен {self.title} в Redis: {e}")
+
+    async def _request_token(self) -> SapCachedToken:
+        basic_url = app_config.sap_auth_http_url
+        if app_config.auth_contract_https_enabled:
+            basic_url = app_config.sap_auth_https_url
+
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        try:
+            response = await http_transport.post(
+                HttpUpstream.SAP_AUTH,
+                basic_url,
+                data=self.payload_factory(),
+                headers=headers,
+                read_timeout=app_config.sap_auth_read_timeout_sec,
+                # Повторный запрос просто выдаст новый токен
+                idempotent=True,
+            )
+            response.raise_for_status()
+            token_dto = SapBearerTokenDTO.parse_obj(response.json())
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise AppExceptionResponse.internal_error(
+                message=f"Ошибка при генерации токена {self.title} {str(e)}"
+            )
+        issued_at = time.time()
+        return SapCachedToken(
+            access_token=token_dto.access_token,
+            expires_at=issued_at + token_dto.expires_in,
+            refresh_at=issued_at
+            + token_dto.expires_in * app_config.sap_token_refresh_ratio,
+        )
+
+
+sap_083_token_manager = SapTokenManager(
+    cache_key="access_token_sap083",
+    title="SAP 083",
+    payload_factory=lambda: {
+        "grant_type": app_config.sap_083_grant_type,
+        "client_id": app_config.sap_083_client_id,
+        "client_secret": app_config.sap_083_client_secret,
+        "scope": app_config.sap_083_scope,
+    },
+)
+
+sap_088_token_manager = SapTokenManager(
+    cache_key="access_token_sap088",
+    title="SAP 088",
+    payload_factory=lambda: {
+        "grant_type": app_config.sap_088_grant_type,
+        "client_id": app_config.sap_088_client_id,
+        "client_secret": app_config.sap_088_client_secret,
+    },
+)
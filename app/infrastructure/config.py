@@ -61,6 +61,19 @@ class AppConfiguration(BaseSettings):
     keycloak_realm: str = Field(..., env="KEYCLOAK_REALM")
     keycloak_client_id: str = Field(..., env="KEYCLOAK_CLIENT_ID")
     keycloak_client_secret: str = Field(..., env="KEYCLOAK_CLIENT_SECRET")
+    keycloak_verify_ssl: bool = Field(default=False, env="KEYCLOAK_VERIFY_SSL")
+    keycloak_read_timeout_sec: float = Field(
+        default=10.0, env="KEYCLOAK_READ_TIMEOUT_SEC"
+    )
+    keycloak_jwks_refresh_sec: int = Field(
+        default=3600, env="KEYCLOAK_JWKS_REFRESH_SEC"
+    )
+    keycloak_jwks_min_refetch_sec: int = Field(
+        default=30, env="KEYCLOAK_JWKS_MIN_REFETCH_SEC"
+    )
+    # Кэш текущего пользователя (по sub + exp токена)
+    auth_user_cache_ttl_sec: int = Field(default=120, env="AUTH_USER_CACHE_TTL_SEC")
+    auth_user_cache_max_size: int = Field(default=10000, env="AUTH_USER_CACHE_MAX_SIZE")
     # User Repo For Check
     app_user_repo_status: str = Field(default="DEV", env="APP_USER_REPO_STATUS")
     app_user_repo_dev_url: str = Field(..., env="APP_USER_REPO_DEV_URL")
@@ -77,6 +90,22 @@ class AppConfiguration(BaseSettings):
     not_allowed_extensions: Optional[list[str]] = Field(
         default={}, env="NOT_ALLOWED_EXTENSIONS"
     )
+    # Хранилище файлов по хешу содержимого: local (static/upload) или s3
+    file_storage_backend: str = Field(default="local", env="FILE_STORAGE_BACKEND")
+    file_storage_lock_timeout_sec: float = Field(
+        default=30.0, env="FILE_STORAGE_LOCK_TIMEOUT_SEC"
+    )
+    s3_endpoint_url: Optional[str] = Field(default=None, env="S3_ENDPOINT_URL")
+    s3_public_url: Optional[str] = Field(default=None, env="S3_PUBLIC_URL")
+    s3_access_key: Optional[str] = Field(default=None, env="S3_ACCESS_KEY")
+    s3_secret_key: Optional[str] = Field(default=None, env="S3_SECRET_KEY")
+    s3_region: str = Field(default="us-east-1", env="S3_REGION")
+    s3_bucket: str = Field(default="digital-queue", env="S3_BUCKET")
+    # Уменьшенные копии изображений (webp): сторона в пикселях и качество
+    image_thumbnail_size: int = Field(default=256, env="IMAGE_THUMBNAIL_SIZE")
+    image_preview_size: int = Field(default=1024, env="IMAGE_PREVIEW_SIZE")
+    image_variant_quality: int = Field(default=80, env="IMAGE_VARIANT_QUALITY")
+    image_variant_concurrency: int = Field(default=2, env="IMAGE_VARIANT_CONCURRENCY")
     # Security Issues and Vezdehod
     check_verified_user: bool = Field(default=False, env="CHECK_VERIFIED_USER")
     check_verified_vehicle: bool = Field(default=False, env="CHECK_VERIFIED_VEHICLE")
@@ -94,11 +123,79 @@ class AppConfiguration(BaseSettings):
     cors_allowed_methods: List[str] = Field(default=["*"], env="CORS_ALLOWED_METHODS")
     cors_allowed_headers: List[str] = Field(default=["*"], env="CORS_ALLOWED_HEADERS")
 
+    # HTTP TRANSPORT (внешние интеграции)
+    http_pool_size: int = Field(default=50, env="HTTP_POOL_SIZE")
+    http_keepalive_timeout_sec: float = Field(
+        default=60.0, env="HTTP_KEEPALIVE_TIMEOUT_SEC"
+    )
+    http_dns_cache_ttl_sec: int = Field(default=300, env="HTTP_DNS_CACHE_TTL_SEC")
+    http_connect_timeout_sec: float = Field(default=5.0, env="HTTP_CONNECT_TIMEOUT_SEC")
+    http_read_timeout_sec: float = Field(default=30.0, env="HTTP_READ_TIMEOUT_SEC")
+    http_verify_ssl: bool = Field(default=True, env="HTTP_VERIFY_SSL")
+    http_pool_wait_warning_ms: int = Field(default=500, env="HTTP_POOL_WAIT_WARNING_MS")
+    # Устойчивость внешних интеграций (на каждый сервис отдельно)
+    http_bulkhead_size: int = Field(default=25, env="HTTP_BULKHEAD_SIZE")
+    http_bulkhead_wait_sec: float = Field(default=2.0, env="HTTP_BULKHEAD_WAIT_SEC")
+    http_retry_attempts: int = Field(default=2, env="HTTP_RETRY_ATTEMPTS")
+    http_retry_base_delay_sec: float = Field(
+        default=0.2, env="HTTP_RETRY_BASE_DELAY_SEC"
+    )
+    http_retry_max_delay_sec: float = Field(default=2.0, env="HTTP_RETRY_MAX_DELAY_SEC")
+    http_circuit_failure_threshold: int = Field(
+        default=5, env="HTTP_CIRCUIT_FAILURE_THRESHOLD"
+    )
+    http_circuit_reset_timeout_sec: float = Field(
+        default=30.0, env="HTTP_CIRCUIT_RESET_TIMEOUT_SEC"
+    )
+    sap_auth_read_timeout_sec: float = Field(
+        default=10.0, env="SAP_AUTH_READ_TIMEOUT_SEC"
+    )
+    sap_083_read_timeout_sec: float = Field(
+        default=30.0, env="SAP_083_READ_TIMEOUT_SEC"
+    )
+    sap_088_read_timeout_sec: float = Field(
+        default=60.0, env="SAP_088_READ_TIMEOUT_SEC"
+    )
+    kaspi_read_timeout_sec: float = Field(default=15.0, env="KASPI_READ_TIMEOUT_SEC")
+    user_repo_read_timeout_sec: float = Field(
+        default=10.0, env="USER_REPO_READ_TIMEOUT_SEC"
+    )
+
     # SAP Configuration
     sap_use_fake_service: bool = Field(default=True, env="SAP_USE_FAKE_SERVICE")
     sap_create_order_after_order: bool = Field(
         default=True, env="SAP_CREATE_ORDER_AFTER_ORDER"
     )
+    # Outbox заявок SAP 088: заказ создается сразу, заявка уходит в SAP в фоне
+    sap_outbox_worker_in_app: bool = Field(default=True, env="SAP_OUTBOX_WORKER_IN_APP")
+    sap_outbox_max_attempts: int = Field(default=5, env="SAP_OUTBOX_MAX_ATTEMPTS")
+    sap_outbox_retry_base_sec: float = Field(
+        default=10.0, env="SAP_OUTBOX_RETRY_BASE_SEC"
+    )
+    sap_outbox_retry_max_sec: float = Field(
+        default=600.0, env="SAP_OUTBOX_RETRY_MAX_SEC"
+    )
+    sap_outbox_lease_sec: float = Field(default=180.0, env="SAP_OUTBOX_LEASE_SEC")
+    sap_outbox_poll_interval_sec: float = Field(
+        default=2.0, env="SAP_OUTBOX_POLL_INTERVAL_SEC"
+    )
+    sap_outbox_sweep_batch_size: int = Field(
+        default=50, env="SAP_OUTBOX_SWEEP_BATCH_SIZE"
+    )
+    sap_outbox_status_stream_timeout_sec: float = Field(
+        default=60.0, env="SAP_OUTBOX_STATUS_STREAM_TIMEOUT_SEC"
+    )
+    # Пакетная отправка заявок SAP 088: до N заказов в одном вызове
+    sap_088_batch_size: int = Field(default=20, env="SAP_088_BATCH_SIZE")
+    sap_088_batch_window_sec: float = Field(default=0.5, env="SAP_088_BATCH_WINDOW_SEC")
+    # Кэш договоров SAP 083 по БИН: свежие отдаются как есть, устаревшие —
+    # сразу, с обновлением в фоне; после stale_sec запись удаляется
+    sap_083_contract_cache_ttl_sec: float = Field(
+        default=60.0, env="SAP_083_CONTRACT_CACHE_TTL_SEC"
+    )
+    sap_083_contract_cache_stale_sec: int = Field(
+        default=900, env="SAP_083_CONTRACT_CACHE_STALE_SEC"
+    )
 
     # SAP Authentication Settings
     auth_contract_https_enabled: bool = Field(
@@ -113,6 +210,14 @@ class AppConfiguration(BaseSettings):
         env="SAP_AUTH_HTTP_URL",
     )
 
+    sap_token_refresh_ratio: float = Field(default=0.8, env="SAP_TOKEN_REFRESH_RATIO")
+    sap_token_lock_timeout_sec: float = Field(
+        default=10.0, env="SAP_TOKEN_LOCK_TIMEOUT_SEC"
+    )
+    sap_token_expiry_margin_sec: int = Field(
+        default=5, env="SAP_TOKEN_EXPIRY_MARGIN_SEC"
+    )
+
     # SAP 083 Configuration
     sap_083_https_enabled: bool = Field(default=True, env="SAP_083_HTTPS_ENABLED")
     sap_083_grant_type: str = Field(
@@ -158,6 +263,16 @@ class AppConfiguration(BaseSettings):
     redis_port: int = Field(default=6739, env="REDIS_PORT")
     redis_password: Optional[str] = Field(default=None, env="REDIS_PASSWORD")
     redis_db: int = Field(default=0, env="REDIS_DB")
+    redis_pool_size: int = Field(default=50, env="REDIS_POOL_SIZE")
+    # Сколько ждать свободного соединения, когда пул занят целиком
+    redis_pool_timeout_sec: float = Field(default=5.0, env="REDIS_POOL_TIMEOUT_SEC")
+    redis_socket_timeout_sec: float = Field(default=5.0, env="REDIS_SOCKET_TIMEOUT_SEC")
+    redis_socket_connect_timeout_sec: float = Field(
+        default=2.0, env="REDIS_SOCKET_CONNECT_TIMEOUT_SEC"
+    )
+    redis_health_check_interval_sec: int = Field(
+        default=30, env="REDIS_HEALTH_CHECK_INTERVAL_SEC"
+    )
     # KASPI
     fast_payment_kaspi_service: Optional[str] = Field(
         default=None, env="FAST_PAYMENT_KASPI_SERVICE"
@@ -183,6 +298,16 @@ class AppConfiguration(BaseSettings):
     )
     max_booked_quan_t: float = Field(default=15.0, env="MAX_BOOKED_QUAN_T")
     min_booked_quan_t: float = Field(default=1.0, env="MIN_BOOKED_QUAN_T")
+    schedule_occupancy_ttl_sec: int = Field(
+        default=3600, env="SCHEDULE_OCCUPANCY_TTL_SEC"
+    )
+    # REFERENCE DATA (справочники в памяти процесса)
+    reference_data_refresh_sec: int = Field(
+        default=300, env="REFERENCE_DATA_REFRESH_SEC"
+    )
+    reference_data_resubscribe_sec: float = Field(
+        default=5.0, env="REFERENCE_DATA_RESUBSCRIBE_SEC"
+    )
 
     @property
     def get_connection_url(self) -> str:
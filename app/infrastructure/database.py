@@ -26,4 +26,6 @@ async def get_db() -> AsyncSession:
 
 
 class Base(DeclarativeBase):
-    pass
+    # Серверные значения (id, created_at) читаются сразу при INSERT:
+    # через RETURNING там, где он поддерживается, иначе одним SELECT
+    __mapper_args__ = {"eager_defaults": True}
@@ -0,0 +1,21 @@
+import base64
+import binascii
+from typing import Optional
+
+
+class SapPdfHelper:
+    CONTENT_TYPE = "application/pdf"
+
+    @staticmethod
+    def decode(pdf: Optional[str]) -> Optional[bytes]:
+        """PDF заказа из ответа SAP приходит строкой base64."""
+        if not pdf:
+            return None
+        try:
+            return base64.b64decode(pdf, validate=False)
+        except (binascii.Error, ValueError):
+            return None
+
+    @staticmethod
+    def get_filename(zakaz: Optional[str], order_id: Optional[int]) -> str:
+        return f"order_{zakaz or order_id}.pdf"
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Методы, повтор которых не меняет состояние на стороне сервиса
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# Статусы временной недоступности: запрос можно повторить
+RETRYABLE_STATUSES = {502, 503, 504}
+
+
+class HttpCircuitOpenError(aiohttp.ClientError):
+    """Сервис признан недоступным: запрос отклонен без обращения к нему."""
+
+    def __init__(self, upstream: str, retry_in: float) -> None:
+        self.upstream = upstream
+        self.retry_in = retry_in
+        super().__init__(
+            f"Сервис {upstream} временно недоступен, повтор через {retry_in:.0f} с"
+        )
+
+
+class HttpBulkheadFullError(aiohttp.ClientError):
+    """Все слоты параллельных запросов к сервису заняты дольше допустимого."""
+
+    def __init__(self, upstream: str) -> None:
+        self.upstream = upstream
+        super().__init__(f"Сервис {upstream} перегружен: нет свободных слотов запросов")
+
+
+class CircuitState:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker одного внешнего сервиса (в пределах процесса).
+
+    - closed: запросы идут; `failure_threshold` сбоев подряд (ошибка
+      соединения, таймаут, 5xx) размыкают цепь.
+    - open: запросы сразу отклоняются HttpCircuitOpenError, не занимая
+      соединения, сессии БД и время ожидания клиента.
+    - half_open: через `reset_timeout` пропускается один пробный запрос;
+      успех замыкает цепь, сбой снова размыкает.
+    """
+
+    def __init__(
+        self, upstream: str, failure_threshold: int, reset_timeout: float
+    ) -> None:
+        self.upstream = upstream
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opened_total = 0
+        self.rejected_total = 0
+        self._trial_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitState.OPEN
+
+    def before_request(self) -> None:
+        """
+        Raises:
+            HttpCircuitOpenError: Цепь разомкнута или пробный запрос уже идет.
+        """
+        if self.state == CircuitState.OPEN:
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+            if retry_in > 0:
+                self.rejected_total += 1
+                raise HttpCircuitOpenError(self.upstream, retry_in)
+            self.state = CircuitState.HALF_OPEN
+        if self.state == CircuitState.HALF_OPEN:
+            if self._trial_in_flight:
+                self.rejected_total += 1
+                raise HttpCircuitOpenError(self.upstream, self.reset_timeout)
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        if self.state != CircuitState.CLOSED:
+            logger.info(f"Сервис {self.upstream} снова доступен")
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._trial_in_flight = False
+        if (
+            self.state == CircuitState.HALF_OPEN
+            or self.failures >= self.failure_threshold
+        ):
+            if self.state != CircuitState.OPEN:
+                self.opened_total += 1
+                logger.warning(
+                    f"Сервис {self.upstream} недоступен ({self.failures} сбоев подряд), "
+                    f"запросы отклоняются {self.reset_timeout:.0f} с"
+                )
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Пробный запрос отменен без результата: следующий может попробовать."""
+        self._trial_in_flight = False
+
+    def as_dict(self) -> dict:
+        return {
+            "circuit_state": self.state,
+            "circuit_failures": self.failures,
+            "circuit_opened_total": self.opened_total,
+            "circuit_rejected_total": self.rejected_total,
+        }
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Ошибки соединения и таймауты; отказы breaker'а и bulkhead не повторяются."""
+    if isinstance(error, (HttpCircuitOpenError, HttpBulkheadFullError)):
+        return False
+    if isinstance(error, aiohttp.ClientResponseError):
+        return False
+    return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Экспоненциальная задержка с полным jitter: повторы не приходят волной."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
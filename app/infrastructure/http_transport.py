@@ -0,0 +1,426 @@
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from app.infrastructure.config import app_config
+from app.infrastructure.http_resilience import (
+    IDEMPOTENT_METHODS,
+    RETRYABLE_STATUSES,
+    CircuitBreaker,
+    HttpBulkheadFullError,
+    HttpCircuitOpenError,
+    backoff_delay,
+    is_retryable_error,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpUpstream:
+    """Имена внешних сервисов, для каждого из которых держится свой пул соединений."""
+
+    SAP_AUTH = "sap_auth"
+    SAP_083 = "sap_083"
+    SAP_088 = "sap_088"
+    KASPI = "kaspi"
+    USER_REPO = "user_repo"
+    KEYCLOAK = "keycloak"
+
+
+class HttpStatusError(aiohttp.ClientError):
+    """Внешний сервис ответил статусом ошибки (4xx/5xx)."""
+
+    def __init__(self, status: int, url: str, message: str) -> None:
+        self.status = status
+        self.url = url
+        self.message = message
+        super().__init__(f"{status}, message={message!r}, url={url!r}")
+
+
+class HttpDecodeError(aiohttp.ClientError):
+    """Тело ответа внешнего сервиса не является корректным JSON."""
+
+    def __init__(self, status: int, url: str, message: str) -> None:
+        self.status = status
+        self.url = url
+        self.message = message
+        super().__init__(f"{status}, message={message!r}, url={url!r}")
+
+
+def is_outcome_unknown(error: BaseException) -> bool:
+    """
+    Запрос мог дойти до сервиса и выполниться, но результат неизвестен:
+    таймаут или разрыв соединения после отправки, нечитаемый ответ, 504
+    шлюза. Повтор неидемпотентного запроса в этих случаях может выполнить
+    его дважды. Отказ breaker'а, bulkhead и ошибка подключения — запрос не
+    отправлялся.
+    """
+    if isinstance(
+        error,
+        (
+            HttpCircuitOpenError,
+            HttpBulkheadFullError,
+            aiohttp.ClientConnectorError,
+            aiohttp.ConnectionTimeoutError,
+        ),
+    ):
+        return False
+    if isinstance(error, HttpStatusError):
+        return error.status == 504
+    return isinstance(
+        error,
+        (
+            HttpDecodeError,
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            asyncio.TimeoutError,
+        ),
+    )
+
+
+@dataclass
+class HttpTransportResponse:
+    """Полностью вычитанный ответ: соединение уже возвращено в пул."""
+
+    status: int
+    url: str
+    headers: Dict[str, str]
+    body: bytes
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """
+        Raises:
+            HttpDecodeError: Тело не JSON (HTML-страница шлюза, пустой ответ);
+                как и прочие ошибки транспорта, это aiohttp.ClientError.
+        """
+        try:
+            return json.loads(self.body)
+        except ValueError as e:
+            raise HttpDecodeError(
+                status=self.status,
+                url=self.url,
+                message=f"Некорректный JSON: {e}; {self.text[:200]}",
+            )
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise HttpStatusError(
+                status=self.status, url=self.url, message=self.text[:500]
+            )
+
+
+@dataclass
+class HttpPoolStats:
+    """Счетчики пула соединений одного внешнего сервиса."""
+
+    pool_size: int
+    in_flight: int = 0
+    max_in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    queued_total: int = 0
+    queue_wait_ms_total: float = 0.0
+    requests_total: int = 0
+    errors_total: int = 0
+    timeouts_total: int = 0
+    retries_total: int = 0
+    bulkhead_size: int = 0
+    bulkhead_rejected_total: int = 0
+    _queue_started: Dict[int, float] = field(default_factory=dict, repr=False)
+
+    def as_dict(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "saturation": (
+                round(self.in_flight / self.pool_size, 3) if self.pool_size else 0.0
+            ),
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "queued_total": self.queued_total,
+            "avg_queue_wait_ms": (
+                round(self.queue_wait_ms_total / self.queued_total, 2)
+                if self.queued_total
+                else 0.0
+            ),
+            "requests_total": self.requests_total,
+            "errors_total": self.errors_total,
+            "timeouts_total": self.timeouts_total,
+            "retries_total": self.retries_total,
+            "bulkhead_size": self.bulkhead_size,
+            "bulkhead_rejected_total": self.bulkhead_rejected_total,
+        }
+
+
+class HttpTransport:
+    """
+    Общий асинхронный HTTP-транспорт для внешних интеграций.
+
+    Для каждого внешнего сервиса создается долгоживущая `aiohttp.ClientSession`
+    со своим пулом keep-alive соединений, поэтому медленный SAP не занимает
+    соединения Kaspi и не блокирует цикл событий.
+
+    Поверх пула для каждого сервиса действуют:
+    - bulkhead: не более `http_bulkhead_size` запросов одновременно; если
+      слот не освободился за `http_bulkhead_wait_sec`, запрос отклоняется;
+    - повторы с jitter для идемпотентных запросов (ошибки соединения,
+      таймауты, 502/503/504);
+    - circuit breaker: после серии сбоев запросы отклоняются сразу.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        self._stats: Dict[str, HttpPoolStats] = {}
+        self._bulkheads: Dict[str, asyncio.Semaphore] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _get_session(self, upstream: str) -> aiohttp.ClientSession:
+        session = self._sessions.get(upstream)
+        if session is None or session.closed:
+            pool_size = app_config.http_pool_size
+            connector = aiohttp.TCPConnector(
+                limit=pool_size,
+                keepalive_timeout=app_config.http_keepalive_timeout_sec,
+                ttl_dns_cache=app_config.http_dns_cache_ttl_sec,
+                ssl=app_config.http_verify_ssl,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._build_timeout(),
+                trace_configs=[self._build_trace_config(upstream)],
+            )
+            self._sessions[upstream] = session
+            self._stats.setdefault(
+                upstream,
+                HttpPoolStats(
+                    pool_size=pool_size, bulkhead_size=app_config.http_bulkhead_size
+                ),
+            )
+        return session
+
+    def _get_breaker(self, upstream: str) -> CircuitBreaker:
+        breaker = self._breakers.get(upstream)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                upstream,
+                failure_threshold=app_config.http_circuit_failure_threshold,
+                reset_timeout=app_config.http_circuit_reset_timeout_sec,
+            )
+            self._breakers[upstream] = breaker
+        return breaker
+
+    def _get_bulkhead(self, upstream: str) -> asyncio.Semaphore:
+        bulkhead = self._bulkheads.get(upstream)
+        if bulkhead is None:
+            bulkhead = asyncio.Semaphore(app_config.http_bulkhead_size)
+            self._bulkheads[upstream] = bulkhead
+        return bulkhead
+
+    @staticmethod
+    def _build_timeout(
+        connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None
+    ) -> aiohttp.ClientTimeout:
+        connect = connect_timeout or app_config.http_connect_timeout_sec
+        read = read_timeout or app_config.http_read_timeout_sec
+        return aiohttp.ClientTimeout(
+            total=None, connect=connect, sock_connect=connect, sock_read=read
+        )
+
+    def _build_trace_config(self, upstream: str) -> aiohttp.TraceConfig:
+        """Отслеживает ожидание свободного соединения в пуле (насыщение пула)."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_queued_start(session, context, params):
+            stats = self._stats[upstream]
+            stats.queued += 1
+            stats.queued_total += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+            stats._queue_started[id(context)] = time.monotonic()
+
+        async def on_queued_end(session, context, params):
+            stats = self._stats[upstream]
+            stats.queued = max(0, stats.queued - 1)
+            started = stats._queue_started.pop(id(context), None)
+            if started is not None:
+                waited_ms = (time.monotonic() - started) * 1000
+                stats.queue_wait_ms_total += waited_ms
+                if waited_ms > app_config.http_pool_wait_warning_ms:
+                    logger.warning(
+                        f"Пул соединений {upstream} насыщен: ожидание {waited_ms:.0f} мс"
+                    )
+
+        trace_config.on_connection_queued_start.append(on_queued_start)
+        trace_config.on_connection_queued_end.append(on_queued_end)
+        return trace_config
+
+    async def request(
+        self,
+        upstream: str,
+        method: str,
+        url: str,
+        *,
+        json: Any = None,
+        data: Any = None,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        verify_ssl: Optional[bool] = None,
+        idempotent: Optional[bool] = None,
+    ) -> HttpTransportResponse:
+        """
+        Выполняет запрос через пул указанного сервиса и вычитывает тело ответа.
+        `verify_ssl` переопределяет `http_verify_ssl` для отдельного сервиса.
+        `idempotent` разрешает повторы; по умолчанию — только для GET и
+        подобных методов (POST-запросы на чтение помечаются явно).
+
+        Raises:
+            aiohttp.ClientError: Ошибка соединения или протокола, в том числе
+                HttpCircuitOpenError и HttpBulkheadFullError.
+            asyncio.TimeoutError: Превышен таймаут соединения или чтения.
+        """
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        attempts = 1 + (max(0, app_config.http_retry_attempts) if idempotent else 0)
+        attempt = 1
+        while True:
+            try:
+                response = await self._send(
+                    upstream,
+                    method,
+                    url,
+                    json=json,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    timeout=self._build_timeout(connect_timeout, read_timeout),
+                    verify_ssl=verify_ssl,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if not self._should_retry(upstream, attempt, attempts) or (
+                    not is_retryable_error(e)
+                ):
+                    raise
+                await self._wait_retry(upstream, attempt, f"{type(e).__name__} {e}")
+            else:
+                if not self._should_retry(upstream, attempt, attempts) or (
+                    response.status not in RETRYABLE_STATUSES
+                ):
+                    return response
+                await self._wait_retry(upstream, attempt, f"HTTP {response.status}")
+            attempt += 1
+
+    async def _send(
+        self,
+        upstream: str,
+        method: str,
+        url: str,
+        *,
+        timeout: aiohttp.ClientTimeout,
+        verify_ssl: Optional[bool],
+        **kwargs: Any,
+    ) -> HttpTransportResponse:
+        session = self._get_session(upstream)
+        stats = self._stats[upstream]
+        breaker = self._get_breaker(upstream)
+        breaker.before_request()
+        bulkhead = self._get_bulkhead(upstream)
+        try:
+            await asyncio.wait_for(
+                bulkhead.acquire(), timeout=app_config.http_bulkhead_wait_sec
+            )
+        except asyncio.TimeoutError:
+            breaker.release()
+            stats.bulkhead_rejected_total += 1
+            raise HttpBulkheadFullError(upstream)
+        except BaseException:
+            breaker.release()
+            raise
+        stats.requests_total += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        extra = {} if verify_ssl is None else {"ssl": verify_ssl}
+        try:
+            async with session.request(
+                method, url, timeout=timeout, **kwargs, **extra
+            ) as response:
+                body = await response.read()
+                result = HttpTransportResponse(
+                    status=response.status,
+                    url=str(response.url),
+                    headers=dict(response.headers),
+                    body=body,
+                )
+        except asyncio.TimeoutError:
+            stats.timeouts_total += 1
+            breaker.record_failure()
+            raise
+        except aiohttp.ClientError:
+            stats.errors_total += 1
+            breaker.record_failure()
+            raise
+        except BaseException:
+            breaker.release()
+            raise
+        finally:
+            stats.in_flight -= 1
+            bulkhead.release()
+        # 4xx — ошибка запроса, а не сервиса: на состояние цепи не влияет
+        if result.status >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return result
+
+    def _should_retry(self, upstream: str, attempt: int, attempts: int) -> bool:
+        # Разомкнутая цепь отклонит повтор: отдаем настоящую ошибку сервиса
+        return attempt < attempts and not self._get_breaker(upstream).is_open
+
+    async def _wait_retry(self, upstream: str, attempt: int, reason: str) -> None:
+        self._stats[upstream].retries_total += 1
+        delay = backoff_delay(
+            attempt,
+            base_delay=app_config.http_retry_base_delay_sec,
+            max_delay=app_config.http_retry_max_delay_sec,
+        )
+        logger.warning(
+            f"Запрос к {upstream} не удался ({reason}), "
+            f"повтор {attempt} через {delay * 1000:.0f} мс"
+        )
+        await asyncio.sleep(delay)
+
+    async def post(self, upstream: str, url: str, **kwargs) -> HttpTransportResponse:
+        return await self.request(upstream, "POST", url, **kwargs)
+
+    async def get(self, upstream: str, url: str, **kwargs) -> HttpTransportResponse:
+        return await self.request(upstream, "GET", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {
+            upstream: {**stats.as_dict(), **self._get_breaker(upstream).as_dict()}
+            for upstream, stats in self._stats.items()
+        }
+
+    async def close(self) -> None:
+        """Закрывает все пулы соединений (вызывается при остановке приложения)."""
+        for session in self._sessions.values():
+            if not session.closed:
+                await session.close()
+        self._sessions.clear()
+
+
+http_transport = HttpTransport()
@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TtlCache(Generic[V]):
+    """
+    Кэш в памяти процесса с ограничением по времени жизни и размеру (LRU).
+
+    Предназначен для горячего пути запроса: операции синхронные и не
+    обращаются к сети. Каждый воркер держит свою копию, поэтому TTL
+    должен быть коротким — он же ограничивает устаревание данных
+    между воркерами.
+    """
+
+    def __init__(self, max_size: int, default_ttl: float) -> None:
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self._items: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        item = self._items.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            self.misses += 1
+            return None
+        self._items.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        self._items[key] = (time.monotonic() + ttl, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._items.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[V], bool]) -> int:
+        """Удаляет все значения, подходящие под условие. Возвращает их количество."""
+        keys = [key for key, (_, value) in self._items.items() if predicate(value)]
+        for key in keys:
+            del self._items[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._items),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -1,19 +1,168 @@
-from redis import Redis
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+from redis.asyncio import BlockingConnectionPool, ConnectionPool, Redis
+from redis.asyncio.client import Pipeline, PubSub
+from redis.commands.core import AsyncScript
+from redis.asyncio.lock import Lock
+from redis.exceptions import RedisError
 
 from app.infrastructure.config import app_config
 
+logger = logging.getLogger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
 
-def get_redis_client():
+def get_redis_pool() -> ConnectionPool:
     """
-    Создаем экземпляр клиента Redis.
+    Создаем пул соединений Redis, размер которого задается в конфигурации.
+    Когда все соединения заняты, запрос ждет свободное до
+    `redis_pool_timeout_sec`, а не падает сразу.
     """
-    return Redis(
+    return BlockingConnectionPool(
         host=app_config.redis_host,
         port=app_config.redis_port,
         password=app_config.redis_password,
         db=app_config.redis_db,
         decode_responses=True,
+        max_connections=app_config.redis_pool_size,
+        timeout=app_config.redis_pool_timeout_sec,
+        socket_timeout=app_config.redis_socket_timeout_sec,
+        socket_connect_timeout=app_config.redis_socket_connect_timeout_sec,
+        health_check_interval=app_config.redis_health_check_interval_sec,
     )
 
 
-redis_client = get_redis_client()
+def get_redis_client(pool: ConnectionPool) -> Redis:
+    """
+    Создаем асинхронный клиент Redis поверх общего пула соединений.
+    """
+    return Redis(connection_pool=pool)
+
+
+redis_pool = get_redis_pool()
+redis_client = get_redis_client(redis_pool)
+
+
+class RedisCache:
+    """
+    Небольшой типизированный API кэша поверх асинхронного клиента Redis.
+
+    Все ключи получают общий префикс, чтобы кэши разных подсистем
+    (токены SAP, договоры, справочники) не пересекались.
+    """
+
+    def __init__(self, client: Redis = redis_client, prefix: str = "") -> None:
+        self.client = client
+        self.prefix = prefix
+
+    def key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        return await self.client.get(self.key(key))
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None) -> bool:
+        return bool(await self.client.set(self.key(key), value, ex=ttl))
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        return bool(await self.client.setex(self.key(key), ttl, value))
+
+    async def mget(self, keys: Sequence[str]) -> List[Optional[str]]:
+        if not keys:
+            return []
+        return await self.client.mget([self.key(key) for key in keys])
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self.client.delete(*[self.key(key) for key in keys])
+
+    async def ttl(self, key: str) -> int:
+        return await self.client.ttl(self.key(key))
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        return await self.client.hgetall(self.key(key))
+
+    async def incr(self, key: str) -> int:
+        return await self.client.incr(self.key(key))
+
+    async def lpush(self, key: str, *values: str) -> int:
+        return await self.client.lpush(self.key(key), *values)
+
+    async def brpop(self, key: str, timeout: float) -> Optional[str]:
+        """Блокирующее чтение из очереди; None, если за `timeout` ничего не пришло."""
+        item = await self.client.brpop([self.key(key)], timeout=timeout)
+        return item[1] if item else None
+
+    async def rpop(self, key: str, count: int) -> List[str]:
+        """Неблокирующее чтение до `count` элементов из очереди."""
+        items = await self.client.rpop(self.key(key), count)
+        return items or []
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self.client.publish(self.key(channel), message)
+
+    def pubsub(self) -> PubSub:
+        """
+        Подписка на каналы. Отдельное соединение из пула, имена каналов
+        нужно оборачивать через `key()`.
+        """
+        return self.client.pubsub()
+
+    async def get_json(self, key: str) -> Optional[Any]:
+        value = await self.get(key)
+        return json.loads(value) if value is not None else None
+
+    async def set_json(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        return await self.set(key, json.dumps(value, default=str), ttl=ttl)
+
+    async def get_model(self, key: str, model: Type[M]) -> Optional[M]:
+        value = await self.get(key)
+        return model.model_validate_json(value) if value is not None else None
+
+    async def set_model(
+        self, key: str, value: BaseModel, ttl: Optional[int] = None
+    ) -> bool:
+        return await self.set(key, value.model_dump_json(), ttl=ttl)
+
+    def lock(
+        self, key: str, timeout: float, blocking_timeout: Optional[float] = None
+    ) -> Lock:
+        """Распределенная блокировка между воркерами (SET NX с истечением)."""
+        return self.client.lock(
+            self.key(key), timeout=timeout, blocking_timeout=blocking_timeout
+        )
+
+    def script(self, lua: str) -> AsyncScript:
+        """
+        Lua-скрипт для атомарных операций (EVALSHA с откатом на EVAL).
+        Ключи, передаваемые в `keys`, нужно оборачивать через `key()`.
+        """
+        return self.client.register_script(lua)
+
+    def pipeline(self, transaction: bool = True) -> Pipeline:
+        """
+        Пакет команд за один сетевой проход. Ключи внутри пакета нужно
+        оборачивать через `key()`, чтобы применился префикс.
+        """
+        return self.client.pipeline(transaction=transaction)
+
+    async def health_check(self) -> bool:
+        try:
+            return bool(await self.client.ping())
+        except RedisError as e:
+            logger.error(f"Redis недоступен: {e}")
+            return False
+
+
+redis_cache = RedisCache()
+
+
+async def close_redis() -> None:
+    """Закрывает клиент и пул соединений (вызывается при остановке приложения)."""
+    await redis_client.aclose()
+    await redis_pool.aclose()
@@ -0,0 +1,171 @@
+from typing import Any, Dict, Sequence, Tuple
+
+from sqlalchemy import func, literal
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.infrastructure.config import app_config
+from app.shared.app_constants import AppTableNames
+
+# Вычисляемая колонка с поисковым документом сущности
+SEARCH_DOCUMENT_COLUMN = "search_document"
+
+# Спецсимволы булева режима MySQL FULLTEXT
+MYSQL_BOOLEAN_OPERATORS = '+-<>()~*"@'
+# innodb_ft_min_token_size по умолчанию: более короткие слова не индексируются
+MYSQL_FT_MIN_TOKEN_SIZE = 3
+
+
+class SearchRegistry:
+    """
+    Реестр полей строкового поиска по сущностям.
+
+    Из перечисленных полей собирается хранимая вычисляемая колонка
+    `search_document` (нижний регистр, поля через пробел), по которой
+    построен индекс: в PostgreSQL — GIN с pg_trgm (подстрочный поиск
+    LIKE '%...%' и релевантность через word_similarity), в MySQL —
+    FULLTEXT (MATCH ... AGAINST в булевом режиме).
+
+    FULLTEXT ищет только по началу слов, поэтому в MySQL строки с цифрами
+    (ИИН, БИН, телефоны, номера SAP) и слишком короткие слова ищутся
+    подстрокой LIKE '%...%' без индекса, как до появления FULLTEXT.
+    """
+
+    def __init__(self) -> None:
+        self._columns: Dict[str, Tuple[str, ...]] = {}
+
+    @property
+    def is_mysql(self) -> bool:
+        return app_config.app_database.lower() == "mysql"
+
+    def register(self, table_name: str, columns: Sequence[str]) -> None:
+        self._columns[table_name] = tuple(columns)
+
+    def get_columns(self, table_name: str) -> Tuple[str, ...]:
+        return self._columns[table_name]
+
+    def document_expression(self, table_name: str) -> str:
+        """SQL-выражение вычисляемой колонки `search_document`."""
+        columns = self.get_columns(table_name)
+        if self.is_mysql:
+            return f"lower(concat_ws(' ', {', '.join(columns)}))"
+        return "lower({})".format(
+            " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        )
+
+    def condition(self, model: Any, search: str) -> ColumnElement:
+        """Условие поиска по индексированному документу."""
+        document = getattr(model, SEARCH_DOCUMENT_COLUMN)
+        if self.is_mysql and not self._is_substring_search(search):
+            return self._match(document, search)
+        return document.like(f"%{self._escape_like(search)}%", escape="\\")
+
+    def relevance(self, model: Any, search: str) -> ColumnElement:
+        """Релевантность документа поисковой строке (больше — выше)."""
+        document = getattr(model, SEARCH_DOCUMENT_COLUMN)
+        if self.is_mysql:
+            if self._is_substring_search(search):
+                # Чем раньше подстрока в документе, тем выше
+                return -func.locate(literal(search.strip().lower()), document)
+            return self._match(document, search)
+        return func.word_similarity(literal(search.strip().lower()), document)
+
+    @staticmethod
+    def _escape_like(search: str) -> str:
+        search = search.strip().lower()
+        for symbol in ("\\", "%", "_"):
+            search = search.replace(symbol, f"\\{symbol}")
+        return search
+
+    @staticmethod
+    def _is_substring_search(search: str) -> bool:
+        """Поиск, который FULLTEXT MySQL не обслужит: цифры или короткие слова."""
+        words = search.split()
+        return not words or any(
+            len(word) < MYSQL_FT_MIN_TOKEN_SIZE
+            or any(symbol.isdigit() for symbol in word)
+            for word in words
+        )
+
+    @staticmethod
+    def _match(document: Any, search: str) -> ColumnElement:
+        # Каждое слово обязательно и ищется по префиксу: "+слово*"
+        cleaned = "".join(
+            " " if symbol in MYSQL_BOOLEAN_OPERATORS else symbol
+            for symbol in search.lower()
+        )
+        against = " ".join(f"+{word}*" for word in cleaned.split())
+        return match(document, against=against).in_boolean_mode()
+
+
+search_registry = SearchRegistry()
+
+search_registry.register(
+    AppTableNames.OrderTableName,
+    [
+        "status",
+        "factory_sap_id",
+        "workshop_sap_id",
+        "material_sap_id",
+        "zakaz",
+        "txn_id",
+        "iin",
+        "owner_sid",
+        "owner_username",
+        "owner_email",
+        "owner_mobile",
+        "name",
+        "adr_index",
+        "adr_city",
+        "adr_str",
+        "adr_dom",
+        "bin",
+        "dogovor",
+        "canceled_by_sid",
+    ],
+)
+search_registry.register(
+    AppTableNames.FileTableName, ["filename", "file_path", "content_type"]
+)
+search_registry.register(
+    AppTableNames.UserTableName,
+    [
+        "sid",
+        "iin",
+        "name",
+        "given_name",
+        "family_name",
+        "preferred_username",
+        "email",
+        "phone",
+        "tabn",
+    ],
+)
+search_registry.register(AppTableNames.OrganizationEmployeeTableName, ["bin", "sid"])
+search_registry.register(
+    AppTableNames.VehicleTableName, ["registration_number", "car_model", "vehicle_info"]
+)
+search_registry.register(
+    AppTableNames.VerifiedUserTableName,
+    ["sid", "iin", "verified_by", "verified_by_sid", "description", "response"],
+)
+search_registry.register(
+    AppTableNames.OrganizationTableName,
+    ["full_name", "short_name", "bin", "bik", "kbe", "email", "phone", "address"],
+)
+search_registry.register(
+    AppTableNames.VerifiedVehicleTableName,
+    ["car_number", "verified_by", "verified_by_sid", "description", "response"],
+)
+search_registry.register(
+    AppTableNames.EmployeeRequestTableName,
+    [
+        "employee_name",
+        "employee_email",
+        "employee_sid",
+        "organization_full_name",
+        "organization_bin",
+        "owner_name",
+        "owner_sid",
+    ],
+)
@@ -1,13 +1,36 @@
+import asyncio
+import hashlib
 import os
 import uuid
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from fastapi import HTTPException, UploadFile
+from fastapi import HTTPException, Request, UploadFile
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import Response
 
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.http_cache_core import (
+    PRIVATE_REVALIDATE_CACHE_CONTROL,
+    CachedFileResponse,
+    content_etag,
+    format_http_date,
+    is_fresh,
+    not_modified_response,
+    requested_range,
+)
 from app.entities import FileModel
 from app.infrastructure.config import app_config
+from app.infrastructure.services.file_storage import (
+    file_storage,
+    make_storage_key,
+    storage_key_lock,
+)
+from app.infrastructure.services.image_variant_service import (
+    ImageVariant,
+    image_variant_service,
+)
+from app.infrastructure.unit_of_work import is_commit_deferred
 from app.shared.app_file_constants import AppFileExtensionConstants
 
 
@@ -16,10 +39,19 @@ class FileService:
     ALLOWED_EXTENSIONS: dict = AppFileExtensionConstants.ALL_EXTENSIONS
     NOT_ALLOWED_EXTENSIONS = app_config.not_allowed_extensions
     MAX_FILE_SIZE_MB = app_config.app_upload_max_file_size_mb
+    # Размер порции при потоковой записи загрузки на диск
+    CHUNK_SIZE = 1024 * 1024
+    # Загрузки пишутся сюда, пока не известен хеш содержимого
+    TEMP_FOLDER = os.path.join(UPLOAD_FOLDER, "tmp")
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
+    @staticmethod
+    def generate_temp_path() -> str:
+        os.makedirs(FileService.TEMP_FOLDER, exist_ok=True)
+        return os.path.join(FileService.TEMP_FOLDER, uuid.uuid4().hex)
+
     @staticmethod
     def generate_file_path(filename: str, directory: str) -> str:
         """
@@ -31,7 +63,7 @@ class FileService:
     @staticmethod
     def validate_file(file: UploadFile, extensions=None):
         """
-        Проверяет размер файла и его расширение.
+        Проверяет расширение и размер файла.
         """
         ALLOWED_EXTENSIONS = extensions or FileService.ALLOWED_EXTENSIONS
 
@@ -45,58 +77,131 @@ class FileService:
                 message=f"Недопустимое расширение файла. Допустимы: {list(ALLOWED_EXTENSIONS)}"
             )
 
-        # Проверка размера
-        file.file.seek(0, os.SEEK_END)
-        file_size_mb = file.file.tell() / (1024 * 1024)
-        file.file.seek(0)  # Возврат указателя файла в начало
-        if file_size_mb > FileService.MAX_FILE_SIZE_MB:
+        # Проверка размера до записи: тело запроса уже принято Starlette,
+        # размер известен без чтения файла. write_upload проверяет его
+        # повторно по ходу записи.
+        file_size = file.size
+        if file_size is None:
+            file.file.seek(0, os.SEEK_END)
+            file_size = file.file.tell()
+            file.file.seek(0)  # Возврат указателя файла в начало
+        if file_size > FileService.MAX_FILE_SIZE_MB * 1024 * 1024:
             raise AppExceptionResponse.bad_request(
                 message=f"Файл слишком большой. Максимальный размер: {FileService.MAX_FILE_SIZE_MB} МБ"
             )
 
+    @staticmethod
+    async def write_upload(file: UploadFile, file_path: str) -> Tuple[int, str]:
+        """
+        Пишет загрузку на диск порциями по CHUNK_SIZE, не держа файл целиком
+        в памяти; запись выполняется в пуле потоков, чтобы не блокировать
+        event loop. Лимит размера проверяется по ходу записи, попутно
+        считается SHA-256 содержимого.
+
+        Returns:
+            Tuple[int, str]: Размер в байтах и SHA-256 (hex).
+        """
+        max_size = FileService.MAX_FILE_SIZE_MB * 1024 * 1024
+        digest = hashlib.sha256()
+        size = 0
+        await file.seek(0)
+        output = await asyncio.to_thread(open, file_path, "wb")
+        try:
+            while chunk := await file.read(FileService.CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise AppExceptionResponse.bad_request(
+                        message=f"Файл слишком большой. Максимальный размер: {FileService.MAX_FILE_SIZE_MB} МБ"
+                    )
+                digest.update(chunk)
+                await asyncio.to_thread(output.write, chunk)
+        except BaseException:
+            await asyncio.to_thread(output.close)
+            await asyncio.to_thread(FileService.remove_from_disk, file_path)
+            raise
+        await asyncio.to_thread(output.close)
+        return size, digest.hexdigest()
+
+    @staticmethod
+    def remove_from_disk(file_path: str) -> None:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    @staticmethod
+    def write_content(file_path: str, content: bytes) -> None:
+        with open(file_path, "wb") as f:
+            f.write(content)
+
     async def save_file(
         self, file: UploadFile, uploaded_folder: str, extensions: Optional[dict] = None
     ) -> FileModel:
         """
-        Сохраняет файл в статичной папке и создает запись в базе данных.
+        Сохраняет файл в хранилище по хешу содержимого и создает запись
+        в базе данных. Повторная загрузка того же содержимого не занимает
+        места: запись ссылается на уже сохраненный объект.
+
+        `uploaded_folder` сохранен для совместимости: одинаковые файлы из
+        разных разделов хранятся один раз.
         """
         try:
             # Проверка файла
             FileService.validate_file(file, extensions)
 
-            # Создание папки, если не существует
-            upload_directory = os.path.join(FileService.UPLOAD_FOLDER, uploaded_folder)
-            os.makedirs(upload_directory, exist_ok=True)
-
-            # Генерация пути
-            file_path = FileService.generate_file_path(file.filename, upload_directory)
+            # Потоковое сохранение во временный файл
+            temp_path = FileService.generate_temp_path()
+            file_size, content_hash = await FileService.write_upload(file, temp_path)
 
-            # Сохранение файла
-            with open(file_path, "wb") as f:
-                f.write(await file.read())
-
-            # Создание записи
-            file_record = FileModel(
+            return await self._create_record(
+                temp_path=temp_path,
                 filename=file.filename,
-                file_path=file_path,
-                file_size=os.path.getsize(file_path),
+                file_size=file_size,
                 content_type=file.content_type,
+                content_hash=content_hash,
             )
-            self.db.add(file_record)
-            await self.db.commit()
-            await self.db.refresh(file_record)
-            return file_record
+        except HTTPException:
+            await self._rollback(self.db)
+            raise
         except Exception as exc:
-            await self.db.rollback()  # Откат транзакции в случае ошибки
+            await self._rollback(self.db)  # Откат транзакции в случае ошибки
             raise AppExceptionResponse.internal_error(
                 message="Ошибка при сохранении файла",
                 extra={"filename": file.filename, "details": str(exc)},
                 is_custom=True,
             )
 
+    async def save_content(
+        self,
+        content: bytes,
+        filename: str,
+        uploaded_folder: str,
+        content_type: str,
+    ) -> FileModel:
+        """
+        Сохраняет содержимое, полученное не из формы (например, PDF из SAP),
+        в хранилище по хешу и создает запись в базе данных.
+        """
+        try:
+            temp_path = FileService.generate_temp_path()
+            await asyncio.to_thread(FileService.write_content, temp_path, content)
+            return await self._create_record(
+                temp_path=temp_path,
+                filename=filename,
+                file_size=len(content),
+                content_type=content_type,
+                content_hash=hashlib.sha256(content).hexdigest(),
+            )
+        except Exception as exc:
+            await self._rollback(self.db)
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка при сохранении файла",
+                extra={"filename": filename, "details": str(exc)},
+                is_custom=True,
+            )
+
     async def delete_file(self, file_id: int, db: AsyncSession) -> bool:
         """
-        Удаляет файл с диска и из базы данных.
+        Удаляет запись о файле из базы данных; содержимое удаляется из
+        хранилища, только когда на него не осталось других ссылок.
 
         Args:
             file_id (int): ID файла.
@@ -111,17 +216,18 @@ class FileService:
             if not file_record:
                 raise AppExceptionResponse.not_found(message="Файл не найден")
 
-            # Удаление файла с диска
-            if os.path.exists(file_record.file_path):
-                os.remove(file_record.file_path)
-
-            # Удаление записи из базы данных
+            # Удаление записи из базы данных и, при последней ссылке, содержимого
             await db.delete(file_record)
-            await db.commit()
+            await db.flush()
+            await self._release(
+                db=db,
+                storage_key=file_record.storage_key,
+                file_path=file_record.file_path,
+            )
 
             return True
         except Exception as exc:
-            await db.rollback()  # Откат транзакции в случае ошибки
+            await self._rollback(db)  # Откат транзакции в случае ошибки
             raise AppExceptionResponse.internal_error(
                 message="Ошибка при удалении файла",
                 extra={"file_id": file_id, "details": str(exc)},
@@ -136,7 +242,7 @@ class FileService:
         extensions: Optional[dict] = None,
     ) -> FileModel:
         """
-        Обновляет файл на диске и запись в базе данных.
+        Обновляет содержимое файла и запись в базе данных.
 
         Args:
             file_id (int): ID файла.
@@ -151,38 +257,209 @@ class FileService:
             if not existing_file:
                 raise AppExceptionResponse.not_found(message="Файл не найден")
 
-            # Удаление старого файла
-            if os.path.exists(existing_file.file_path):
-                os.remove(existing_file.file_path)
-
             # Проверка файла
             FileService.validate_file(new_file, extensions)
 
-            # Создание папки, если не существует
-            upload_directory = os.path.join(FileService.UPLOAD_FOLDER, uploaded_folder)
-            os.makedirs(upload_directory, exist_ok=True)
-
-            # Генерация пути для нового файла
-            new_file_path = FileService.generate_file_path(
-                new_file.filename, upload_directory
+            # Потоковое сохранение нового файла во временный файл
+            temp_path = FileService.generate_temp_path()
+            file_size, content_hash = await FileService.write_upload(
+                new_file, temp_path
             )
 
-            # Сохранение нового файла
-            with open(new_file_path, "wb") as f:
-                f.write(await new_file.read())
+            # Старое содержимое освобождается только после записи нового
+            old_storage_key = existing_file.storage_key
+            old_file_path = existing_file.file_path
 
             # Обновление записи в базе данных
-            existing_file.filename = new_file.filename
-            existing_file.file_path = new_file_path
-            existing_file.file_size = os.path.getsize(new_file_path)
-            existing_file.content_type = new_file.content_type
-            await self.db.commit()
-            await self.db.refresh(existing_file)
+            storage_key = self._new_storage_key(content_hash, new_file.filename)
+            async with storage_key_lock(storage_key):
+                await self._put(temp_path, storage_key, new_file.content_type)
+                existing_file.filename = new_file.filename
+                existing_file.file_path = file_storage.locate(storage_key)
+                existing_file.storage_key = storage_key
+                existing_file.file_size = file_size
+                existing_file.content_type = new_file.content_type
+                existing_file.content_hash = content_hash
+                image_variant_service.clear(existing_file)
+                has_variants = await image_variant_service.attach(existing_file)
+                await self.db.flush()
+                await self._commit(self.db)
+            if not has_variants:
+                image_variant_service.schedule(storage_key)
+            await self._release(
+                db=self.db, storage_key=old_storage_key, file_path=old_file_path
+            )
             return existing_file
+        except HTTPException:
+            await self._rollback(self.db)
+            raise
         except Exception as exc:
-            await self.db.rollback()
+            await self._rollback(self.db)
             raise AppExceptionResponse.internal_error(
                 message="Ошибка при обновлении файла",
                 extra={"file_id": file_id, "details": str(exc)},
                 is_custom=True,
             )
+
+    @staticmethod
+    async def exists(file: FileModel) -> bool:
+        """Есть ли содержимое файла в хранилище (или на диске для старых записей)."""
+        if file.storage_key:
+            return await file_storage.exists(file.storage_key)
+        return await asyncio.to_thread(os.path.exists, file.file_path)
+
+    @staticmethod
+    def cache_headers(file: FileModel, suffix: Optional[str] = None) -> Dict[str, str]:
+        """
+        Заголовки кеширования по метаданным FileModel: сильный ETag из хеша
+        содержимого и Last-Modified из даты обновления. Ответы API по id
+        приватны и перепроверяются: содержимое под тем же id может смениться.
+        """
+        headers = {"Cache-Control": PRIVATE_REVALIDATE_CACHE_CONTROL}
+        if file.content_hash:
+            headers["ETag"] = content_etag(file.content_hash, suffix)
+        if file.updated_at:
+            headers["Last-Modified"] = format_http_date(file.updated_at)
+        return headers
+
+    @staticmethod
+    async def response(
+        file: FileModel,
+        request: Optional[Request] = None,
+        media_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        storage_key: Optional[str] = None,
+        suffix: Optional[str] = None,
+    ) -> Response:
+        """
+        Выдача содержимого файла клиенту: 304 для актуальной копии у клиента,
+        частичная выдача по Range. Для производных файлов (копии изображений)
+        передаются свои `storage_key`, `media_type`, `filename` и `suffix` ETag.
+        """
+        headers = FileService.cache_headers(file, suffix)
+        if request and is_fresh(request, headers):
+            return not_modified_response(headers)
+        media_type = media_type or file.content_type
+        filename = filename or file.filename
+        storage_key = storage_key or file.storage_key
+        if storage_key:
+            return await file_storage.response(
+                storage_key,
+                media_type=media_type,
+                filename=filename,
+                headers=headers,
+                http_range=(
+                    requested_range(request, headers.get("ETag")) if request else None
+                ),
+            )
+        return CachedFileResponse(
+            path=file.file_path,
+            media_type=media_type,
+            filename=filename,
+            headers=headers,
+        )
+
+    @staticmethod
+    async def variant_response(
+        file: FileModel, variant: str, request: Optional[Request] = None
+    ) -> Response:
+        """
+        Выдача уменьшенной копии изображения или оригинала изображения, пока
+        копия строится. Файлы без копий отсекает GetFileContentCase (404).
+        """
+        key = await image_variant_service.find(file, variant)
+        if not key:
+            return await FileService.response(file, request)
+        return await FileService.response(
+            file,
+            request,
+            media_type=ImageVariant.CONTENT_TYPE,
+            filename=image_variant_service.get_filename(file, variant),
+            storage_key=key,
+            suffix=variant,
+        )
+
+    async def _create_record(
+        self,
+        temp_path: str,
+        filename: str,
+        file_size: int,
+        content_type: str,
+        content_hash: str,
+    ) -> FileModel:
+        storage_key = self._new_storage_key(content_hash, filename)
+        async with storage_key_lock(storage_key):
+            await self._put(temp_path, storage_key, content_type)
+            file_record = FileModel(
+                filename=filename,
+                file_path=file_storage.locate(storage_key),
+                storage_key=storage_key,
+                file_size=file_size,
+                content_type=content_type,
+                content_hash=content_hash,
+            )
+            has_variants = await image_variant_service.attach(file_record)
+            self.db.add(file_record)
+            await self.db.flush()
+            await self._commit(self.db)
+        if not has_variants:
+            image_variant_service.schedule(storage_key)
+        return file_record
+
+    def _new_storage_key(self, content_hash: str, filename: str) -> str:
+        """
+        Ключ хранилища для новой записи. При отложенном commit (внешний
+        unit_of_work) блокировка ключа снимается до фиксации записи, и
+        параллельный `_release` того же содержимого, не видя ее, удалил бы
+        объект. Поэтому такие записи получают собственный ключ без
+        дедупликации: другие записи на него не ссылаются.
+        """
+        extension = os.path.splitext(filename)[1]
+        return make_storage_key(
+            content_hash, extension, unique=is_commit_deferred(self.db)
+        )
+
+    @staticmethod
+    async def _put(temp_path: str, storage_key: str, content_type: str) -> None:
+        """Кладет содержимое в хранилище, если его там еще нет (дедупликация)."""
+        if await file_storage.exists(storage_key):
+            await asyncio.to_thread(FileService.remove_from_disk, temp_path)
+            return
+        await file_storage.put(temp_path, storage_key, content_type)
+
+    async def _release(
+        self, db: AsyncSession, storage_key: Optional[str], file_path: str
+    ) -> None:
+        """
+        Освобождает ссылку на содержимое: объект удаляется из хранилища,
+        только если на него не ссылается ни одна запись FileModel.
+        """
+        if is_commit_deferred(db):
+            # Транзакцией управляет внешний блок, и ее commit не гарантирован:
+            # лишний объект в хранилище безопаснее потерянного
+            return
+        if not storage_key:
+            # Файл, сохраненный до перехода на хранилище по хешу
+            await db.commit()
+            await asyncio.to_thread(FileService.remove_from_disk, file_path)
+            return
+        async with storage_key_lock(storage_key):
+            await db.commit()
+            references = await db.scalar(
+                select(func.count())
+                .select_from(FileModel)
+                .where(FileModel.storage_key == storage_key)
+            )
+            if not references:
+                await file_storage.delete(storage_key)
+                await image_variant_service.delete(storage_key)
+
+    @staticmethod
+    async def _commit(db: AsyncSession) -> None:
+        if not is_commit_deferred(db):
+            await db.commit()
+
+    @staticmethod
+    async def _rollback(db: AsyncSession) -> None:
+        if not is_commit_deferred(db):
+            await db.rollback()
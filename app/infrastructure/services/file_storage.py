@@ -0,0 +1,300 @@
+import asyncio
+import logging
+import os
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Iterator, Optional
+from urllib.parse import quote
+
+import boto3
+from botocore.exceptions import ClientError
+from redis.exceptions import LockError, RedisError
+from starlette import status
+from starlette.responses import Response, StreamingResponse
+
+from app.core.http_cache_core import CachedFileResponse, IMMUTABLE_CACHE_CONTROL
+from app.infrastructure.config import app_config
+from app.infrastructure.redis_client import redis_cache
+
+logger = logging.getLogger(__name__)
+
+# Подпапка хранилища по хешу внутри папки загрузок
+CONTENT_ADDRESSED_FOLDER = "cas"
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def make_storage_key(content_hash: str, extension: str, unique: bool = False) -> str:
+    """
+    Ключ содержимого: SHA-256, разложенный по подпапкам из первых байтов
+    хеша (ab/cd/abcd...ext), чтобы в одной папке не копились тысячи файлов.
+    `unique` — собственный ключ без дедупликации с другими записями.
+    """
+    name = f"{content_hash}-{uuid.uuid4().hex}" if unique else content_hash
+    return f"{content_hash[:2]}/{content_hash[2:4]}/{name}{extension.lower()}"
+
+
+def content_disposition(filename: str, disposition_type: str = "attachment") -> str:
+    """
+    Заголовок Content-Disposition как у FileResponse Starlette: заголовки
+    кодируются в latin-1, поэтому имена не из ASCII (кириллица) передаются
+    через filename* по RFC 5987.
+    """
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition_type}; filename*=utf-8''{quoted}"
+    return f'{disposition_type}; filename="{filename}"'
+
+
+class FileStorage(ABC):
+    """
+    Хранилище содержимого файлов по ключу make_storage_key.
+
+    Одинаковые загрузки получают один ключ и хранятся один раз; учет ссылок
+    ведет FileService по записям FileModel с тем же `storage_key`.
+    """
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool: ...
+
+    @abstractmethod
+    async def put(self, source_path: str, key: str, content_type: str) -> None:
+        """Переносит временный файл в хранилище; исходный файл удаляется."""
+
+    @abstractmethod
+    async def write(self, key: str, content: bytes, content_type: str) -> None:
+        """Записывает содержимое из памяти (производные файлы, например превью)."""
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def locate(self, key: str) -> str:
+        """Значение FileModel.file_path: путь на диске или URL объекта."""
+
+    @abstractmethod
+    async def response(
+        self,
+        key: str,
+        media_type: str,
+        filename: str,
+        headers: Optional[Dict[str, str]] = None,
+        http_range: Optional[str] = None,
+    ) -> Response:
+        """
+        Потоковая выдача содержимого клиенту с заголовками кеширования;
+        `http_range` — заголовок Range, если частичная выдача применима.
+        """
+
+
+class LocalFileStorage(FileStorage):
+    """Хранилище в папке загрузок, раздаваемой через /static."""
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def locate(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(os.path.exists, self.locate(key))
+
+    async def put(self, source_path: str, key: str, content_type: str) -> None:
+        await asyncio.to_thread(self._move, source_path, self.locate(key))
+
+    async def write(self, key: str, content: bytes, content_type: str) -> None:
+        await asyncio.to_thread(self._write, self.locate(key), content)
+
+    async def read(self, key: str) -> bytes:
+        return await asyncio.to_thread(self._read, self.locate(key))
+
+    async def delete(self, key: str) -> None:
+        path = self.locate(key)
+        if await asyncio.to_thread(os.path.exists, path):
+            await asyncio.to_thread(os.remove, path)
+
+    async def response(
+        self,
+        key: str,
+        media_type: str,
+        filename: str,
+        headers: Optional[Dict[str, str]] = None,
+        http_range: Optional[str] = None,
+    ) -> Response:
+        # Range и If-Range FileResponse разбирает сам из запроса
+        return CachedFileResponse(
+            path=self.locate(key),
+            media_type=media_type,
+            filename=filename,
+            headers=headers,
+        )
+
+    @staticmethod
+    def _move(source_path: str, target_path: str) -> None:
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        # os.replace атомарен: читатели видят либо старый, либо целый файл
+        os.replace(source_path, target_path)
+
+    @staticmethod
+    def _write(target_path: str, content: bytes) -> None:
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        temp_path = f"{target_path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, target_path)
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+
+class S3FileStorage(FileStorage):
+    """S3-совместимое хранилище (MinIO локально); boto3 вызывается в потоках."""
+
+    def __init__(self) -> None:
+        self.bucket = app_config.s3_bucket
+        self.public_url = (
+            app_config.s3_public_url or app_config.s3_endpoint_url or ""
+        ).rstrip("/")
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=app_config.s3_endpoint_url,
+            aws_access_key_id=app_config.s3_access_key,
+            aws_secret_access_key=app_config.s3_secret_key,
+            region_name=app_config.s3_region,
+        )
+
+    def locate(self, key: str) -> str:
+        return f"{self.public_url}/{self.bucket}/{key}"
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await asyncio.to_thread(
+                self.client.head_object, Bucket=self.bucket, Key=key
+            )
+            return True
+        except ClientError:
+            return False
+
+    async def put(self, source_path: str, key: str, content_type: str) -> None:
+        try:
+            await asyncio.to_thread(
+                self.client.upload_file,
+                source_path,
+                self.bucket,
+                key,
+                ExtraArgs={
+                    "ContentType": content_type,
+                    "CacheControl": IMMUTABLE_CACHE_CONTROL,
+                },
+            )
+        finally:
+            await asyncio.to_thread(os.remove, source_path)
+
+    async def write(self, key: str, content: bytes, content_type: str) -> None:
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self.bucket,
+            Key=key,
+            Body=content,
+            ContentType=content_type,
+            CacheControl=IMMUTABLE_CACHE_CONTROL,
+        )
+
+    async def read(self, key: str) -> bytes:
+        obj = await asyncio.to_thread(
+            self.client.get_object, Bucket=self.bucket, Key=key
+        )
+        return await asyncio.to_thread(obj["Body"].read)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=key)
+
+    async def response(
+        self,
+        key: str,
+        media_type: str,
+        filename: str,
+        headers: Optional[Dict[str, str]] = None,
+        http_range: Optional[str] = None,
+    ) -> Response:
+        headers = {
+            **(headers or {}),
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": content_disposition(filename),
+        }
+        params = {"Bucket": self.bucket, "Key": key}
+        if http_range:
+            params["Range"] = http_range
+        try:
+            obj = await asyncio.to_thread(self.client.get_object, **params)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "InvalidRange":
+                raise
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": "bytes */*"},
+            )
+        headers["Content-Length"] = str(obj["ContentLength"])
+        status_code = status.HTTP_200_OK
+        if obj.get("ContentRange"):
+            headers["Content-Range"] = obj["ContentRange"]
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+        return StreamingResponse(
+            self._iter_body(obj),
+            status_code=status_code,
+            media_type=media_type,
+            headers=headers,
+        )
+
+    @staticmethod
+    async def _iter_body(obj: dict) -> AsyncIterator[bytes]:
+        chunks: Iterator[bytes] = obj["Body"].iter_chunks(STREAM_CHUNK_SIZE)
+        while chunk := await asyncio.to_thread(next, chunks, b""):
+            yield chunk
+
+
+@asynccontextmanager
+async def storage_key_lock(key: str) -> AsyncIterator[None]:
+    """
+    Блокировка ключа между воркерами: запись нового содержимого и удаление
+    последней ссылки не должны пересекаться. Без Redis работаем без нее.
+    """
+    try:
+        lock = redis_cache.lock(
+            f"file_storage:{key}",
+            timeout=app_config.file_storage_lock_timeout_sec,
+            blocking_timeout=app_config.file_storage_lock_timeout_sec,
+        )
+        acquired = await lock.acquire()
+    except RedisError as e:
+        logger.warning(f"Redis недоступен, файл {key} без блокировки: {e}")
+        yield
+        return
+    try:
+        yield
+    finally:
+        if acquired:
+            try:
+                await lock.release()
+            except (LockError, RedisError):
+                pass
+
+
+def get_file_storage() -> FileStorage:
+    if app_config.file_storage_backend.lower() == "s3":
+        return S3FileStorage()
+    return LocalFileStorage(
+        root=os.path.join(
+            app_config.static_folder,
+            app_config.upload_folder,
+            CONTENT_ADDRESSED_FOLDER,
+        )
+    )
+
+
+file_storage = get_file_storage()
@@ -0,0 +1,176 @@
+import asyncio
+import io
+import logging
+import os
+from typing import Dict, Optional, Set
+
+from PIL import Image, ImageOps
+from sqlalchemy import update
+
+from app.entities import FileModel
+from app.infrastructure.config import app_config
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.services.file_storage import file_storage, storage_key_lock
+from app.shared.app_file_constants import AppFileExtensionConstants
+
+logger = logging.getLogger(__name__)
+
+
+class ImageVariant:
+    THUMBNAIL = "thumbnail"
+    PREVIEW = "preview"
+
+    CONTENT_TYPE = "image/webp"
+    EXTENSION = ".webp"
+
+    # Вариант -> (колонка FileModel, наибольшая сторона в пикселях)
+    ALL = {
+        THUMBNAIL: ("thumbnail_path", app_config.image_thumbnail_size),
+        PREVIEW: ("preview_path", app_config.image_preview_size),
+    }
+
+
+def make_variant_key(storage_key: str, variant: str) -> str:
+    """Ключ копии рядом с оригиналом: ab/cd/<hash>_thumbnail.webp."""
+    base, _ = os.path.splitext(storage_key)
+    return f"{base}_{variant}{ImageVariant.EXTENSION}"
+
+
+class ImageVariantService:
+    """
+    Уменьшенные копии загруженных изображений (thumbnail и preview в webp).
+
+    - Копии строятся в фоне после сохранения файла, чтобы загрузка не ждала
+      Pillow; ресайз выполняется в пуле потоков, число одновременных задач
+      ограничено `image_variant_concurrency`.
+    - Копии хранятся по ключу оригинала, поэтому одинаковые загрузки
+      делят и их; пути записываются во все FileModel с тем же `storage_key`.
+    - Пока копии нет, отдается оригинал, а построение ставится в очередь.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Set[asyncio.Task] = set()
+        self._pending: Set[str] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def is_resizable(file: FileModel) -> bool:
+        if not file.storage_key:
+            return False
+        _, extension = os.path.splitext(file.storage_key)
+        return extension.lower() in AppFileExtensionConstants.RESIZABLE_IMAGE_EXTENSIONS
+
+    @staticmethod
+    def clear(file: FileModel) -> None:
+        """Сбрасывает пути копий при замене содержимого файла."""
+        for column, _ in ImageVariant.ALL.values():
+            setattr(file, column, None)
+
+    async def attach(self, file: FileModel) -> bool:
+        """
+        Проставляет пути копий, если они уже построены для того же
+        содержимого (повторная загрузка). Возвращает False, если копии
+        нужно построить.
+        """
+        if not self.is_resizable(file):
+            return True
+        paths = {}
+        for variant, (column, _) in ImageVariant.ALL.items():
+            key = make_variant_key(file.storage_key, variant)
+            if not await file_storage.exists(key):
+                return False
+            paths[column] = file_storage.locate(key)
+        for column, path in paths.items():
+            setattr(file, column, path)
+        return True
+
+    def schedule(self, storage_key: str) -> None:
+        """Ставит построение копий в фон; повторные вызовы для ключа схлопываются."""
+        if storage_key in self._pending:
+            return
+        self._pending.add(storage_key)
+        task = asyncio.create_task(self._process(storage_key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._pending.clear()
+
+    async def delete(self, storage_key: str) -> None:
+        """Удаляет копии вместе с последней ссылкой на оригинал."""
+        for variant in ImageVariant.ALL:
+            await file_storage.delete(make_variant_key(storage_key, variant))
+
+    async def find(self, file: FileModel, variant: str) -> Optional[str]:
+        """
+        Ключ готовой копии файла; None, если копии еще нет (тогда отдается
+        оригинал, а копия строится в фоне).
+        """
+        if not self.is_resizable(file):
+            return None
+        key = make_variant_key(file.storage_key, variant)
+        if not await file_storage.exists(key):
+            self.schedule(file.storage_key)
+            return None
+        return key
+
+    @staticmethod
+    def get_filename(file: FileModel, variant: str) -> str:
+        name, _ = os.path.splitext(file.filename)
+        return f"{name}_{variant}{ImageVariant.EXTENSION}"
+
+    async def _process(self, storage_key: str) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(app_config.image_variant_concurrency)
+        try:
+            async with self._semaphore:
+                paths = await self._generate(storage_key)
+                if not paths:
+                    return
+                async with AsyncSessionLocal() as session:
+                    await session.execute(
+                        update(FileModel)
+                        .where(FileModel.storage_key == storage_key)
+                        .values(**paths)
+                    )
+                    await session.commit()
+        except Exception as e:
+            logger.warning(f"Не удалось построить копии изображения {storage_key}: {e}")
+        finally:
+            self._pending.discard(storage_key)
+
+    async def _generate(self, storage_key: str) -> Dict[str, str]:
+        # Под блокировкой ключа оригинал не удалят, пока строятся копии
+        async with storage_key_lock(storage_key):
+            if not await file_storage.exists(storage_key):
+                return {}
+            content: Optional[bytes] = None
+            paths = {}
+            for variant, (column, size) in ImageVariant.ALL.items():
+                key = make_variant_key(storage_key, variant)
+                if not await file_storage.exists(key):
+                    if content is None:
+                        content = await file_storage.read(storage_key)
+                    rendered = await asyncio.to_thread(self._render, content, size)
+                    await file_storage.write(key, rendered, ImageVariant.CONTENT_TYPE)
+                paths[column] = file_storage.locate(key)
+            return paths
+
+    @staticmethod
+    def _render(content: bytes, size: int) -> bytes:
+        with Image.open(io.BytesIO(content)) as image:
+            # Фото с телефонов хранят поворот в EXIF
+            image = ImageOps.exif_transpose(image)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+            image.thumbnail((size, size), Image.Resampling.LANCZOS)
+            output = io.BytesIO()
+            image.save(output, format="WEBP", quality=app_config.image_variant_quality)
+            return output.getvalue()
+
+
+image_variant_service = ImageVariantService()
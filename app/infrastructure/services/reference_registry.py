@@ -0,0 +1,235 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.operation.operation_dto import OperationRDTO
+from app.adapters.dto.order_status.order_status_dto import OrderStatusRDTO
+from app.adapters.dto.role.role_dto import RoleRDTO
+from app.adapters.dto.user_type.user_type_dto import UserTypeRDTO
+from app.adapters.repositories.operation.operation_repository import OperationRepository
+from app.adapters.repositories.order_status.order_status_repository import (
+    OrderStatusRepository,
+)
+from app.adapters.repositories.role.role_repository import RoleRepository
+from app.adapters.repositories.user_type.user_type_repository import (
+    UserTypeRepository,
+)
+from app.infrastructure.config import app_config
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.redis_client import redis_cache
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R", bound=BaseModel)
+
+# Канал и счетчик версий справочников, общие для всех воркеров
+REFERENCE_CHANNEL = "reference_data:invalidate"
+REFERENCE_VERSION_KEY = "reference_data:version"
+
+
+@dataclass(frozen=True)
+class ReferenceSnapshot:
+    """
+    Неизменяемый снимок справочников с индексами по id и по значению
+    (в нижнем регистре); подменяется целиком при перезагрузке.
+    """
+
+    version: int = 0
+    order_statuses: Dict[int, OrderStatusRDTO] = field(default_factory=dict)
+    order_statuses_by_value: Dict[str, OrderStatusRDTO] = field(default_factory=dict)
+    operations: Dict[int, OperationRDTO] = field(default_factory=dict)
+    operations_by_value: Dict[str, OperationRDTO] = field(default_factory=dict)
+    roles: Dict[int, RoleRDTO] = field(default_factory=dict)
+    user_types: Dict[int, UserTypeRDTO] = field(default_factory=dict)
+
+
+def index_by(items: Iterable[R], key: Callable[[R], str]) -> Dict[str, R]:
+    """Индекс по ключу в нижнем регистре; при дублях остается первый по id."""
+    index: Dict[str, R] = {}
+    for item in items:
+        index.setdefault(key(item).lower(), item)
+    return index
+
+
+class ReferenceRegistry:
+    """
+    Версионированный реестр справочников в памяти процесса: статусы заказа,
+    операции, роли и типы пользователей.
+
+    - Загружается при старте приложения (после сидеров) и далее отвечает
+      на поиск по id/value из словарей без обращения к БД.
+    - Админские CRUD-операции вызывают `invalidate()`: реестр текущего
+      воркера перечитывается сразу, версия в Redis увеличивается, а
+      остальные воркеры получают уведомление через pub/sub.
+    - Раз в `reference_data_refresh_sec` версия сверяется с Redis на
+      случай пропущенного уведомления.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[ReferenceSnapshot] = None
+        self._lock = asyncio.Lock()
+        self._listen_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version if self._snapshot else 0
+
+    async def start(self) -> None:
+        try:
+            await self.reload(version=await self._get_remote_version())
+        except Exception as e:
+            # Справочники подгрузятся при первом обращении
+            logger.warning(f"Не удалось загрузить справочники при старте: {e}")
+        if self._listen_task is None or self._listen_task.done():
+            self._listen_task = asyncio.create_task(self._listen())
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        for task in (self._listen_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._listen_task = None
+        self._refresh_task = None
+
+    async def reload(self, version: Optional[int] = None) -> None:
+        """Перечитывает все справочники из БД и атомарно подменяет снимок."""
+        async with self._lock:
+            async with AsyncSessionLocal() as session:
+                snapshot = await self._load(session, version=version or self.version)
+            self._snapshot = snapshot
+
+    async def invalidate(self) -> None:
+        """
+        Вызывается после изменения справочника: перечитывает реестр текущего
+        воркера и уведомляет остальные воркеры.
+        """
+        version = self.version + 1
+        try:
+            version = int(await redis_cache.incr(REFERENCE_VERSION_KEY))
+            await redis_cache.publish(
+                REFERENCE_CHANNEL, json.dumps({"version": version})
+            )
+        except RedisError as e:
+            logger.warning(f"Не удалось разослать сброс справочников: {e}")
+        await self.reload(version=version)
+
+    # Поиск по справочникам
+
+    async def get_order_status_by_value(self, value: str) -> Optional[OrderStatusRDTO]:
+        snapshot = await self._get_snapshot()
+        return snapshot.order_statuses_by_value.get(value.lower())
+
+    async def get_order_statuses_by_values(
+        self, values: Iterable[str], only_active: bool = True
+    ) -> List[OrderStatusRDTO]:
+        snapshot = await self._get_snapshot()
+        order_statuses = [
+            snapshot.order_statuses_by_value.get(value.lower()) for value in values
+        ]
+        # status — признак активности статуса заказа
+        return [
+            order_status
+            for order_status in order_statuses
+            if order_status and (not only_active or order_status.status)
+        ]
+
+    async def get_operation_by_value(self, value: str) -> Optional[OperationRDTO]:
+        snapshot = await self._get_snapshot()
+        return snapshot.operations_by_value.get(value.lower())
+
+    async def get_operation(self, id: int) -> Optional[OperationRDTO]:
+        snapshot = await self._get_snapshot()
+        return snapshot.operations.get(id)
+
+    async def get_role(self, id: int) -> Optional[RoleRDTO]:
+        snapshot = await self._get_snapshot()
+        return snapshot.roles.get(id)
+
+    async def get_user_type(self, id: int) -> Optional[UserTypeRDTO]:
+        snapshot = await self._get_snapshot()
+        return snapshot.user_types.get(id)
+
+    # Внутреннее
+
+    async def _get_snapshot(self) -> ReferenceSnapshot:
+        if self._snapshot is None:
+            await self.reload()
+        return self._snapshot
+
+    @staticmethod
+    async def _load(session: AsyncSession, version: int) -> ReferenceSnapshot:
+        order_statuses = [
+            OrderStatusRDTO.from_orm(item)
+            for item in await OrderStatusRepository(session).get_all(order_by="id")
+        ]
+        operations = [
+            OperationRDTO.from_orm(item)
+            for item in await OperationRepository(session).get_all(order_by="id")
+        ]
+        roles = [
+            RoleRDTO.from_orm(item)
+            for item in await RoleRepository(session).get_all(order_by="id")
+        ]
+        user_types = [
+            UserTypeRDTO.from_orm(item)
+            for item in await UserTypeRepository(session).get_all(order_by="id")
+        ]
+        return ReferenceSnapshot(
+            version=version,
+            order_statuses={item.id: item for item in order_statuses},
+            order_statuses_by_value=index_by(order_statuses, lambda item: item.value),
+            operations={item.id: item for item in operations},
+            operations_by_value=index_by(operations, lambda item: item.value),
+            roles={item.id: item for item in roles},
+            user_types={item.id: item for item in user_types},
+        )
+
+    async def _get_remote_version(self) -> int:
+        try:
+            version = await redis_cache.get(REFERENCE_VERSION_KEY)
+        except RedisError as e:
+            logger.warning(f"Версия справочников недоступна в Redis: {e}")
+            return self.version
+        return int(version) if version else 0
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with redis_cache.pubsub() as pubsub:
+                    await pubsub.subscribe(redis_cache.key(REFERENCE_CHANNEL))
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        version = int(json.loads(message["data"])["version"])
+                        if version > self.version:
+                            await self.reload(version=version)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Подписка на сброс справочников прервана: {e}")
+                await asyncio.sleep(app_config.reference_data_resubscribe_sec)
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(app_config.reference_data_refresh_sec)
+            try:
+                version = await self._get_remote_version()
+                if self._snapshot is None or version != self.version:
+                    await self.reload(version=version)
+            except Exception as e:
+                logger.warning(f"Фоновая сверка справочников не удалась: {e}")
+
+
+reference_registry = ReferenceRegistry()
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Set
+
+from redis.exceptions import RedisError
+
+from app.adapters.dto.sap.sap_contract_dto import (
+    SapContractCacheDTO,
+    SapContractForResponseDTO,
+)
+from app.infrastructure.api_clients.sap.sap_get_contract_client import (
+    SapGetContractApiClient,
+)
+from app.infrastructure.config import app_config
+from app.infrastructure.redis_client import redis_cache
+
+logger = logging.getLogger(__name__)
+
+# Сброс записи: поколение БИН растет, запись удаляется
+INVALIDATE_SCRIPT = redis_cache.script(
+    """
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[1])
+    redis.call('DEL', KEYS[1])
+    return 1
+    """
+)
+
+# Запись ответа SAP, только если с начала запроса поколение не менялось
+STORE_SCRIPT = redis_cache.script(
+    """
+    if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+        return 0
+    end
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+    """
+)
+
+
+class SapContractCache:
+    """
+    Кэш договоров организации из SAP 083 по БИН (stale-while-revalidate).
+
+    - Запись моложе `sap_083_contract_cache_ttl_sec` отдается как есть.
+    - Более старая отдается сразу, а обновление из SAP идет в фоне; если SAP
+      недоступен, клиент продолжает видеть последние известные остатки.
+    - Через `sap_083_contract_cache_stale_sec` запись удаляется Redis'ом,
+      и следующий запрос ждет SAP. Одновременные промахи по одному БИН
+      в процессе делят один вызов.
+    - После создания заказа в SAP остатки договора меняются: запись
+      сбрасывается через invalidate. Invalidate может прийти из другого
+      процесса (воркер outbox), поэтому запросы, начатые до него, сверяют
+      поколение БИН в Redis и свой ответ не сохраняют.
+    - Без Redis договоры запрашиваются у SAP напрямую.
+    """
+
+    def __init__(self) -> None:
+        self.client = SapGetContractApiClient()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refresh_errors = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def cache_key(bin: str) -> str:
+        return f"sap_contracts:{bin}"
+
+    @staticmethod
+    def generation_key(bin: str) -> str:
+        return f"sap_contracts_generation:{bin}"
+
+    async def get(self, bin: str) -> List[SapContractForResponseDTO]:
+        try:
+            entry = await redis_cache.get_model(
+                self.cache_key(bin), SapContractCacheDTO
+            )
+        except (RedisError, ValueError) as e:
+            logger.warning(f"Кэш договоров SAP недоступен: {e}")
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return await self._fetch(bin)
+        if time.time() - entry.fetched_at < app_config.sap_083_contract_cache_ttl_sec:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+            self._refresh_in_background(bin)
+        return entry.contracts
+
+    async def invalidate(self, bin: str) -> None:
+        self.invalidations += 1
+        try:
+            await INVALIDATE_SCRIPT(
+                keys=[
+                    redis_cache.key(self.cache_key(bin)),
+                    redis_cache.key(self.generation_key(bin)),
+                ],
+                # Поколение живет дольше любого запроса к SAP
+                args=[int(app_config.sap_083_contract_cache_stale_sec)],
+            )
+        except RedisError as e:
+            logger.warning(f"Кэш договоров SAP по БИН {bin} не сброшен: {e}")
+
+    async def stop(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._inflight.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refresh_errors": self.refresh_errors,
+            "invalidations": self.invalidations,
+            "refreshing": len(self._inflight),
+        }
+
+    async def _fetch(self, bin: str) -> List[SapContractForResponseDTO]:
+        task = self._inflight.get(bin)
+        if task is None:
+            task = asyncio.create_task(self._load(bin))
+            self._inflight[bin] = task
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: self._inflight.pop(bin, None))
+        # shield: отмена одного запроса не прерывает вызов для остальных
+        return await asyncio.shield(task)
+
+    def _refresh_in_background(self, bin: str) -> None:
+        if bin in self._inflight:
+            return
+        task = asyncio.create_task(self._refresh(bin))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, bin: str) -> None:
+        try:
+            await self._fetch(bin)
+        except Exception as e:
+            self.refresh_errors += 1
+            logger.warning(f"Договоры SAP по БИН {bin} не обновлены: {e}")
+
+    async def _load(self, bin: str) -> List[SapContractForResponseDTO]:
+        generation = await self._get_generation(bin)
+        contracts = await self.client.get_organization_contracts_by_bin_response(bin)
+        if generation is None:
+            return contracts
+        entry = SapContractCacheDTO(fetched_at=time.time(), contracts=contracts)
+        try:
+            stored = await STORE_SCRIPT(
+                keys=[
+                    redis_cache.key(self.cache_key(bin)),
+                    redis_cache.key(self.generation_key(bin)),
+                ],
+                args=[
+                    generation,
+                    entry.model_dump_json(),
+                    int(app_config.sap_083_contract_cache_stale_sec),
+                ],
+            )
+            if not stored:
+                # Пока шел запрос, договор изменился: ответ мог устареть
+                logger.info(f"Договоры SAP по БИН {bin} изменились, ответ не кэширован")
+        except RedisError as e:
+            logger.warning(f"Договоры SAP по БИН {bin} не сохранены в кэш: {e}")
+        return contracts
+
+    async def _get_generation(self, bin: str) -> Optional[str]:
+        """Поколение БИН до запроса к SAP; None — без Redis ответ не кэшируем."""
+        try:
+            return await redis_cache.get(self.generation_key(bin)) or "0"
+        except RedisError as e:
+            logger.warning(f"Кэш договоров SAP недоступен: {e}")
+            return None
+
+
+sap_contract_cache = SapContractCache()
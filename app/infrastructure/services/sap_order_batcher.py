@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Set
+
+from app.adapters.dto.sap.create_sap_order_dto import SapStatusDTO
+from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.api_clients.sap.sap_create_order_client import (
+    OUTCOME_UNKNOWN_KEY,
+    SapCreateOrderApiClient,
+    SapOrderData,
+)
+from app.infrastructure.config import app_config
+
+logger = logging.getLogger(__name__)
+
+
+class SapOrderBatcher:
+    """
+    Пакетная отправка заявок в SAP 088.
+
+    - Заявки копятся `sap_088_batch_window_sec` секунд или до
+      `sap_088_batch_size` штук и уходят одним вызовом (один токен, одно
+      соединение), ответ раскладывается по ORDER_ID.
+    - Вызывающий получает SapStatusDTO с единственным элементом своего
+      заказа, как от SapCreateOrderApiClient.create_sap_order.
+    - Ошибка вызова целиком возвращается всем заявкам пакета; заказ без
+      элемента в ответе получает ошибку только для себя (с признаком
+      неизвестного исхода, см. is_order_outcome_unknown).
+    - Повторная заявка на заказ, уже ждущий в пакете, не дублируется.
+    """
+
+    def __init__(self) -> None:
+        self.client = SapCreateOrderApiClient()
+        self._pending: Dict[int, SapOrderData] = {}
+        self._waiters: Dict[int, List[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def create_sap_order(self, order_data: SapOrderData) -> SapStatusDTO:
+        if app_config.sap_088_batch_size <= 1:
+            return await self.client.create_sap_order(order_data)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[order_data.ORDER_ID] = order_data
+        self._waiters.setdefault(order_data.ORDER_ID, []).append(future)
+        if len(self._pending) >= app_config.sap_088_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(
+                app_config.sap_088_batch_window_sec, self._flush
+            )
+        return await future
+
+    async def stop(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        for futures in self._waiters.values():
+            for future in futures:
+                future.cancel()
+        self._pending.clear()
+        self._waiters.clear()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def _flush(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        orders, waiters = self._pending, self._waiters
+        self._pending, self._waiters = {}, {}
+        task = asyncio.create_task(self._send(orders, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(
+        self,
+        orders: Dict[int, SapOrderData],
+        waiters: Dict[int, List[asyncio.Future]],
+    ) -> None:
+        try:
+            try:
+                response = await self.client.create_sap_orders(
+                    orders=list(orders.values())
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Пакет из {len(orders)} заявок SAP 088 не отправлен: {e}"
+                )
+                for futures in waiters.values():
+                    self._resolve(futures, exception=e)
+                return
+            items = {
+                str(item.ORDER_ID): item
+                for item in response.items
+                if item.ORDER_ID is not None
+            }
+            for order_id, futures in waiters.items():
+                item = items.get(str(order_id))
+                if item is None:
+                    self._resolve(
+                        futures,
+                        exception=AppExceptionResponse.internal_error(
+                            message=f"SAP 088 не вернул ответ по заказу {order_id}",
+                            # Пакет принят: заказ мог быть создан
+                            extra={OUTCOME_UNKNOWN_KEY: True},
+                        ),
+                    )
+                else:
+                    self._resolve(futures, result=SapStatusDTO(items=[item]))
+        finally:
+            # Отмена задачи не должна оставлять заявки висеть
+            for futures in waiters.values():
+                for future in futures:
+                    future.cancel()
+
+    @staticmethod
+    def _resolve(
+        futures: List[asyncio.Future],
+        result: Optional[SapStatusDTO] = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        for future in futures:
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+sap_order_batcher = SapOrderBatcher()
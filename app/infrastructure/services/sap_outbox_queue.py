@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, List, Optional, Set
+
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from app.adapters.dto.sap.sap_outbox_dto import SapOrderStatusDTO
+from app.infrastructure.config import app_config
+from app.infrastructure.redis_client import redis_cache
+
+logger = logging.getLogger(__name__)
+
+SAP_OUTBOX_QUEUE_KEY = "sap_outbox:queue"
+SAP_OUTBOX_STATUS_CHANNEL = "sap_outbox:order:{order_id}"
+
+
+class SapOrderStatusListener:
+    """
+    Один подписчик Redis на процесс для статусов всех заказов: PSUBSCRIBE на
+    `sap_outbox:order:*`, сообщения раздаются по очередям открытых потоков.
+
+    Потоки статуса не берут по соединению из общего пула: на процесс
+    держится одно соединение pub/sub. Подписка запускается при первом
+    потоке; после ошибки Redis переподключается, сообщения за время
+    разрыва теряются (итог клиент получит при следующем запросе статуса).
+    """
+
+    def __init__(self) -> None:
+        self._queues: Dict[int, Set[asyncio.Queue]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+
+    def register(self, order_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.setdefault(order_id, set()).add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    def unregister(self, order_id: int, queue: asyncio.Queue) -> None:
+        queues = self._queues.get(order_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[order_id]
+
+    async def wait_ready(self) -> None:
+        """
+        Ждет подтверждения PSUBSCRIBE; при недоступном Redis — не дольше
+        таймаута соединения, обновления тогда придут после переподключения.
+        """
+        try:
+            await asyncio.wait_for(
+                self._ready.wait(), timeout=app_config.redis_socket_connect_timeout_sec
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Подписка на статусы outbox SAP еще не установлена")
+
+    async def stop(self) -> None:
+        self._ready.clear()
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        pattern = redis_cache.key(SAP_OUTBOX_STATUS_CHANNEL.format(order_id="*"))
+        while True:
+            try:
+                async with redis_cache.pubsub() as pubsub:
+                    await pubsub.psubscribe(pattern)
+                    self._ready.set()
+                    while True:
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True,
+                            timeout=app_config.sap_outbox_poll_interval_sec,
+                        )
+                        if message and message.get("type") == "pmessage":
+                            self._dispatch(message["data"])
+            except (RedisError, OSError) as e:
+                self._ready.clear()
+                logger.warning(f"Подписка на статусы outbox SAP прервана: {e}")
+                await asyncio.sleep(app_config.sap_outbox_poll_interval_sec)
+
+    def _dispatch(self, data: str) -> None:
+        try:
+            status = SapOrderStatusDTO.model_validate_json(data)
+        except ValidationError as e:
+            logger.warning(f"Некорректный статус outbox SAP в канале: {e}")
+            return
+        for queue in self._queues.get(status.order_id, ()):
+            queue.put_nowait(status)
+
+
+class SapOrderStatusSubscription:
+    """Подписка одного потока на статус заказа; освобождается через `close()`."""
+
+    def __init__(self, listener: SapOrderStatusListener, order_id: int) -> None:
+        self.listener = listener
+        self.order_id = order_id
+        self.queue = listener.register(order_id)
+
+    async def updates(
+        self, timeout: float
+    ) -> AsyncIterator[Optional[SapOrderStatusDTO]]:
+        """
+        Изменения статуса заказа в течение `timeout` секунд. Раз в
+        `poll_interval` отдает None, чтобы подписчик мог отправить heartbeat.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                yield await asyncio.wait_for(
+                    self.queue.get(),
+                    timeout=min(app_config.sap_outbox_poll_interval_sec, remaining),
+                )
+            except asyncio.TimeoutError:
+                yield None
+
+    def close(self) -> None:
+        self.listener.unregister(self.order_id, self.queue)
+
+
+class SapOutboxQueue:
+    """
+    Очередь Redis поверх таблицы outbox: ускоряет доставку записей воркеру.
+
+    Источник истины — таблица `sap_outbox`: если Redis недоступен или
+    сообщение потерялось, воркер найдет запись при периодическом обходе.
+    Изменения статуса публикуются в канал заказа для подписчиков.
+    """
+
+    def __init__(self) -> None:
+        self.status_listener = SapOrderStatusListener()
+
+    async def push(self, outbox_id: int) -> None:
+        try:
+            await redis_cache.lpush(SAP_OUTBOX_QUEUE_KEY, str(outbox_id))
+        except RedisError as e:
+            logger.warning(f"Outbox SAP {outbox_id} не поставлен в очередь Redis: {e}")
+
+    async def pop(self, timeout: float) -> Optional[int]:
+        # Блокирующее чтение должно уложиться в таймаут сокета Redis
+        timeout = max(1, min(timeout, app_config.redis_socket_timeout_sec - 1))
+        try:
+            value = await redis_cache.brpop(SAP_OUTBOX_QUEUE_KEY, timeout=timeout)
+        except RedisError as e:
+            logger.warning(f"Очередь outbox SAP недоступна: {e}")
+            await asyncio.sleep(timeout)
+            return None
+        return int(value) if value else None
+
+    async def pop_many(self, limit: int) -> List[int]:
+        """Забирает без ожидания то, что уже накопилось в очереди."""
+        if limit <= 0:
+            return []
+        try:
+            values = await redis_cache.rpop(SAP_OUTBOX_QUEUE_KEY, count=limit)
+        except RedisError as e:
+            logger.warning(f"Очередь outbox SAP недоступна: {e}")
+            return []
+        return [int(value) for value in values]
+
+    async def publish(self, status: SapOrderStatusDTO) -> None:
+        try:
+            await redis_cache.publish(
+                SAP_OUTBOX_STATUS_CHANNEL.format(order_id=status.order_id),
+                status.model_dump_json(),
+            )
+        except RedisError as e:
+            logger.warning(
+                f"Статус отправки заказа {status.order_id} в SAP не опубликован: {e}"
+            )
+
+    async def subscribe(self, order_id: int) -> "SapOrderStatusSubscription":
+        """
+        Подписка на статус заказа. Возвращается, когда подписка в Redis уже
+        действует: статус, прочитанный после нее, не разминется с публикацией.
+        """
+        subscription = SapOrderStatusSubscription(self.status_listener, order_id)
+        try:
+            await self.status_listener.wait_ready()
+        except BaseException:
+            subscription.close()
+            raise
+        return subscription
+
+    async def stop(self) -> None:
+        await self.status_listener.stop()
+
+
+sap_outbox_queue = SapOutboxQueue()
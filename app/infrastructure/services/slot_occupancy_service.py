@@ -0,0 +1,230 @@
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Dict
+
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repositories.schedule.schedule_repository import ScheduleRepository
+from app.adapters.repositories.workshop_schdedule.workshop_schedule_repository import (
+    WorkshopScheduleRepository,
+)
+from app.infrastructure.config import app_config
+from app.infrastructure.redis_client import redis_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SlotReservation:
+    """
+    Итог захвата места. `in_redis` — место занято в индексе Redis: при
+    откате брони его нужно вернуть через `release()`. При захвате по БД
+    индекс не менялся, и возвращать нечего.
+    """
+
+    reserved: bool
+    in_redis: bool
+
+    @property
+    def needs_release(self) -> bool:
+        return self.reserved and self.in_redis
+
+
+# Служебное поле хэша: отличает построенный пустой день от отсутствующего индекса
+BUILT_FIELD = "_built"
+
+# Записываем индекс, только если его еще нет (иначе затрем свежие инкременты)
+BUILD_SCRIPT = redis_cache.script(
+    """
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        return 0
+    end
+    redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    return 1
+    """
+)
+
+# Инкремент только существующего индекса: отсутствующий построится из БД.
+# Каждое изменение продлевает TTL, чтобы индекс активного дня не истекал
+INCREMENT_SCRIPT = redis_cache.script(
+    """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return nil
+    end
+    local booked = redis.call('HINCRBY', KEYS[1], ARGV[1], ARGV[2])
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    return booked
+    """
+)
+
+# Атомарный захват места в слоте с проверкой вместимости:
+# nil — индекс не построен, -1 — мест нет, иначе новое число бронирований
+RESERVE_SCRIPT = redis_cache.script(
+    """
+    if redis.call('EXISTS', KEYS[1]) == 0 then
+        return nil
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    local booked = redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+    if booked > tonumber(ARGV[2]) then
+        redis.call('HINCRBY', KEYS[1], ARGV[1], -1)
+        return -1
+    end
+    return booked
+    """
+)
+
+
+class SlotOccupancyService:
+    """
+    Индекс занятости слотов цеха по дням: количество бронирований по началу слота.
+
+    Индекс хранится в Redis-хэше на пару (расписание цеха, день), строится
+    одним GROUP BY запросом при первом обращении и далее поддерживается
+    инкрементально при бронировании и отмене. Если Redis недоступен,
+    занятость считается напрямую из БД.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.schedule_repository = ScheduleRepository(db)
+        self.workshop_schedule_repository = WorkshopScheduleRepository(db)
+
+    @staticmethod
+    def index_key(workshop_schedule_id: int, schedule_date: date) -> str:
+        return f"slot_occupancy:{workshop_schedule_id}:{schedule_date.isoformat()}"
+
+    @staticmethod
+    def slot_field(start_at: time) -> str:
+        return start_at.strftime("%H:%M:%S")
+
+    async def get_day_occupancy(
+        self, workshop_schedule_id: int, schedule_date: date
+    ) -> Dict[str, int]:
+        """Возвращает занятость слотов дня: {"HH:MM:SS": количество бронирований}."""
+        key = self.index_key(workshop_schedule_id, schedule_date)
+        try:
+            cached = await redis_cache.hgetall(key)
+        except RedisError as e:
+            logger.warning(f"Индекс занятости слотов недоступен в Redis: {e}")
+            return await self._load_day_occupancy(workshop_schedule_id, schedule_date)
+        if cached:
+            cached.pop(BUILT_FIELD, None)
+            return {field: int(count) for field, count in cached.items()}
+
+        occupancy = await self._load_day_occupancy(workshop_schedule_id, schedule_date)
+        args = [app_config.schedule_occupancy_ttl_sec, BUILT_FIELD, 1]
+        for field, count in occupancy.items():
+            args.extend([field, count])
+        try:
+            await BUILD_SCRIPT(keys=[redis_cache.key(key)], args=args)
+        except RedisError as e:
+            logger.warning(f"Не удалось сохранить индекс занятости слотов: {e}")
+        return occupancy
+
+    async def get_range_occupancy(
+        self, workshop_schedule_id: int, date_from: date, date_to: date
+    ) -> Dict[date, Dict[str, int]]:
+        """
+        Занятость слотов за период одним GROUP BY запросом:
+        {день: {"HH:MM:SS": количество бронирований}}.
+        """
+        occupancy = await self.schedule_repository.get_slot_occupancy(
+            workshop_schedule_id=workshop_schedule_id,
+            date_start=datetime.combine(date_from, time.min),
+            date_end=datetime.combine(date_to, time.max),
+        )
+        by_day: Dict[date, Dict[str, int]] = {}
+        for start_at, count in occupancy.items():
+            by_day.setdefault(start_at.date(), {})[
+                self.slot_field(start_at.time())
+            ] = count
+        return by_day
+
+    async def reserve(
+        self, workshop_schedule_id: int, start_at: datetime, capacity: int
+    ) -> SlotReservation:
+        """
+        Атомарно занимает место в слоте, если не превышена вместимость.
+
+        Проверка и захват выполняются одним Lua-скриптом в Redis. Если
+        бронирование затем не удалось сохранить, место нужно вернуть через
+        `release()` (см. `SlotReservation.needs_release`). Без Redis слот
+        сериализуется блокировкой строки расписания цеха в БД до фиксации
+        текущей транзакции.
+
+        Индекс в Redis может занизить занятость (перестроен из БД, пока чужая
+        бронь еще не зафиксирована), поэтому перед commit бронирования
+        вместимость перепроверяется через `has_capacity_in_db()`.
+        """
+        key = self.index_key(workshop_schedule_id, start_at.date())
+        field = self.slot_field(start_at.time())
+        try:
+            for _ in range(2):
+                booked = await RESERVE_SCRIPT(
+                    keys=[redis_cache.key(key)],
+                    args=[field, capacity, app_config.schedule_occupancy_ttl_sec],
+                )
+                if booked is not None:
+                    return SlotReservation(reserved=int(booked) >= 0, in_redis=True)
+                # Индекса нет — строим его из БД и повторяем захват
+                await self.get_day_occupancy(workshop_schedule_id, start_at.date())
+        except RedisError as e:
+            logger.warning(f"Захват слота через Redis не удался: {e}")
+        reserved = await self.has_capacity_in_db(
+            workshop_schedule_id, start_at, capacity
+        )
+        return SlotReservation(reserved=reserved, in_redis=False)
+
+    async def release(self, workshop_schedule_id: int, start_at: datetime) -> None:
+        await self._change(workshop_schedule_id, start_at, -1)
+
+    async def _change(
+        self, workshop_schedule_id: int, start_at: datetime, delta: int
+    ) -> None:
+        key = self.index_key(workshop_schedule_id, start_at.date())
+        try:
+            await INCREMENT_SCRIPT(
+                keys=[redis_cache.key(key)],
+                args=[
+                    self.slot_field(start_at.time()),
+                    delta,
+                    app_config.schedule_occupancy_ttl_sec,
+                ],
+            )
+        except RedisError as e:
+            # Индекс мог разойтись с БД — сбрасываем, чтобы он перестроился
+            logger.warning(f"Не удалось обновить индекс занятости слотов: {e}")
+            try:
+                await redis_cache.delete(key)
+            except RedisError:
+                pass
+
+    async def has_capacity_in_db(
+        self, workshop_schedule_id: int, start_at: datetime, capacity: int
+    ) -> bool:
+        """
+        Проверка вместимости слота по БД под блокировкой строки расписания
+        цеха: параллельные бронирования этого цеха ждут фиксации текущей
+        транзакции. Вызывать внутри транзакции, сохраняющей бронь.
+        """
+        await self.workshop_schedule_repository.get_for_update(workshop_schedule_id)
+        booked = await self.schedule_repository.count_slot_bookings(
+            workshop_schedule_id=workshop_schedule_id, start_at=start_at
+        )
+        return booked < capacity
+
+    async def _load_day_occupancy(
+        self, workshop_schedule_id: int, schedule_date: date
+    ) -> Dict[str, int]:
+        occupancy = await self.schedule_repository.get_slot_occupancy(
+            workshop_schedule_id=workshop_schedule_id,
+            date_start=datetime.combine(schedule_date, time.min),
+            date_end=datetime.combine(schedule_date, time.max),
+        )
+        return {
+            self.slot_field(start_at.time()): count
+            for start_at, count in occupancy.items()
+        }
@@ -0,0 +1,37 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Флаг в session.info: репозитории только flush'ат, commit делает владелец блока
+DEFER_COMMIT_KEY = "defer_commit"
+
+
+def is_commit_deferred(session: AsyncSession) -> bool:
+    return bool(session.info.get(DEFER_COMMIT_KEY))
+
+
+@asynccontextmanager
+async def unit_of_work(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Единица работы для многошаговых use case: одна сессия, одна транзакция.
+
+    Внутри блока `BaseRepository.create/update/delete` выполняют только flush,
+    а все изменения фиксируются одним commit в конце (или откатываются при
+    ошибке). Вложенный блок (например, use case, вызванный из другого use
+    case) выполняется в SAVEPOINT: его ошибка откатывает только его
+    изменения, а решение о судьбе транзакции остается за внешним блоком.
+    """
+    if is_commit_deferred(session):
+        async with session.begin_nested():
+            yield session
+        return
+    session.info[DEFER_COMMIT_KEY] = True
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        session.info.pop(DEFER_COMMIT_KEY, None)
@@ -5,21 +5,44 @@ import uvicorn
 from fastapi import Depends, FastAPI
 from fastapi.exceptions import RequestValidationError
 from infrastructure.config import app_config
-from starlette.staticfiles import StaticFiles
 
 from app.core.api_routes import include_routers
 from app.core.app_cors import set_up_cors
 from app.core.app_exception_handler import validation_exception_handler
 from app.core.auth_bearer_core import AuthBearer
+from app.core.key_cloak_core import keycloak_token_verifier
 from app.core.role_docs import setup_role_documentation
 from app.core.role_routes import assign_roles
+from app.core.static_files_core import CachedStaticFiles, precompress_static
+from app.infrastructure.http_transport import http_transport
+from app.infrastructure.redis_client import close_redis
+from app.infrastructure.services.file_storage import CONTENT_ADDRESSED_FOLDER
+from app.infrastructure.services.image_variant_service import image_variant_service
+from app.infrastructure.services.reference_registry import reference_registry
+from app.infrastructure.services.sap_contract_cache import sap_contract_cache
+from app.infrastructure.services.sap_outbox_queue import sap_outbox_queue
 from app.seeders.runner import run_seeders
+from app.workers.sap_outbox_worker import sap_outbox_worker
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await run_seeders()
+    await precompress_static(app_config.static_folder, skip=[app_config.upload_folder])
+    await reference_registry.start()
+    if app_config.is_keycloak_auth():
+        await keycloak_token_verifier.start()
+    if app_config.sap_outbox_worker_in_app:
+        await sap_outbox_worker.start()
     yield
+    await sap_outbox_worker.stop()
+    await keycloak_token_verifier.stop()
+    await reference_registry.stop()
+    await image_variant_service.stop()
+    await sap_contract_cache.stop()
+    await sap_outbox_queue.stop()
+    await http_transport.close()
+    await close_redis()
 
 
 app = FastAPI(
@@ -44,7 +67,10 @@ if not os.path.exists(app_config.static_folder):
 
 app.mount(
     f"/{app_config.static_folder}",
-    StaticFiles(directory=f"{app_config.static_folder}"),
+    CachedStaticFiles(
+        directory=f"{app_config.static_folder}",
+        immutable_prefixes=[f"{app_config.upload_folder}/{CONTENT_ADDRESSED_FOLDER}"],
+    ),
     name=f"{app_config.static_folder}",
 )
 
@@ -0,0 +1,117 @@
+import asyncio
+import base64
+import logging
+from datetime import datetime
+from typing import Optional, Set
+
+import aiohttp
+from aiohttp import web
+
+from app.mock_services.mock_config import mock_config
+from app.mock_services.mock_core import create_mock_app
+
+logger = logging.getLogger(__name__)
+
+KASPI_FAST_PAYMENT_PATH = "/kaspi/online"
+# Пути check/pay приложения относительно MOCK_KASPI_CALLBACK_URL
+KASPI_CHECK_PATH = "/check"
+KASPI_PAY_PATH = "/pay"
+
+# Прозрачный PNG 1x1 вместо картинки QR
+FAKE_QR_PNG = base64.b64encode(
+    bytes.fromhex(
+        "89504e470d0a1a0a0000000d4948445200000001000000010806000000"
+        "1f15c4890000000d49444154789c6360000002000100e221bc330000000049454e44ae426082"
+    )
+).decode()
+
+
+class KaspiMock:
+    """
+    Kaspi: быстрые платежи (ссылка и QR) и имитация плательщика.
+
+    Если задан `mock_kaspi_callback_url`, через `mock_kaspi_pay_delay_sec`
+    после выдачи ссылки заглушка, как Kaspi, вызывает у приложения
+    `check`, а затем `pay` по номеру заказа SAP (OrderId).
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Set[asyncio.Task] = set()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def build(self) -> web.Application:
+        app = create_mock_app("kaspi")
+        app.router.add_post(KASPI_FAST_PAYMENT_PATH, self.fast_payment)
+        app.on_cleanup.append(self._cleanup)
+        return app
+
+    async def fast_payment(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        tran_id = payload.get("TranId")
+        order_id = payload.get("OrderId")
+        if not tran_id or not order_id or not payload.get("Amount"):
+            return web.json_response(
+                {
+                    "code": -1,
+                    "redirectUrl": None,
+                    "message": "Неверные параметры платежа",
+                    "qrCodeImage": None,
+                }
+            )
+        generate_qr = str(payload.get("GenerateQrCode")).lower() == "true"
+        if mock_config.mock_kaspi_callback_url:
+            task = asyncio.create_task(
+                self._simulate_payment(
+                    tran_id=str(tran_id),
+                    order_id=str(order_id),
+                    amount=float(payload["Amount"]) / 100,
+                )
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return web.json_response(
+            {
+                "code": 0,
+                "redirectUrl": f"https://kaspi.kz/pay/mock?TranId={tran_id}",
+                "message": None,
+                "qrCodeImage": FAKE_QR_PNG if generate_qr else None,
+            }
+        )
+
+    async def _simulate_payment(self, tran_id: str, order_id: str, amount: float):
+        await asyncio.sleep(mock_config.mock_kaspi_pay_delay_sec)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession()
+        base_url = mock_config.mock_kaspi_callback_url.rstrip("/")
+        txn_id = f"mock{tran_id}{int(datetime.now().timestamp())}"
+        params = {"txn_id": txn_id, "account": order_id, "sum": f"{amount:.2f}"}
+        try:
+            async with self._session.get(
+                f"{base_url}{KASPI_CHECK_PATH}", params={"command": "check", **params}
+            ) as response:
+                check = await response.json()
+            # 0 — заказ найден и доступен для оплаты (AVAILABLE_FOR_PAYMENT)
+            if check.get("result") != 0:
+                logger.info(f"Kaspi check по заказу {order_id} отклонен: {check}")
+                return
+            async with self._session.get(
+                f"{base_url}{KASPI_PAY_PATH}",
+                params={
+                    "command": "pay",
+                    "txn_date": datetime.now().strftime("%Y%m%d%H%M%S"),
+                    **params,
+                },
+            ) as response:
+                pay = await response.json()
+            logger.info(f"Kaspi pay по заказу {order_id}: {pay}")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(
+                f"Имитация оплаты Kaspi по заказу {order_id} не удалась: {e}"
+            )
+
+    async def _cleanup(self, app: web.Application) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._session and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,170 @@
+import logging
+import secrets
+import time
+import uuid
+from typing import List, Optional
+
+import rsa
+from aiohttp import web
+from jose import jwk, jwt
+from jose.exceptions import JOSEError
+
+from app.mock_services.mock_config import mock_config
+from app.mock_services.mock_core import bearer_token, create_mock_app
+
+logger = logging.getLogger(__name__)
+
+KEYCLOAK_REALM_PATH = "/realms/{realm}"
+KEYCLOAK_OIDC_PATH = KEYCLOAK_REALM_PATH + "/protocol/openid-connect"
+# Роли пользователей заглушки по префиксу логина
+KEYCLOAK_CLIENT_ROLE = "digital_queue_client"
+KEYCLOAK_LEGAL_ROLE = "digital_queue_client_legal"
+KEYCLOAK_ADMINISTRATOR_ROLE = "digital_queue_administrator"
+
+
+class KeycloakMock:
+    """
+    Keycloak OIDC: токены RS256 (password, client_credentials,
+    refresh_token), JWKS, userinfo и openid-configuration для любого realm.
+
+    Ключ подписи создается при запуске. Пароль не проверяется; роли
+    выводятся из логина: `admin*` — администратор, `legal*` — клиент-юрлицо,
+    остальные — клиент-физлицо.
+    """
+
+    def __init__(self) -> None:
+        # Чистый Python (rsa): генерация ключа занимает несколько секунд
+        logger.info("Генерация ключа подписи Keycloak...")
+        public_key, private_key = rsa.newkeys(2048)
+        self.kid = uuid.uuid4().hex
+        self.private_key = private_key.save_pkcs1().decode()
+        self.jwk = {
+            **jwk.construct(public_key.save_pkcs1().decode(), "RS256").to_dict(),
+            "kid": self.kid,
+            "use": "sig",
+        }
+
+    def build(self) -> web.Application:
+        app = create_mock_app("keycloak")
+        app.router.add_get(
+            KEYCLOAK_REALM_PATH + "/.well-known/openid-configuration",
+            self.openid_configuration,
+        )
+        app.router.add_get(KEYCLOAK_OIDC_PATH + "/certs", self.certs)
+        app.router.add_post(KEYCLOAK_OIDC_PATH + "/token", self.token)
+        app.router.add_get(KEYCLOAK_OIDC_PATH + "/userinfo", self.userinfo)
+        return app
+
+    @staticmethod
+    def _issuer(request: web.Request) -> str:
+        return f"{request.scheme}://{request.host}/realms/{request.match_info['realm']}"
+
+    async def openid_configuration(self, request: web.Request) -> web.Response:
+        issuer = self._issuer(request)
+        oidc = f"{issuer}/protocol/openid-connect"
+        return web.json_response(
+            {
+                "issuer": issuer,
+                "authorization_endpoint": f"{oidc}/auth",
+                "token_endpoint": f"{oidc}/token",
+                "userinfo_endpoint": f"{oidc}/userinfo",
+                "jwks_uri": f"{oidc}/certs",
+                "end_session_endpoint": f"{oidc}/logout",
+                "grant_types_supported": [
+                    "password",
+                    "client_credentials",
+                    "refresh_token",
+                ],
+                "id_token_signing_alg_values_supported": ["RS256"],
+            }
+        )
+
+    async def certs(self, request: web.Request) -> web.Response:
+        return web.json_response({"keys": [self.jwk]})
+
+    async def token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        grant_type = form.get("grant_type")
+        if grant_type == "password":
+            username = str(form.get("username") or "")
+            if not username or not form.get("password"):
+                return self._error("invalid_grant", "Invalid user credentials")
+        elif grant_type == "client_credentials":
+            username = f"service-account-{form.get('client_id') or 'client'}"
+        elif grant_type == "refresh_token":
+            claims = self._decode(str(form.get("refresh_token") or ""))
+            if not claims or claims.get("typ") != "Refresh":
+                return self._error("invalid_grant", "Invalid refresh token")
+            username = claims["preferred_username"]
+        else:
+            return self._error("unsupported_grant_type", "Unsupported grant type")
+        ttl = mock_config.mock_keycloak_token_ttl_sec
+        issuer = self._issuer(request)
+        return web.json_response(
+            {
+                "access_token": self._sign(issuer, username, "Bearer", ttl),
+                "expires_in": ttl,
+                "refresh_token": self._sign(issuer, username, "Refresh", ttl * 6),
+                "refresh_expires_in": ttl * 6,
+                "token_type": "Bearer",
+                "scope": "openid profile email",
+            }
+        )
+
+    async def userinfo(self, request: web.Request) -> web.Response:
+        claims = self._decode(bearer_token(request) or "")
+        if not claims or claims.get("typ") != "Bearer":
+            return self._error("invalid_token", "Token verification failed", 401)
+        username = claims["preferred_username"]
+        return web.json_response(
+            {
+                "sub": claims["sub"],
+                "name": f"Mock {username}",
+                "given_name": "Mock",
+                "family_name": username,
+                "preferred_username": username,
+                "email": f"{username}@mock.local",
+                "email_verified": True,
+            }
+        )
+
+    def _sign(self, issuer: str, username: str, typ: str, ttl: int) -> str:
+        now = int(time.time())
+        claims = {
+            "iss": issuer,
+            "sub": str(uuid.uuid5(uuid.NAMESPACE_DNS, username)),
+            "typ": typ,
+            "iat": now,
+            "exp": now + ttl,
+            "jti": secrets.token_hex(8),
+            "preferred_username": username,
+            "realm_access": {"roles": self.get_roles(username)},
+        }
+        return jwt.encode(
+            claims, self.private_key, algorithm="RS256", headers={"kid": self.kid}
+        )
+
+    def _decode(self, token: str) -> Optional[dict]:
+        try:
+            return jwt.decode(
+                token,
+                self.jwk,
+                algorithms=["RS256"],
+                options={"verify_aud": False},
+            )
+        except JOSEError:
+            return None
+
+    @staticmethod
+    def get_roles(username: str) -> List[str]:
+        if username.startswith("admin"):
+            return [KEYCLOAK_ADMINISTRATOR_ROLE]
+        if username.startswith("legal"):
+            return [KEYCLOAK_CLIENT_ROLE, KEYCLOAK_LEGAL_ROLE]
+        return [KEYCLOAK_CLIENT_ROLE]
+
+    @staticmethod
+    def _error(error: str, description: str, status: int = 400) -> web.Response:
+        return web.json_response(
+            {"error": error, "error_description": description}, status=status
+        )
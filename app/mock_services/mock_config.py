@@ -0,0 +1,75 @@
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class MockServicesConfiguration(BaseSettings):
+    """
+    Настройки локальных заглушек внешних сервисов (нагрузочное тестирование).
+    Не зависят от настроек приложения: заглушки можно запускать на
+    отдельной машине без БД и Redis. Читаются из окружения и `.env.mock`
+    (в `.env` приложения лишние ключи недопустимы).
+    """
+
+    mock_host: str = Field(default="127.0.0.1", env="MOCK_HOST")
+    mock_sap_port: int = Field(default=8701, env="MOCK_SAP_PORT")
+    mock_kaspi_port: int = Field(default=8702, env="MOCK_KASPI_PORT")
+    mock_keycloak_port: int = Field(default=8703, env="MOCK_KEYCLOAK_PORT")
+    mock_user_repo_port: int = Field(default=8704, env="MOCK_USER_REPO_PORT")
+
+    # Поведение по умолчанию для всех сервисов
+    mock_latency_ms: float = Field(default=50.0, env="MOCK_LATENCY_MS")
+    mock_latency_jitter_ms: float = Field(default=20.0, env="MOCK_LATENCY_JITTER_MS")
+    # Доля ответов 503 и доля "зависших" запросов (дольше таймаута клиента)
+    mock_error_rate: float = Field(default=0.0, env="MOCK_ERROR_RATE")
+    mock_timeout_rate: float = Field(default=0.0, env="MOCK_TIMEOUT_RATE")
+    mock_timeout_sec: float = Field(default=120.0, env="MOCK_TIMEOUT_SEC")
+
+    # Переопределения для отдельных сервисов
+    mock_sap_latency_ms: Optional[float] = Field(
+        default=None, env="MOCK_SAP_LATENCY_MS"
+    )
+    mock_sap_error_rate: Optional[float] = Field(
+        default=None, env="MOCK_SAP_ERROR_RATE"
+    )
+    mock_kaspi_latency_ms: Optional[float] = Field(
+        default=None, env="MOCK_KASPI_LATENCY_MS"
+    )
+    mock_kaspi_error_rate: Optional[float] = Field(
+        default=None, env="MOCK_KASPI_ERROR_RATE"
+    )
+    mock_keycloak_latency_ms: Optional[float] = Field(
+        default=None, env="MOCK_KEYCLOAK_LATENCY_MS"
+    )
+    mock_keycloak_error_rate: Optional[float] = Field(
+        default=None, env="MOCK_KEYCLOAK_ERROR_RATE"
+    )
+    mock_user_repo_latency_ms: Optional[float] = Field(
+        default=None, env="MOCK_USER_REPO_LATENCY_MS"
+    )
+    mock_user_repo_error_rate: Optional[float] = Field(
+        default=None, env="MOCK_USER_REPO_ERROR_RATE"
+    )
+
+    # SAP: срок жизни OAuth-токена и доля отказов по позициям заказа (STATUS 0)
+    mock_sap_token_ttl_sec: int = Field(default=300, env="MOCK_SAP_TOKEN_TTL_SEC")
+    mock_sap_088_reject_rate: float = Field(
+        default=0.05, env="MOCK_SAP_088_REJECT_RATE"
+    )
+    # Kaspi: адрес приложения для имитации оплаты (check/pay); пусто — без оплаты
+    mock_kaspi_callback_url: Optional[str] = Field(
+        default=None, env="MOCK_KASPI_CALLBACK_URL"
+    )
+    mock_kaspi_pay_delay_sec: float = Field(default=2.0, env="MOCK_KASPI_PAY_DELAY_SEC")
+    # Keycloak: срок жизни access-токена
+    mock_keycloak_token_ttl_sec: int = Field(
+        default=300, env="MOCK_KEYCLOAK_TOKEN_TTL_SEC"
+    )
+
+    class Config:
+        env_file = ".env.mock"
+        env_file_encoding = "utf-8"
+
+
+mock_config = MockServicesConfiguration()
@@ -0,0 +1,102 @@
+import asyncio
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+
+from aiohttp import web
+
+from app.mock_services.mock_config import mock_config
+
+# Служебные пути заглушек: без задержек и отказов
+STATS_PATH = "/mock/stats"
+
+
+@dataclass
+class MockBehavior:
+    """Задержка и отказы, которые заглушка добавляет к каждому запросу."""
+
+    latency_ms: float
+    latency_jitter_ms: float
+    error_rate: float
+    timeout_rate: float
+    timeout_sec: float
+
+    @classmethod
+    def for_service(cls, name: str) -> "MockBehavior":
+        latency: Optional[float] = getattr(mock_config, f"mock_{name}_latency_ms")
+        error_rate: Optional[float] = getattr(mock_config, f"mock_{name}_error_rate")
+        return cls(
+            latency_ms=mock_config.mock_latency_ms if latency is None else latency,
+            latency_jitter_ms=mock_config.mock_latency_jitter_ms,
+            error_rate=(
+                mock_config.mock_error_rate if error_rate is None else error_rate
+            ),
+            timeout_rate=mock_config.mock_timeout_rate,
+            timeout_sec=mock_config.mock_timeout_sec,
+        )
+
+    def delay_sec(self) -> float:
+        jitter = random.uniform(-self.latency_jitter_ms, self.latency_jitter_ms)
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+
+@dataclass
+class MockStats:
+    requests: Counter = field(default_factory=Counter)
+    injected_errors: int = 0
+    injected_timeouts: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": dict(self.requests),
+            "requests_total": sum(self.requests.values()),
+            "injected_errors": self.injected_errors,
+            "injected_timeouts": self.injected_timeouts,
+        }
+
+
+STATS_KEY = web.AppKey("mock_stats", MockStats)
+
+
+def create_mock_app(
+    name: str, behavior: Optional[MockBehavior] = None
+) -> web.Application:
+    """
+    Приложение заглушки с общим поведением: задержка ответа, доля 503 и
+    "зависших" запросов, счетчики запросов на `/mock/stats`.
+    """
+    behavior = behavior or MockBehavior.for_service(name)
+
+    @web.middleware
+    async def behavior_middleware(request: web.Request, handler):
+        if request.path == STATS_PATH:
+            return await handler(request)
+        stats = request.app[STATS_KEY]
+        stats.requests[request.path] += 1
+        roll = random.random()
+        if roll < behavior.timeout_rate:
+            stats.injected_timeouts += 1
+            await asyncio.sleep(behavior.timeout_sec)
+        await asyncio.sleep(behavior.delay_sec())
+        if roll >= 1 - behavior.error_rate:
+            stats.injected_errors += 1
+            return web.json_response(
+                {"error": f"{name} mock: service unavailable"}, status=503
+            )
+        return await handler(request)
+
+    async def get_stats(request: web.Request) -> web.Response:
+        return web.json_response(request.app[STATS_KEY].as_dict())
+
+    app = web.Application(middlewares=[behavior_middleware])
+    app[STATS_KEY] = MockStats()
+    app.router.add_get(STATS_PATH, get_stats)
+    return app
+
+
+def bearer_token(request: web.Request) -> Optional[str]:
+    authorization = request.headers.get("Authorization", "")
+    if not authorization.lower().startswith("bearer "):
+        return None
+    return authorization[7:].strip() or None
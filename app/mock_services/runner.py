@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import List
+
+from aiohttp import web
+
+from app.mock_services.kaspi_mock import KASPI_FAST_PAYMENT_PATH, KaspiMock
+from app.mock_services.keycloak_mock import KeycloakMock
+from app.mock_services.mock_config import mock_config
+from app.mock_services.sap_mock import (
+    SAP_083_PATH,
+    SAP_088_PATH,
+    SAP_TOKEN_PATH,
+    SapMock,
+)
+from app.mock_services.user_repo_mock import UserRepoMock
+
+logger = logging.getLogger(__name__)
+
+
+def get_app_env(host: str) -> List[str]:
+    """Переменные `.env` приложения, направляющие его на заглушки."""
+    sap = f"http://{host}:{mock_config.mock_sap_port}"
+    kaspi = f"http://{host}:{mock_config.mock_kaspi_port}"
+    keycloak = f"http://{host}:{mock_config.mock_keycloak_port}"
+    user_repo = f"http://{host}:{mock_config.mock_user_repo_port}"
+    return [
+        # Без этих настроек приложение не обращается к заглушкам вовсе
+        "APP_AUTH_TYPE=keycloak",
+        "SAP_USE_FAKE_SERVICE=false",
+        # Поле строковое: любое непустое значение, даже "false", включает фейк
+        "ALLOW_FAKE_USER_INFO=",
+        "AUTH_CONTRACT_HTTPS_ENABLED=false",
+        f"SAP_AUTH_HTTP_URL={sap}{SAP_TOKEN_PATH}",
+        "SAP_083_HTTPS_ENABLED=false",
+        f"SAP_083_HTTP_URL={sap}{SAP_083_PATH}",
+        "SAP_088_CREATE_ORDER_HTTPS_ENABLED=false",
+        f"SAP_088_CREATE_ORDER_HTTP_URL={sap}{SAP_088_PATH}",
+        f"FAST_PAYMENT_KASPI_URL={kaspi}{KASPI_FAST_PAYMENT_PATH}",
+        f"KEYCLOAK_SERVER_URL={keycloak}",
+        "APP_USER_REPO_STATUS=DEV",
+        f"APP_USER_REPO_DEV_URL={user_repo}",
+    ]
+
+
+async def main() -> None:
+    host = mock_config.mock_host
+    services = [
+        ("sap", SapMock().build(), mock_config.mock_sap_port),
+        ("kaspi", KaspiMock().build(), mock_config.mock_kaspi_port),
+        ("keycloak", KeycloakMock().build(), mock_config.mock_keycloak_port),
+        ("user_repo", UserRepoMock().build(), mock_config.mock_user_repo_port),
+    ]
+    runners: List[web.AppRunner] = []
+    try:
+        for name, app, port in services:
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            runners.append(runner)
+            await web.TCPSite(runner, host, port).start()
+            logger.info(f"Заглушка {name} запущена: http://{host}:{port}")
+        public_host = "127.0.0.1" if host == "0.0.0.0" else host
+        logger.info(
+            "Настройки приложения для работы с заглушками:\n"
+            + "\n".join(get_app_env(public_host))
+        )
+        await asyncio.Event().wait()
+    finally:
+        for runner in reversed(runners):
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,143 @@
+import base64
+import hashlib
+import random
+import secrets
+import time
+from datetime import datetime
+from typing import Dict
+
+from aiohttp import web
+
+from app.mock_services.mock_config import mock_config
+from app.mock_services.mock_core import bearer_token, create_mock_app
+
+SAP_TOKEN_PATH = "/sap/oauth/token"
+SAP_083_PATH = "/sap/083/contracts"
+SAP_088_PATH = "/sap/088/orders"
+
+# Минимальный валидный PDF, чтобы клиент прошел весь путь сохранения файла
+FAKE_PDF = base64.b64encode(
+    b"%PDF-1.4\n1 0 obj<<>>endobj\ntrailer<<>>\n%%EOF\n"
+).decode()
+
+
+def format_sap_amount(value: float) -> str:
+    """Число в формате ответа SAP: 1.234.567,00."""
+    integer, fraction = f"{value:.2f}".split(".")
+    return f"{int(integer):,}".replace(",", ".") + f",{fraction}"
+
+
+class SapMock:
+    """
+    SAP RESTAdapter: OAuth-токен (client_credentials), договоры по БИН (083)
+    и создание заказов пакетом `items.item` (088).
+
+    Токены живут `mock_sap_token_ttl_sec`; просроченный или неизвестный
+    токен получает 401, как настоящий шлюз.
+    """
+
+    def __init__(self) -> None:
+        self.tokens: Dict[str, float] = {}
+
+    def build(self) -> web.Application:
+        app = create_mock_app("sap")
+        app.router.add_post(SAP_TOKEN_PATH, self.token)
+        app.router.add_post(SAP_083_PATH, self.contracts)
+        app.router.add_post(SAP_088_PATH, self.create_orders)
+        return app
+
+    async def token(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        if not form.get("client_id") or not form.get("client_secret"):
+            return web.json_response({"error": "invalid_client"}, status=401)
+        access_token = secrets.token_urlsafe(32)
+        now = time.time()
+        self.tokens = {k: v for k, v in self.tokens.items() if v > now}
+        self.tokens[access_token] = now + mock_config.mock_sap_token_ttl_sec
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "token_type": "Bearer",
+                "expires_in": mock_config.mock_sap_token_ttl_sec,
+                "scope": form.get("scope") or "",
+            }
+        )
+
+    def _is_authorized(self, request: web.Request) -> bool:
+        token = bearer_token(request)
+        return bool(token) and self.tokens.get(token, 0) > time.time()
+
+    async def contracts(self, request: web.Request) -> web.Response:
+        if not self._is_authorized(request):
+            return web.json_response({"error": "invalid_token"}, status=401)
+        bin = str((await request.json()).get("BIN_PARTNER") or "")
+        # Договоры детерминированы по БИН: повторные запросы сравнимы
+        seed = int(hashlib.sha256(bin.encode()).hexdigest()[:8], 16)
+        rng = random.Random(seed)
+        rows = []
+        for number in range(1, rng.randint(1, 3) + 1):
+            items = []
+            for position in range(1, rng.randint(1, 4) + 1):
+                quan = rng.randint(50, 5000)
+                left = rng.randint(0, quan)
+                price = rng.randint(8000, 15000)
+                items.append(
+                    {
+                        "POSNR": f"{position * 10:06d}",
+                        "MATNR": f"{rng.randint(1, 20):018d}",
+                        "ARKTX": f"Щебень фракция {position}",
+                        "ZWERT": format_sap_amount(quan * price),
+                        "ZWERT_RST": format_sap_amount(left * price),
+                        "WAERK": "KZT",
+                        "ZMENG": format_sap_amount(quan),
+                        "ZMENG_RST": format_sap_amount(left),
+                        "ZIEME": "TO",
+                        "STATUS": "",
+                    }
+                )
+            rows.append(
+                {
+                    "KTEXT": f"{bin[-4:] or '0000'}-{number:03d}",
+                    "VTEXT": "АКТЗФ",
+                    "ZNAME": "Куратор",
+                    "MSG": "OK",
+                    "item": items,
+                }
+            )
+        return web.json_response({"row": rows})
+
+    async def create_orders(self, request: web.Request) -> web.Response:
+        if not self._is_authorized(request):
+            return web.json_response({"error": "invalid_token"}, status=401)
+        items = (await request.json()).get("items", {}).get("item", [])
+        if isinstance(items, dict):
+            items = [items]
+        now = datetime.now()
+        response = [self._order_result(item, now) for item in items]
+        # Как и SAP, один элемент отдаем объектом, а не списком
+        return web.json_response(
+            {"items": {"item": response[0] if len(response) == 1 else response}}
+        )
+
+    @staticmethod
+    def _order_result(item: dict, now: datetime) -> dict:
+        result = {
+            "DATE": now.strftime("%Y-%m-%d"),
+            "TIME": now.strftime("%H:%M:%S"),
+            "ORDER_ID": item.get("ORDER_ID"),
+        }
+        if random.random() < mock_config.mock_sap_088_reject_rate:
+            return {
+                **result,
+                "STATUS": "0",
+                "ZAKAZ": None,
+                "PDF": None,
+                "TEXT": "Не найдена позиция заказа (заглушка SAP)",
+            }
+        return {
+            **result,
+            "STATUS": "1",
+            "ZAKAZ": f"{random.randint(1000000000, 9999999999)}",
+            "PDF": FAKE_PDF,
+            "TEXT": None,
+        }
@@ -0,0 +1,57 @@
+import hashlib
+from typing import Optional
+
+from aiohttp import web
+from jose import jwt
+from jose.exceptions import JOSEError
+
+from app.mock_services.mock_core import bearer_token, create_mock_app
+
+USER_REPO_CURRENT_USER_PATH = "/user-repository/current-user"
+
+
+def stable_digits(value: str, length: int) -> str:
+    """Детерминированная строка цифр по значению: один логин — один ИИН."""
+    digest = int(hashlib.sha256(value.encode()).hexdigest(), 16)
+    return str(digest)[-length:].zfill(length)
+
+
+class UserRepoMock:
+    """
+    Репозиторий пользователей: профиль текущего пользователя по токену
+    Keycloak. Подпись не проверяется (это уже сделал Keycloak), из токена
+    берется только логин; id, телефон и ИИН выводятся из него.
+    """
+
+    def build(self) -> web.Application:
+        app = create_mock_app("user_repo")
+        app.router.add_get(USER_REPO_CURRENT_USER_PATH, self.current_user)
+        return app
+
+    async def current_user(self, request: web.Request) -> web.Response:
+        username = self._get_username(bearer_token(request))
+        if not username:
+            return web.json_response({"error": "Unauthorized"}, status=401)
+        return web.json_response(
+            {
+                "id": int(stable_digits(username, 9)),
+                "username": username,
+                "firstName": "Mock",
+                "lastName": username,
+                "mobile": f"+77{stable_digits('mobile' + username, 9)}",
+                "additional_attributes": {
+                    "iin": stable_digits(username, 12),
+                    "position": None,
+                },
+            }
+        )
+
+    @staticmethod
+    def _get_username(token: Optional[str]) -> Optional[str]:
+        if not token:
+            return None
+        try:
+            claims = jwt.get_unverified_claims(token)
+        except JOSEError:
+            return None
+        return claims.get("preferred_username")
@@ -16,6 +16,7 @@ class AppTableNames:
     OrderTableName = "orders"
     SAPRequestTableName = "sap_requests"
     KaspiPaymentsTableName = "kaspi_payments"
+    SAPOutboxTableName = "sap_outbox"
     PaymentDocumentTableName = "payment_documents"
     WorkshopScheduleTableName = "workshop_schedules"
     VerifiedUserTableName = "verified_users"
@@ -50,6 +51,7 @@ class AppModelNames:
     OrderModelName = "OrderModel"
     SAPRequestModelName = "SapRequestModel"
     KaspiPaymentsModelName = "KaspiPaymentModel"
+    SAPOutboxModelName = "SapOutboxModel"
     PaymentDocumentModelName = "PaymentDocumentModel"
     WorkshopScheduleModelName = "WorkshopScheduleModel"
     VerifiedUserModelName = "VerifiedUserModel"
@@ -10,6 +10,7 @@ class AppFileExtensionConstants:
     UserFolderName = "users"
     OrganizationFolderName = "organizations"
     VehicleFolderName = "vehicles"
+    SapRequestFolderName = "sap_requests"
     # Расширения для изображений
     IMAGE_EXTENSIONS = {
         ".jpg",
@@ -24,6 +25,17 @@ class AppFileExtensionConstants:
         ".heic",
     }
 
+    # Изображения, для которых строятся уменьшенные копии (без svg/ico/heic)
+    RESIZABLE_IMAGE_EXTENSIONS = {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".bmp",
+        ".webp",
+        ".tiff",
+    }
+
     # Расширения для видео
     VIDEO_EXTENSIONS = {
         ".mp4",
@@ -7,16 +7,20 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     Time,
+    column,
+    func,
     text,
 )
 from sqlalchemy.orm import mapped_column
 
 from app.infrastructure.config import app_config
+from app.infrastructure.search_registry import search_registry
 from app.shared.field_constants import FieldConstants
 
 
@@ -111,6 +115,21 @@ class AppDbValueConstants:
         ]
     )
 
+    # SAP Outbox Status Values
+    SAP_OUTBOX_PENDING_STATUS = "pending"
+    SAP_OUTBOX_PROCESSING_STATUS = "processing"
+    SAP_OUTBOX_SENT_STATUS = "sent"
+    SAP_OUTBOX_FAILED_STATUS = "failed"
+    # Исход отправки неизвестен (SAP мог создать заказ): нужна ручная сверка
+    SAP_OUTBOX_REVIEW_STATUS = "review"
+    SAP_OUTBOX_FINAL_STATUSES = frozenset(
+        [
+            SAP_OUTBOX_SENT_STATUS,
+            SAP_OUTBOX_FAILED_STATUS,
+            SAP_OUTBOX_REVIEW_STATUS,
+        ]
+    )
+
     # Operation Status Values
     VALIDATION_BEFORE_ENTRY = "validation_before_entry"
     ENTRY_CHECKPOINT = "entry_checkpoint"
@@ -196,6 +215,10 @@ class DbModelValue:
             return "(quan - quan_booked - quan_released) / 1000.0"
         return "(quan - quan_booked - quan_released) / 1000.0"
 
+    def search_document(self, table_name: str) -> str:
+        """Поисковый документ сущности (поля из реестра поиска)."""
+        return search_registry.document_expression(table_name)
+
     @property
     def tomorrow(self) -> str:
         """Вычисление TOMORROW."""
@@ -274,6 +297,10 @@ class DbColumnConstants:
         ),
     ]
     StandardNullableText = Annotated[str, mapped_column(Text(), nullable=True)]
+    # Крупный текст, который не читается вместе со строкой
+    StandardNullableDeferredText = Annotated[
+        Optional[str], mapped_column(Text(), nullable=True, deferred=True)
+    ]
     StandardText = Annotated[str, mapped_column(Text())]
     StandardPrice = Annotated[
         float,
@@ -418,6 +445,20 @@ class DbColumnConstants:
         ),
     ]
 
+    # Вычисляемый поисковый документ (не загружается вместе с моделью)
+    StandardComputedSearchDocument = lambda table_exp: Annotated[
+        Optional[str],
+        mapped_column(
+            Text(),
+            Computed(
+                f"{table_exp}",
+                persisted=True,
+            ),
+            nullable=True,
+            deferred=True,
+        ),
+    ]
+
     # Вычисляемые столбцы для Float
     StandardComputedFloat = lambda table_exp, is_persisted=None: Annotated[
         float,
@@ -441,6 +482,26 @@ class DbColumnConstants:
     ]
 
 
+class DbIndexConstants:
+    @staticmethod
+    def lower_index(table_name: str, column_name: str) -> Index:
+        """
+        Функциональный индекс по lower(колонка): сравнения вида
+        `func.lower(column) == value.lower()` выполняются поиском по индексу.
+        """
+        return Index(
+            f"ix_{table_name}_{column_name}_lower", func.lower(column(column_name))
+        )
+
+    @staticmethod
+    def lower_indexes(table_name: str, *column_names: str) -> tuple:
+        """Набор функциональных индексов lower() для `__table_args__`."""
+        return tuple(
+            DbIndexConstants.lower_index(table_name, column_name)
+            for column_name in column_names
+        )
+
+
 from sqlalchemy.orm import relationship
 
 
@@ -63,6 +63,8 @@ class AppPathConstants:
     EmployeeRequestTagName = "Заявка на добавление в организацию"
     KaspiPaymentPathName = "kaspi"
     KaspiPaymentTagName = "Каспи оплата"
+    MonitoringPathName = "monitoring"
+    MonitoringTagName = "Мониторинг"
 
     IndexPathName = "/"
     CreatePathName = "/create"
@@ -93,8 +95,15 @@ class AppPathConstants:
     PaginateClientOrderPathName = "/paginate-client-order"
     GetClientOrderByIdPathName = "/client-order/{id}"
     GetClientOrderByValuePathName = "/client-order/{value}"
+    GetClientOrderSapStatusPathName = "/client-order-sap-status/{id}"
+    StreamClientOrderSapStatusPathName = "/client-order-sap-status-stream/{id}"
     # SAP
     RecreateSAPOrderRequestPathName = "/recreate/{order_id}"
+    GetClientSapRequestPdfPathName = "/client-pdf/{id}"
+    GetClientCompanyContractsPathName = "/client-company-contracts/{id}"
+    # File
+    DownloadFilePathName = "/download/{id}"
+    GetFileVariantPathName = "/variant/{id}"
     # Auth
     LoginPathName = "/login"
     GetMePathName = "/me"
@@ -111,3 +120,8 @@ class AppPathConstants:
     CreateClientSchedulePathName = "/create-client-schedule"
     #Workshop Schedule
     GetFreeSpacePathName = "/get-workshop-schedule"
+    GetWorkshopScheduleCalendarPathName = "/get-workshop-schedule-calendar"
+    # Monitoring
+    HttpPoolsPathName = "/http-pools"
+    HealthPathName = "/health"
+    SapContractCachePathName = "/sap-contract-cache"
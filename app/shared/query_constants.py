@@ -58,6 +58,17 @@ class AppQueryConstants:
             description=description,
         )
 
+    @staticmethod
+    def StandardOptionalCursorQuery(
+        description="Курсор следующей страницы (next_cursor из предыдущего ответа); "
+        "если указан, page игнорируется",
+    ):
+        return Query(
+            default=None,
+            max_length=1024,
+            description=description,
+        )
+
     @staticmethod
     def StandardOptionalIntegerQuery(description="Опциональное числовое значение"):
         return Query(
@@ -141,6 +152,13 @@ class AppQueryConstants:
             description=description,
         )
 
+    @staticmethod
+    def StandardOptionalDateQuery(description="Опциональная дата"):
+        return Query(
+            default=None,
+            description=description,
+        )
+
     @staticmethod
     def StandardOptionalDateForScheduleQuery(description="Опциональный дата"):
         return Query(
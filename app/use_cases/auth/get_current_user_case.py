@@ -1,81 +1,60 @@
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 
+import aiohttp
 from jose import jwt
-from keycloak import KeycloakAuthenticationError
 from sqlalchemy import and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.user.user_dto import UserKeycloakCDTO, UserWithRelationsDTO
 from app.adapters.dto.user.user_response_dto import UserResponseDTO
-from app.adapters.repositories.role.role_repository import RoleRepository
 from app.adapters.repositories.user.user_repository import UserRepository
-from app.adapters.repositories.user_type.user_type_repository import UserTypeRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.core.key_cloak_core import keycloak_openid
+from app.core.key_cloak_core import get_keycloak_userinfo, keycloak_token_verifier
+from app.entities import UserModel
 from app.infrastructure.api_clients.user_repo.user_repo_client import UserRepoApiClient
 from app.infrastructure.config import app_config
+from app.infrastructure.memory_cache import TtlCache
 from app.use_cases.base_case import BaseUseCase
 
+logger = logging.getLogger(__name__)
+
+# Кэш пользователя по sub + exp токена: пока токен и запись в кэше живы,
+# запрос авторизуется без обращений к Keycloak и БД
+current_user_cache: TtlCache[UserWithRelationsDTO] = TtlCache(
+    max_size=app_config.auth_user_cache_max_size,
+    default_ttl=app_config.auth_user_cache_ttl_sec,
+)
+
+
+def invalidate_current_user(user_id: int) -> None:
+    """Сбрасывает кэш пользователя после изменения его роли, файла или организаций."""
+    current_user_cache.delete_where(lambda user: user.id == user_id)
+
+
+def invalidate_organization_owners(organization_id: int) -> None:
+    """Сбрасывает кэш пользователей, в чьих организациях есть указанная."""
+    current_user_cache.delete_where(
+        lambda user: any(org.id == organization_id for org in user.organizations or [])
+    )
+
 
 class GetCurrentUserCase(BaseUseCase[UserWithRelationsDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = UserRepository(db)
-        self.role_repository = RoleRepository(db)
-        self.user_type_repository = UserTypeRepository(db)
 
     async def execute(self, token: str) -> UserWithRelationsDTO:
         if app_config.is_keycloak_auth():
-            try:
-                user_info: dict = keycloak_openid.userinfo(token)
-                dto = UserKeycloakCDTO.parse_obj(user_info)
-                dto.sid = user_info["sub"]
-                dto = await self.transform(dto=dto, token=token)
-                existed = await self.repository.get_first_with_filters(
-                    filters=[
-                        and_(func.lower(self.repository.model.sid) == dto.sid.lower())
-                    ],
-                    options=self.repository.default_relationships(),
-                )
-                if existed:
-                    check_time = existed.updated_at + timedelta(
-                        minutes=app_config.update_user_info_minutes
-                    )
-                    if check_time < datetime.now():
-                        existed = await self.repository.update(obj=existed, dto=dto)
-                        existed = await self.repository.get_first_with_filters(
-                            filters=[
-                                and_(
-                                    func.lower(self.repository.model.sid)
-                                    == dto.sid.lower()
-                                )
-                            ],
-                            options=self.repository.default_relationships(),
-                        )
-                    return UserWithRelationsDTO.from_orm(existed)
-                else:
-                    user_repo_client = UserRepoApiClient(token=token)
-                    if app_config.allow_fake_user_info:
-                        fake_dict: dict = user_repo_client.generate_fake_mobile_iin()
-                        dto.iin = fake_dict["iin"]
-                        dto.phone = fake_dict["mobile"]
-                    else:
-                        userRepoDTO: UserResponseDTO = (
-                            await user_repo_client.get_current_user()
-                        )
-                        dto.iin = userRepoDTO.additional_attributes.iin
-                        dto.phone = userRepoDTO.mobile
-                    model = await self.repository.create(
-                        obj=self.repository.model(**dto.dict())
-                    )
-                    model = await self.repository.get(
-                        id=model.id, options=self.repository.default_relationships()
-                    )
-                    return UserWithRelationsDTO.from_orm(model)
-
-            except KeycloakAuthenticationError as e:
-                raise AppExceptionResponse.internal_error(
-                    message=f"Произошла ошибка {str(e.error_message)}",
-                )
+            claims = await keycloak_token_verifier.verify(token)
+            cache_key = f"{claims['sub']}:{claims['exp']}"
+            user = current_user_cache.get(cache_key)
+            if user is None:
+                user = await self.get_keycloak_user(token=token, claims=claims)
+                self.cache_user(key=cache_key, user=user, expire=claims["exp"])
+            return user
         else:
             user_data: dict = self.local_verify_jwt_token(token)
             expire = user_data.get("exp")
@@ -86,38 +65,91 @@ class GetCurrentUserCase(BaseUseCase[UserWithRelationsDTO]):
                 raise AppExceptionResponse.unauthorized(
                     message="Пользователь не найден"
                 )
+            cache_key = f"local:{user_id}:{expire}"
+            cached = current_user_cache.get(cache_key)
+            if cached is not None:
+                return cached
             user = await self.repository.get(
                 id=user_id, options=self.repository.default_relationships()
             )
-            return UserWithRelationsDTO.from_orm(user)
+            dto = UserWithRelationsDTO.from_orm(user)
+            self.cache_user(key=cache_key, user=dto, expire=expire)
+            return dto
+
+    @staticmethod
+    def cache_user(key: str, user: UserWithRelationsDTO, expire: float) -> None:
+        ttl = min(app_config.auth_user_cache_ttl_sec, float(expire) - time.time())
+        current_user_cache.set(key, user, ttl=ttl)
+
+    async def get_keycloak_user(self, token: str, claims: dict) -> UserWithRelationsDTO:
+        sid: str = claims["sub"]
+        existed = await self.get_user_by_sid(sid)
+        if existed:
+            check_time = existed.updated_at + timedelta(
+                minutes=app_config.update_user_info_minutes
+            )
+            if check_time < datetime.now():
+                try:
+                    dto = await self.get_userinfo_dto(token=token, claims=claims)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # Токен уже проверен локально, устаревший профиль не критичен
+                    logger.warning(f"Не удалось обновить профиль из Keycloak: {e}")
+                    return UserWithRelationsDTO.from_orm(existed)
+                await self.repository.update(obj=existed, dto=dto)
+                existed = await self.get_user_by_sid(sid)
+            return UserWithRelationsDTO.from_orm(existed)
+
+        try:
+            dto = await self.get_userinfo_dto(token=token, claims=claims)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise AppExceptionResponse.internal_error(
+                message=f"Произошла ошибка {str(e)}",
+            )
+        user_repo_client = UserRepoApiClient(token=token)
+        if app_config.allow_fake_user_info:
+            fake_dict: dict = user_repo_client.generate_fake_mobile_iin()
+            dto.iin = fake_dict["iin"]
+            dto.phone = fake_dict["mobile"]
+        else:
+            userRepoDTO: UserResponseDTO = await user_repo_client.get_current_user()
+            dto.iin = userRepoDTO.additional_attributes.iin
+            dto.phone = userRepoDTO.mobile
+        model = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
+            options=self.repository.default_relationships(),
+        )
+        return UserWithRelationsDTO.from_orm(model)
+
+    async def get_user_by_sid(self, sid: str) -> Optional[UserModel]:
+        return await self.repository.get_first_with_filters(
+            filters=[and_(func.lower(self.repository.model.sid) == sid.lower())],
+            options=self.repository.default_relationships(),
+        )
+
+    async def get_userinfo_dto(self, token: str, claims: dict) -> UserKeycloakCDTO:
+        user_info: dict = await get_keycloak_userinfo(token)
+        dto = UserKeycloakCDTO.parse_obj(user_info)
+        dto.sid = user_info["sub"]
+        return await self.transform(dto=dto, claims=claims)
 
     async def validate(self):
         pass
 
-    async def transform(self, dto: UserKeycloakCDTO, token: str) -> UserKeycloakCDTO:
-        roles = await self.get_roles(token=token)
-        existed = await self.role_repository.get_first_with_filters(
-            filters=[func.lower(self.role_repository.model.keycloak_value) in roles]
-        )
+    async def transform(self, dto: UserKeycloakCDTO, claims: dict) -> UserKeycloakCDTO:
+        roles = self.get_roles(claims=claims)
         if "digital_queue_client_legal" in roles:
             dto.type_id = 2
         else:
             dto.type_id = 1
-        if existed:
-            dto.role_id = existed.id
-        else:
-            dto.role_id = 7
+        # Пользователи Keycloak получают роль по умолчанию; сопоставление
+        # ролей realm с ролями приложения меняет права и делается отдельно
+        dto.role_id = 7
         return dto
 
-    async def get_roles(self, token: str):
-        try:
-            decoded_token = keycloak_openid.decode_token(
-                token,
-            )
-            roles = decoded_token.get("realm_access", {}).get("roles", [])
-            return [role.lower() for role in roles]
-        except Exception as e:
-            raise AppExceptionResponse.internal_error(message=f"Токен не распознан {e}")
+    @staticmethod
+    def get_roles(claims: dict) -> list[str]:
+        roles = claims.get("realm_access", {}).get("roles", [])
+        return [role.lower() for role in roles]
 
     def local_verify_jwt_token(self, token: str) -> dict:
         try:
@@ -1,4 +1,3 @@
-from keycloak import KeycloakAuthenticationError
 from sqlalchemy import and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -11,7 +10,7 @@ from app.core.auth_core import (
     create_refresh_token,
     verify_password,
 )
-from app.core.key_cloak_core import keycloak_openid
+from app.core.key_cloak_core import request_keycloak_token
 from app.infrastructure.config import app_config
 from app.use_cases.base_case import BaseUseCase
 
@@ -22,16 +21,13 @@ class LoginCase(BaseUseCase[BearerTokenDTO]):
 
     async def execute(self, dto: LoginDTO) -> BearerTokenDTO:
         if app_config.is_keycloak_auth():
-            try:
-                token = keycloak_openid.token(
-                    username=dto.username, password=dto.password
-                )
-                return BearerTokenDTO(
-                    access_token=token["access_token"],
-                    refresh_token=token["refresh_token"],
-                )
-            except KeycloakAuthenticationError:
-                raise AppExceptionResponse.bad_request(message="Неверные данные")
+            token = await request_keycloak_token(
+                username=dto.username, password=dto.password
+            )
+            return BearerTokenDTO(
+                access_token=token["access_token"],
+                refresh_token=token["refresh_token"],
+            )
         else:
             user = await self.repository.get_first_with_filters(
                 filters=[
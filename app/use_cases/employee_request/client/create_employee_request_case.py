@@ -36,14 +36,14 @@ class CreateEmployeeRequestCase(BaseUseCase[EmployeeRequestWithRelationsDTO]):
         self, dto: EmployeeRequestOwnerCDTO, user: UserWithRelationsDTO
     ) -> EmployeeRequestWithRelationsDTO:
         dto_dict: dict = await self.validate(dto=dto, user=user)
-        model = await self.repository.create(obj=self.repository.model(**dto_dict))
+        model = await self.repository.create(
+            obj=self.repository.model(**dto_dict),
+            options=self.repository.default_relationships(),
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Ошибка создания заявки на сотрудника"
             )
-        model = await self.repository.get(
-            id=model.id, options=self.repository.default_relationships()
-        )
         return EmployeeRequestWithRelationsDTO.from_orm(model)
 
     async def validate(self, dto: EmployeeRequestOwnerCDTO, user: UserWithRelationsDTO):
@@ -48,15 +48,13 @@ class UpdateEmployeeRequestCase(BaseUseCase[EmployeeRequestWithRelationsDTO]):
                     request_id=model.id,
                 )
             )
-        model = await self.repository.update(obj=model, dto=dto)
+        model = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при обновлении заявки на работу"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
         return EmployeeRequestWithRelationsDTO.from_orm(model)
 
     async def validate(
@@ -22,18 +22,19 @@ class CreateFactoryCase(BaseUseCase[FactoryWithRelationsDTO]):
         await self.validate(dto=dto)
         if file:
             dto = await self.transform(dto=dto, file=file)
-        existed = await self.repository.create(obj=self.repository.model(**dto.dict()))
-        if not existed:
-            raise AppExceptionResponse.bad_request(message=f"Что-то пошло не так")
-        existed = await self.repository.get(
-            id=existed.id,
+        existed = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
             options=self.repository.default_relationships(),
         )
+        if not existed:
+            raise AppExceptionResponse.bad_request(message=f"Что-то пошло не так")
         return FactoryWithRelationsDTO.from_orm(existed)
 
     async def validate(self, dto: FactoryCDTO):
         existed = await self.repository.get_first_with_filters(
-            filters=[and_(func.lower(self.repository.model.sap_id) == dto.sap_id)]
+            filters=[
+                and_(func.lower(self.repository.model.sap_id) == dto.sap_id.lower())
+            ]
         )
         if existed:
             raise AppExceptionResponse.bad_request(
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repositories.file.file_repository import FileRepository
+from app.core.app_exception_response import AppExceptionResponse
+from app.entities import FileModel
+from app.infrastructure.services.file_service import FileService
+from app.infrastructure.services.image_variant_service import (
+    ImageVariant,
+    image_variant_service,
+)
+from app.use_cases.base_case import BaseUseCase
+
+
+class GetFileContentCase(BaseUseCase[FileModel]):
+    def __init__(self, db: AsyncSession):
+        self.repository = FileRepository(db)
+
+    async def execute(self, id: int, variant: Optional[str] = None) -> FileModel:
+        await self.validate(variant=variant)
+        model = await self.repository.get(id)
+        if not model or not await FileService.exists(model):
+            raise AppExceptionResponse.not_found("Файл не найден")
+        # Копии есть только у изображений: оригинал прочих файлов не отдаем
+        if variant is not None and not image_variant_service.is_resizable(model):
+            raise AppExceptionResponse.not_found("Копия изображения не найдена")
+        return model
+
+    async def validate(self, variant: Optional[str] = None):
+        if variant is not None and variant not in ImageVariant.ALL:
+            raise AppExceptionResponse.bad_request(
+                message=f"Недопустимый вариант изображения. Допустимы: {list(ImageVariant.ALL)}"
+            )
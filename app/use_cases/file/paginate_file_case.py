@@ -18,6 +18,8 @@ class PaginateFileCase(BaseUseCase[list[FileRDTO]]):
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
+            cursor=filter.cursor,
+            relevance=filter.get_search_relevance(),
             filters=filter.apply(),
         )
         return models
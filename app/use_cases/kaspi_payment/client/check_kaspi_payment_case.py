@@ -11,13 +11,12 @@ from app.adapters.dto.order.order_dto import OrderCDTO
 from app.adapters.repositories.kaspi_payment.kaspi_payment_repository import (
     KaspiPaymentRepository,
 )
+from app.adapters.repositories.base_repository import LoadProfile
 from app.adapters.repositories.order.order_repository import OrderRepository
-from app.adapters.repositories.order_status.order_status_repository import (
-    OrderStatusRepository,
-)
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import KaspiPaymentModel, OrderModel
 from app.infrastructure.helpers.kaspi_payment_helper import KaspiPaymentHelper
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -27,7 +26,6 @@ class CheckKaspiPaymentCase(BaseUseCase[KaspiPaymentCheckResponseDTO]):
         self.db = db
         self.repository = KaspiPaymentRepository(db)
         self.order_repository = OrderRepository(db)
-        self.order_status_repository = OrderStatusRepository(db)
 
     async def execute(
         self, dto: KaspiPaymentCheckRequestDTO
@@ -55,7 +53,7 @@ class CheckKaspiPaymentCase(BaseUseCase[KaspiPaymentCheckResponseDTO]):
                     ),
                 )
             ],
-            options=self.order_repository.default_relationships(),
+            options=self.order_repository.load_profile(LoadProfile.MINIMAL),
         )
 
     async def _get_kaspi_payment(
@@ -110,11 +108,8 @@ class CheckKaspiPaymentCase(BaseUseCase[KaspiPaymentCheckResponseDTO]):
         )
 
     async def _update_order_status(self, order: OrderModel):
-        order_status = await self.order_status_repository.get_first_with_filters(
-            filters=[
-                func.lower(self.order_status_repository.model.value)
-                == AppDbValueConstants.WAITING_FOR_PAYMENT_STATUS.lower()
-            ]
+        order_status = await reference_registry.get_order_status_by_value(
+            AppDbValueConstants.WAITING_FOR_PAYMENT_STATUS
         )
         if not order_status:
             raise AppExceptionResponse.internal_error(
@@ -8,13 +8,13 @@ from app.adapters.dto.kaspi.kaspi_request_dto import (
     KaspiFastPaymentFrontendRequestDTO,
     KaspiFastPaymentResponseDTO,
 )
+from app.adapters.dto.order.order_dto import OrderPaymentDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.repositories.kaspi_payment.kaspi_payment_repository import (
     KaspiPaymentRepository,
 )
 from app.adapters.repositories.order.order_repository import OrderRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import OrderModel
 from app.infrastructure.api_clients.kaspi.kaspi_api_client import KaspiPaymentApiClient
 from app.infrastructure.config import app_config
 from app.infrastructure.helpers.kaspi_payment_helper import KaspiPaymentHelper
@@ -30,7 +30,8 @@ class CreateFastPaymentCase(BaseUseCase[KaspiFastPaymentResponseDTO]):
     async def execute(
         self, dto: KaspiFastPaymentFrontendRequestDTO, user: UserWithRelationsDTO
     ) -> KaspiFastPaymentResponseDTO:
-        order = await self.order_repository.get_first_with_filters(
+        order = await self.order_repository.get_first_projection(
+            dto=OrderPaymentDTO,
             filters=[
                 and_(
                     self.order_repository.model.id == dto.order_id,
@@ -47,7 +48,6 @@ class CreateFastPaymentCase(BaseUseCase[KaspiFastPaymentResponseDTO]):
                     ),
                 )
             ],
-            options=self.order_repository.default_relationships(),
         )
         await self.validate(order=order)
         kaspi_request_dto: KaspiFastPaymentDTO = await self.transform(
@@ -55,12 +55,12 @@ class CreateFastPaymentCase(BaseUseCase[KaspiFastPaymentResponseDTO]):
         )
         return await self.service.fast_payments(dto=kaspi_request_dto)
 
-    async def validate(self, order: Optional[OrderModel]):
+    async def validate(self, order: Optional[OrderPaymentDTO]):
         if not order:
             raise AppExceptionResponse.bad_request("Заказ не найден или уже оплачен")
 
     async def transform(
-        self, dto: KaspiFastPaymentFrontendRequestDTO, order: OrderModel
+        self, dto: KaspiFastPaymentFrontendRequestDTO, order: OrderPaymentDTO
     ) -> KaspiFastPaymentDTO:
         return KaspiFastPaymentDTO(
             TranId=str(order.id),
@@ -9,16 +9,16 @@ from app.adapters.dto.kaspi.kaspi_payment_pay_dto import (
     KaspiPaymentPayResponseDTO,
 )
 from app.adapters.dto.order.order_dto import OrderCDTO
+from app.adapters.repositories.base_repository import LoadProfile
 from app.adapters.repositories.kaspi_payment.kaspi_payment_repository import (
     KaspiPaymentRepository,
 )
 from app.adapters.repositories.order.order_repository import OrderRepository
-from app.adapters.repositories.order_status.order_status_repository import (
-    OrderStatusRepository,
-)
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import KaspiPaymentModel, OrderModel
 from app.infrastructure.helpers.kaspi_payment_helper import KaspiPaymentHelper
+from app.infrastructure.services.reference_registry import reference_registry
+from app.infrastructure.unit_of_work import unit_of_work
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -27,7 +27,6 @@ class PayKaspiPaymentCase(BaseUseCase[KaspiPaymentPayResponseDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = KaspiPaymentRepository(db)
         self.order_repository = OrderRepository(db)
-        self.order_status_repository = OrderStatusRepository(db)
 
     async def execute(
         self, dto: KaspiPaymentPayRequestDTO
@@ -85,7 +84,7 @@ class PayKaspiPaymentCase(BaseUseCase[KaspiPaymentPayResponseDTO]):
                     ])
                 )
             ],
-            options=self.order_repository.default_relationships(),
+            options=self.order_repository.load_profile(LoadProfile.MINIMAL),
         )
 
     async def _get_kaspi_payment(
@@ -109,10 +108,12 @@ class PayKaspiPaymentCase(BaseUseCase[KaspiPaymentPayResponseDTO]):
         success: bool,
     ):
         payment_dto = self._prepare_payment_dto(kaspi_payment, dto, success)
-        updated_kaspi_payment = await self.repository.update(
-            obj=kaspi_payment, dto=payment_dto
-        )
-        await self._update_order_status(order, updated_kaspi_payment, success)
+        # Платеж и статус заказа фиксируются одной транзакцией
+        async with unit_of_work(self.repository.db):
+            updated_kaspi_payment = await self.repository.update(
+                obj=kaspi_payment, dto=payment_dto
+            )
+            await self._update_order_status(order, updated_kaspi_payment, success)
 
     def _prepare_payment_dto(
         self,
@@ -149,11 +150,7 @@ class PayKaspiPaymentCase(BaseUseCase[KaspiPaymentPayResponseDTO]):
         await self.order_repository.update(obj=order, dto=dto)
 
     async def _get_order_status(self, status_value: str):
-        order_status = await self.order_status_repository.get_first_with_filters(
-            filters=[
-                func.lower(self.order_status_repository.model.value) == status_value
-            ]
-        )
+        order_status = await reference_registry.get_order_status_by_value(status_value)
         if not order_status:
             raise AppExceptionResponse.internal_error("Статус заказа не найден")
         return order_status
@@ -9,6 +9,7 @@ from app.adapters.dto.operation.operation_dto import (
 from app.adapters.repositories.operation.operation_repository import OperationRepository
 from app.adapters.repositories.role.role_repository import RoleRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -19,15 +20,13 @@ class CreateOperationCase(BaseUseCase[OperationWithRelationsDTO]):
 
     async def execute(self, dto: OperationCDTO) -> OperationWithRelationsDTO:
         obj = await self.validate(dto=dto)
-        data = await self.repository.create(obj=obj)
+        data = await self.repository.create(
+            obj=obj, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.not_found("Процесс не найден")
-        else:
-            existed = await self.repository.get(
-                id=data.id,
-                options=self.repository.default_relationships(),
-            )
-        return OperationWithRelationsDTO.from_orm(existed)
+        await reference_registry.invalidate()
+        return OperationWithRelationsDTO.from_orm(data)
 
     async def validate(self, dto: OperationCDTO):
         dict_dto = dto.dict()
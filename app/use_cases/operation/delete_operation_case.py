@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.repositories.operation.operation_repository import OperationRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -13,6 +14,7 @@ class DeleteOperationCase(BaseUseCase[bool]):
     async def execute(self, id: int) -> bool:
         await self.validate(id=id)
         data = await self.repository.delete(id=id)
+        await reference_registry.invalidate()
         return data
 
     async def validate(self, id: int):
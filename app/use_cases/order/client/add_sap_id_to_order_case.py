@@ -1,17 +1,14 @@
-from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.order.order_dto import OrderCDTO, OrderWithRelationsDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.repositories.order.order_repository import OrderRepository
-from app.adapters.repositories.order_status.order_status_repository import (
-    OrderStatusRepository,
-)
 from app.adapters.repositories.sap_request.sap_request_repository import (
     SapRequestRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import OrderModel, SapRequestModel
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -19,7 +16,6 @@ from app.use_cases.base_case import BaseUseCase
 class AddSapIdToOrderCase(BaseUseCase[OrderWithRelationsDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = OrderRepository(db)
-        self.order_status_repository = OrderStatusRepository(db)
         self.sap_request_repository = SapRequestRepository(db)
 
     async def execute(
@@ -34,15 +30,20 @@ class AddSapIdToOrderCase(BaseUseCase[OrderWithRelationsDTO]):
         if not order:
             raise AppExceptionResponse.bad_request("Заказ не найден")
         await self.validate(order=order, sap_request=sap_request, user=user)
+        return await self.apply(order=order, sap_request=sap_request)
+
+    async def apply(
+        self, order: OrderModel, sap_request: SapRequestModel
+    ) -> OrderWithRelationsDTO:
+        """Перенос результата заявки SAP в заказ (номер заказа SAP и статус)."""
         dto = await self.transform(order=order, sap_request=sap_request)
-        model = await self.repository.update(obj=order, dto=dto)
+        model = await self.repository.update(
+            obj=order, dto=dto, options=self.repository.default_relationships()
+        )
         if not model:
             raise AppExceptionResponse.internal_error(
                 message="Произошла ошибка при добавлении SAP-идентификатора"
             )
-        model = await self.repository.get(
-            id=model.id, options=self.repository.default_relationships()
-        )
         return OrderWithRelationsDTO.from_orm(model)
 
     async def validate(
@@ -68,13 +69,8 @@ class AddSapIdToOrderCase(BaseUseCase[OrderWithRelationsDTO]):
     ) -> OrderCDTO:
         dto = OrderCDTO.from_orm(order)
         if sap_request.is_active and sap_request.zakaz:
-            next_status = await self.order_status_repository.get_first_with_filters(
-                filters=[
-                    and_(
-                        self.order_status_repository.model.value
-                        == AppDbValueConstants.WAITING_FOR_PAYMENT_STATUS
-                    )
-                ]
+            next_status = await reference_registry.get_order_status_by_value(
+                AppDbValueConstants.WAITING_FOR_PAYMENT_STATUS
             )
             if not next_status:
                 raise AppExceptionResponse.bad_request(
@@ -86,15 +82,8 @@ class AddSapIdToOrderCase(BaseUseCase[OrderWithRelationsDTO]):
             dto.status = next_status.value
         else:
             if dto.status == AppDbValueConstants.WAITING_FOR_INVOICE_CREATION_STATUS:
-                error_status = (
-                    await self.order_status_repository.get_first_with_filters(
-                        filters=[
-                            and_(
-                                self.order_status_repository.model.value
-                                == AppDbValueConstants.INVOICE_CREATION_ERROR_STATUS
-                            )
-                        ]
-                    )
+                error_status = await reference_registry.get_order_status_by_value(
+                    AppDbValueConstants.INVOICE_CREATION_ERROR_STATUS
                 )
                 if not error_status:
                     raise AppExceptionResponse.bad_request(message="Статус не найден")
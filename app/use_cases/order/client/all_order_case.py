@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.order.order_dto import OrderWithRelationsDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.filters.order.client.order_client_filter import OrderClientFilter
+from app.adapters.repositories.base_repository import LoadProfile
 from app.adapters.repositories.order.order_repository import OrderRepository
 from app.use_cases.base_case import BaseUseCase
 
@@ -15,7 +16,7 @@ class AllClientOrderCase(BaseUseCase[list[OrderWithRelationsDTO]]):
         self, parameters: OrderClientFilter, user: UserWithRelationsDTO
     ) -> list[OrderWithRelationsDTO]:
         models = await self.repository.get_with_filters(
-            options=self.repository.default_relationships(),
+            options=self.repository.load_profile(LoadProfile.LIST),
             filters=parameters.apply(user=user),
         )
         return [OrderWithRelationsDTO.from_orm(model) for model in models]
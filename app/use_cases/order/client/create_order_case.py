@@ -8,9 +8,6 @@ from app.adapters.dto.order.order_dto import OrderCDTO, OrderWithRelationsDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.repositories.material.material_repository import MaterialRepository
 from app.adapters.repositories.order.order_repository import OrderRepository
-from app.adapters.repositories.order_status.order_status_repository import (
-    OrderStatusRepository,
-)
 from app.adapters.repositories.organization.organization_repository import (
     OrganizationRepository,
 )
@@ -19,6 +16,7 @@ from app.adapters.repositories.sap_request.sap_request_repository import (
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.config import app_config
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -28,7 +26,6 @@ class CreateClientOrderCase(BaseUseCase[OrderWithRelationsDTO]):
         self.repository = OrderRepository(db)
         self.material_repository = MaterialRepository(db)
         self.organization_repository = OrganizationRepository(db)
-        self.order_status_repository = OrderStatusRepository(db)
         self.sap_request_repository = SapRequestRepository(db)
 
     async def execute(
@@ -38,12 +35,12 @@ class CreateClientOrderCase(BaseUseCase[OrderWithRelationsDTO]):
     ) -> OrderWithRelationsDTO:
         await self.validate(dto, user)
         dto: OrderCDTO = await self.transform(dto=dto, user=user)
-        model = await self.repository.create(obj=self.repository.model(**dto.dict()))
+        model = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
+            options=self.repository.default_relationships(),
+        )
         if not model:
             raise AppExceptionResponse.internal_error("Ошибка создания заказа")
-        model = await self.repository.get(
-            id=model.id, options=self.repository.default_relationships()
-        )
         return OrderWithRelationsDTO.from_orm(model)
 
     async def validate(self, dto: CreateOrderDTO, user: UserWithRelationsDTO):
@@ -102,13 +99,8 @@ class CreateClientOrderCase(BaseUseCase[OrderWithRelationsDTO]):
             ],
             options=self.material_repository.default_relationships(),
         )
-        first_status = await self.order_status_repository.get_first_with_filters(
-            filters=[
-                and_(
-                    self.order_status_repository.model.value
-                    == AppDbValueConstants.WAITING_FOR_INVOICE_CREATION_STATUS
-                )
-            ]
+        first_status = await reference_registry.get_order_status_by_value(
+            AppDbValueConstants.WAITING_FOR_INVOICE_CREATION_STATUS
         )
         if not material or not first_status:
             raise AppExceptionResponse.bad_request(
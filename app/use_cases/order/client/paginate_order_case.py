@@ -4,6 +4,7 @@ from app.adapters.dto.order.order_dto import OrderWithRelationsDTO
 from app.adapters.dto.pagination_dto import PaginationOrderWithRelationsDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.filters.order.client.order_client_filter import OrderClientFilter
+from app.adapters.repositories.base_repository import LoadProfile
 from app.adapters.repositories.order.order_repository import OrderRepository
 from app.use_cases.base_case import BaseUseCase
 
@@ -21,7 +22,9 @@ class PaginateClientOrderCase(BaseUseCase[PaginationOrderWithRelationsDTO]):
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
-            options=self.repository.default_relationships(),
+            cursor=filter.cursor,
+            relevance=filter.get_search_relevance(),
+            options=self.repository.load_profile(LoadProfile.LIST),
             filters=filter.apply(user=user),
         )
         return models
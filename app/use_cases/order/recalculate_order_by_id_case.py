@@ -40,9 +40,9 @@ class RecalculateOrderByIdCase(BaseUseCase[OrderWithRelationsDTO]):
             cdto = OrderCDTO.from_orm(order)
             cdto.quan_booked = quan_booked
             cdto.quan_released = quan_released
-            await self.repository.update(obj=order,dto=cdto)
-            order = await self.repository.get(
-                id=id,
+            order = await self.repository.update(
+                obj=order,
+                dto=cdto,
                 options=self.repository.default_relationships()
             )
         return OrderWithRelationsDTO.from_orm(order)
@@ -10,6 +10,7 @@ from app.adapters.repositories.order_status.order_status_repository import (
     OrderStatusRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -19,15 +20,13 @@ class CreateOrderStatusCase(BaseUseCase[OrderStatusWithRelationsDTO]):
 
     async def execute(self, dto: OrderStatusCDTO) -> OrderStatusWithRelationsDTO:
         obj = await self.validate(dto=dto)
-        data = await self.repository.create(obj=obj)
+        data = await self.repository.create(
+            obj=obj, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.not_found("Статус заказа не найден")
-        else:
-            existed = await self.repository.get(
-                id=data.id,
-                options=self.repository.default_relationships(),
-            )
-        return OrderStatusWithRelationsDTO.from_orm(existed)
+        await reference_registry.invalidate()
+        return OrderStatusWithRelationsDTO.from_orm(data)
 
     async def validate(self, dto: OrderStatusCDTO):
         dict_dto = dto.dict()
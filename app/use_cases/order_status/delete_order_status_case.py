@@ -4,6 +4,7 @@ from app.adapters.repositories.order_status.order_status_repository import (
     OrderStatusRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -15,6 +16,7 @@ class DeleteOrderStatusCase(BaseUseCase[bool]):
     async def execute(self, id: int) -> bool:
         await self.validate(id=id)
         data = await self.repository.delete(id=id)
+        await reference_registry.invalidate()
         return data
 
     async def validate(self, id: int):
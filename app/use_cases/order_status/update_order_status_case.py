@@ -11,6 +11,7 @@ from app.adapters.repositories.order_status.order_status_repository import (
     OrderStatusRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -22,15 +23,13 @@ class UpdateOrderStatusCase(BaseUseCase[OrderStatusWithRelationsDTO]):
         self, id: int, dto: OrderStatusCDTO
     ) -> OrderStatusWithRelationsDTO:
         obj = await self.validate(id=id, dto=dto)
-        data = await self.repository.update(obj=obj, dto=dto)
+        data = await self.repository.update(
+            obj=obj, dto=dto, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.not_found("Статус заказа не найден")
-        else:
-            existed = await self.repository.get(
-                id=data.id,
-                options=self.repository.default_relationships(),
-            )
-        return OrderStatusWithRelationsDTO.from_orm(existed)
+        await reference_registry.invalidate()
+        return OrderStatusWithRelationsDTO.from_orm(data)
 
     async def validate(self, id: int, dto: OrderStatusCDTO):
         existed = await self.repository.get(id=id)
@@ -22,6 +22,10 @@ from app.infrastructure.config import app_config
 from app.infrastructure.services.file_service import FileService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_constants import AppDbValueConstants
+from app.use_cases.auth.get_current_user_case import (
+    invalidate_current_user,
+    invalidate_organization_owners,
+)
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -49,15 +53,15 @@ class EditClientOrganizationCase(BaseUseCase[OrganizationWithRelationsDTO]):
                 extensions=self.extensions,
             )
         dto = await self.transform(dto=dto, file=file_model, model=model, user=user)
-        model = await self.repository.update(obj=model, dto=dto)
+        model = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при обновлении организации"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
+        invalidate_organization_owners(model.id)
+        invalidate_current_user(model.owner_id)
         return OrganizationWithRelationsDTO.from_orm(model)
 
     async def validate(
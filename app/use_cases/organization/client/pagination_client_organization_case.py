@@ -26,6 +26,8 @@ class PaginateClientOrganizationCase(
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
+            cursor=filter.cursor,
+            relevance=filter.get_search_relevance(),
             options=self.repository.default_relationships(),
             filters=filter.apply(client_id=client_id),
         )
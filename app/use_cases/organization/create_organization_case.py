@@ -20,6 +20,7 @@ from app.entities import FileModel
 from app.infrastructure.services.file_service import FileService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_constants import AppDbValueConstants
+from app.use_cases.auth.get_current_user_case import invalidate_current_user
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -42,15 +43,15 @@ class CreateOrganizationCase(BaseUseCase[OrganizationWithRelationsDTO]):
                 extensions=self.extensions,
             )
             dto = await self.transform(dto=dto, file=file_model)
-        model = await self.repository.create(obj=self.repository.model(**dto.dict()))
+        model = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
+            options=self.repository.default_relationships(),
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при создании организации"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
+        invalidate_current_user(model.owner_id)
         return OrganizationWithRelationsDTO.from_orm(model)
 
     async def validate(self, dto: OrganizationCDTO):
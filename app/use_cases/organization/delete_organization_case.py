@@ -5,6 +5,7 @@ from app.adapters.repositories.organization.organization_repository import (
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.services.file_service import FileService
+from app.use_cases.auth.get_current_user_case import invalidate_organization_owners
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -17,6 +18,7 @@ class DeleteOrganizationCase(BaseUseCase[bool]):
     async def execute(self, id: int) -> bool:
         await self.validate(id=id)
         data = await self.repository.delete(id=id)
+        invalidate_organization_owners(id)
         return data
 
     async def validate(self, id: int):
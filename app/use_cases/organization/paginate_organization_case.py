@@ -22,6 +22,8 @@ class PaginateOrganizationCase(BaseUseCase[PaginationOrganizationWithRelationsDT
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
+            cursor=filter.cursor,
+            relevance=filter.get_search_relevance(),
             options=self.repository.default_relationships(),
             filters=filter.apply(),
         )
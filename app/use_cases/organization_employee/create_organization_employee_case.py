@@ -31,15 +31,14 @@ class CreateOrganizationEmployeeCase(BaseUseCase[OrganizationEmployeeWithRelatio
         self, dto: OrganizationEmployeeCDTO
     ) -> OrganizationEmployeeWithRelationsDTO:
         dto = await self.validate(dto)
-        model = await self.repository.create(obj=self.repository.model(**dto.dict()))
+        model = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
+            options=self.repository.default_relationships(),
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при создании организации-работник"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
         return OrganizationEmployeeWithRelationsDTO.from_orm(model)
 
     async def validate(self, dto: OrganizationEmployeeCDTO):
@@ -30,6 +30,8 @@ class PaginateOrganizationEmployeeCase(
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
+            cursor=filter.cursor,
+            relevance=filter.get_search_relevance(),
             options=self.repository.default_relationships(),
             filters=filter.apply(),
         )
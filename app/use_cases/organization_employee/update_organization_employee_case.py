@@ -36,15 +36,13 @@ class UpdateOrganizationEmployeeCase(BaseUseCase[OrganizationEmployeeWithRelatio
                 message="Организация-работник не найдена"
             )
         dto = await self.validate(id=id, dto=dto)
-        model = await self.repository.update(obj=model, dto=dto)
+        model = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при обновлении организации-работник"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
         return OrganizationEmployeeWithRelationsDTO.from_orm(model)
 
     async def validate(self, id: id, dto: OrganizationEmployeeCDTO):
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.role.role_dto import RoleCDTO, RoleRDTO
 from app.adapters.repositories.role.role_repository import RoleRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -16,6 +17,7 @@ class UpdateRoleCase(BaseUseCase[RoleRDTO]):
     async def execute(self, id: int, dto: RoleCDTO) -> RoleRDTO:
         obj = await self.validate(id=id, dto=dto)
         data = await self.repository.update(obj=obj, dto=dto)
+        await reference_registry.invalidate()
         return RoleRDTO.from_orm(data)
 
     async def validate(self, id: int, dto: RoleCDTO):
@@ -11,6 +11,9 @@ from app.adapters.dto.sap.create_sap_order_dto import (
 from app.adapters.dto.sap.sap_request_dto import SapRequestCDTO, SapRequestRDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.repositories.order.order_repository import OrderRepository
+from app.adapters.repositories.sap_outbox.sap_outbox_repository import (
+    SapOutboxRepository,
+)
 from app.adapters.repositories.sap_request.sap_request_repository import (
     SapRequestRepository,
 )
@@ -19,6 +22,11 @@ from app.entities import OrderModel
 from app.infrastructure.api_clients.sap.sap_create_order_client import (
     SapCreateOrderApiClient,
 )
+from app.infrastructure.helpers.sap_pdf_helper import SapPdfHelper
+from app.infrastructure.services.file_service import FileService
+from app.infrastructure.services.sap_contract_cache import sap_contract_cache
+from app.infrastructure.services.sap_order_batcher import sap_order_batcher
+from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -28,7 +36,10 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = SapRequestRepository(db)
         self.order_repository = OrderRepository(db)
+        self.outbox_repository = SapOutboxRepository(db)
         self.service = SapCreateOrderApiClient()
+        self.batcher = sap_order_batcher
+        self.file_service = FileService(db)
 
     async def execute(
         self,
@@ -37,12 +48,31 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
     ) -> SapRequestRDTO:
         order = await self.order_repository.get(id=order_id)
         await self.validate(order=order, user=user)
-        sap_dto = await self.transform(order=order, user=user)
+        return await self.submit(order=order)
+
+    async def submit(self, order: OrderModel, batched: bool = False) -> SapRequestRDTO:
+        """
+        Отправка заявки в SAP и сохранение ответа. Владелец заказа здесь не
+        проверяется: метод вызывается и воркером outbox (см. ProcessSapOutboxCase).
+        С `batched` заявка уходит в SAP в общем пакете (см. SapOrderBatcher).
+        """
+        response = await self.send(order=order, batched=batched)
+        return await self.save(order=order, response=response)
+
+    async def send(self, order: OrderModel, batched: bool = False) -> SapStatusDTO:
+        """Только вызов SAP 088, без обращений к БД."""
         create_sap_dto = self._create_sap_request_payload(order)
-        response = await self.service.create_sap_order(create_sap_dto)
-        dto = await self.transform(
-            order=order, user=user, dto=sap_dto, response=response
-        )
+        service = self.batcher if batched else self.service
+        response = await service.create_sap_order(create_sap_dto)
+        if order.dogovor and order.bin:
+            # Заказ по договору уменьшает его остатки в SAP 083
+            await sap_contract_cache.invalidate(order.bin)
+        return response
+
+    async def save(self, order: OrderModel, response: SapStatusDTO) -> SapRequestRDTO:
+        """Сохранение ответа SAP заявкой SapRequestModel (и PDF файлом)."""
+        sap_dto = await self.transform(order=order)
+        dto = await self.transform(order=order, dto=sap_dto, response=response)
         model = await self.repository.create(obj=self.repository.model(**dto.dict()))
         if not model:
             raise AppExceptionResponse().internal_error(
@@ -53,10 +83,21 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
     async def validate(self, order: Optional[OrderModel], user: UserWithRelationsDTO):
         if not order:
             raise AppExceptionResponse.not_found(message="Заказ не найден")
-        if order.sap_id or order.zakaz:
-            raise AppExceptionResponse.bad_request(message="Заказ уже сформирован")
         if order.owner_id != user.id:
             raise AppExceptionResponse.bad_request(message="Заказ принадлежит не вам!")
+        self.validate_state(order)
+        outbox = await self.outbox_repository.get_latest_for_order(order.id)
+        if outbox and outbox.status == AppDbValueConstants.SAP_OUTBOX_REVIEW_STATUS:
+            # Прошлая заявка могла создать заказ в SAP: повтор его задублирует
+            raise AppExceptionResponse.bad_request(
+                message="Заказ ожидает сверки с SAP, повторная отправка недоступна"
+            )
+
+    @staticmethod
+    def validate_state(order: OrderModel):
+        """Заявку в SAP можно отправить только для еще не сформированного заказа."""
+        if order.sap_id or order.zakaz:
+            raise AppExceptionResponse.bad_request(message="Заказ уже сформирован")
         if order.status not in [
             AppDbValueConstants.WAITING_FOR_INVOICE_CREATION_STATUS,
             AppDbValueConstants.INVOICE_CREATION_ERROR_STATUS,
@@ -68,7 +109,7 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
     async def transform(
         self,
         order: OrderModel,
-        user: UserWithRelationsDTO,
+        user: Optional[UserWithRelationsDTO] = None,
         dto: Optional[SapRequestCDTO] = None,
         response: Optional[SapStatusDTO] = None,
     ) -> SapRequestCDTO:
@@ -85,7 +126,7 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
                 status=None,
                 zakaz=None,
                 text=None,
-                pdf=None,
+                file_id=None,
                 date=None,
                 time=None,
                 is_active=False,
@@ -97,7 +138,9 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
             dto.status = f"{active_response.STATUS}"
             dto.zakaz = active_response.ZAKAZ
             dto.text = active_response.TEXT
-            dto.pdf = active_response.PDF
+            dto.file_id = await self._save_pdf(
+                pdf=active_response.PDF, zakaz=dto.zakaz, order=order
+            )
             if active_response.DATE:
                 dto.date = datetime.strptime(active_response.DATE, "%Y-%m-%d").date()
             if active_response.TIME:
@@ -108,6 +151,21 @@ class CreateClientSapOrderCase(BaseUseCase[SapRequestRDTO]):
                 dto.is_paid = False
         return dto
 
+    async def _save_pdf(
+        self, pdf: Optional[str], zakaz: Optional[str], order: OrderModel
+    ) -> Optional[int]:
+        """PDF из ответа SAP сохраняется файлом, в заявке остается только file_id."""
+        content = SapPdfHelper.decode(pdf)
+        if not content:
+            return None
+        file = await self.file_service.save_content(
+            content=content,
+            filename=SapPdfHelper.get_filename(zakaz=zakaz, order_id=order.id),
+            uploaded_folder=AppFileExtensionConstants.SapRequestFolderName,
+            content_type=SapPdfHelper.CONTENT_TYPE,
+        )
+        return file.id
+
     def _create_sap_request_payload(
         self, model: OrderModel
     ) -> Union[CreateLegalSapOrderDTO, CreateIndividualSapOrderDTO]:
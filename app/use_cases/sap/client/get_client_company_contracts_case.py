@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.sap.sap_contract_dto import SapContractForResponseDTO
+from app.adapters.dto.user.user_dto import UserWithRelationsDTO
+from app.adapters.repositories.organization.organization_repository import (
+    OrganizationRepository,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.entities import OrganizationModel
+from app.infrastructure.services.sap_contract_cache import sap_contract_cache
+from app.use_cases.base_case import BaseUseCase
+
+
+class GetClientCompanyContractsCase(BaseUseCase[List[SapContractForResponseDTO]]):
+    """Договоры организации клиента из SAP 083 (через кэш по БИН)."""
+
+    def __init__(self, db: AsyncSession):
+        self.organization_repository = OrganizationRepository(db)
+
+    async def execute(
+        self, organization_id: int, user: UserWithRelationsDTO
+    ) -> List[SapContractForResponseDTO]:
+        organization = await self.organization_repository.get(id=organization_id)
+        await self.validate(organization=organization, user=user)
+        return await sap_contract_cache.get(organization.bin)
+
+    async def validate(
+        self, organization: Optional[OrganizationModel], user: UserWithRelationsDTO
+    ):
+        if not organization:
+            raise AppExceptionResponse.not_found("Организация не найдена")
+        if organization.owner_id != user.id:
+            raise AppExceptionResponse.bad_request(
+                "Вы не являетесь владельцем этой организации"
+            )
@@ -0,0 +1,59 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.sap.sap_outbox_dto import SapOrderStatusDTO
+from app.adapters.dto.user.user_dto import UserWithRelationsDTO
+from app.adapters.repositories.order.order_repository import OrderRepository
+from app.adapters.repositories.sap_outbox.sap_outbox_repository import (
+    SapOutboxRepository,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.entities import OrderModel
+from app.shared.db_constants import AppDbValueConstants
+from app.use_cases.base_case import BaseUseCase
+
+
+class GetClientSapOrderStatusCase(BaseUseCase[SapOrderStatusDTO]):
+    def __init__(self, db: AsyncSession):
+        self.repository = SapOutboxRepository(db)
+        self.order_repository = OrderRepository(db)
+
+    async def execute(
+        self, order_id: int, user: UserWithRelationsDTO
+    ) -> SapOrderStatusDTO:
+        order = await self.order_repository.get_first_with_filters(
+            filters=[
+                and_(
+                    self.order_repository.model.id == order_id,
+                    or_(
+                        self.order_repository.model.owner_id == user.id,
+                        self.order_repository.model.iin == user.iin,
+                        self.order_repository.model.owner_sid == user.sid,
+                    ),
+                )
+            ]
+        )
+        await self.validate(order=order)
+        return await self.get_status(order)
+
+    async def validate(self, order: OrderModel):
+        if not order:
+            raise AppExceptionResponse.not_found("Заказ не найден")
+
+    async def get_status(self, order: OrderModel) -> SapOrderStatusDTO:
+        """Состояние отправки по последней записи outbox заказа."""
+        outbox = await self.repository.get_latest_for_order(order.id)
+        return SapOrderStatusDTO(
+            order_id=order.id,
+            order_status=order.status,
+            zakaz=order.zakaz,
+            sap_request_id=order.sap_id or (outbox.sap_request_id if outbox else None),
+            outbox_status=outbox.status if outbox else None,
+            attempts=outbox.attempts if outbox else 0,
+            next_attempt_at=outbox.next_attempt_at if outbox else None,
+            last_error=outbox.last_error if outbox else None,
+            is_final=(
+                not outbox
+                or outbox.status in AppDbValueConstants.SAP_OUTBOX_FINAL_STATUSES
+            ),
+        )
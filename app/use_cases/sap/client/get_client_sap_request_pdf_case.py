@@ -0,0 +1,67 @@
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, undefer
+
+from app.adapters.dto.user.user_dto import UserWithRelationsDTO
+from app.adapters.repositories.sap_request.sap_request_repository import (
+    SapRequestRepository,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.entities import FileModel, OrderModel, SapRequestModel
+from app.infrastructure.helpers.sap_pdf_helper import SapPdfHelper
+from app.infrastructure.services.file_service import FileService
+from app.infrastructure.unit_of_work import unit_of_work
+from app.shared.app_file_constants import AppFileExtensionConstants
+from app.use_cases.base_case import BaseUseCase
+
+
+class GetClientSapRequestPdfCase(BaseUseCase[FileModel]):
+    def __init__(self, db: AsyncSession):
+        self.repository = SapRequestRepository(db)
+        self.file_service = FileService(db)
+
+    async def execute(self, id: int, user: UserWithRelationsDTO) -> FileModel:
+        sap_request = await self.repository.get_first_with_filters(
+            filters=[
+                and_(
+                    self.repository.model.id == id,
+                    self.repository.model.order.has(
+                        or_(
+                            OrderModel.owner_id == user.id,
+                            OrderModel.iin == user.iin,
+                            OrderModel.owner_sid == user.sid,
+                        )
+                    ),
+                )
+            ],
+            options=[
+                undefer(self.repository.model.pdf),
+                selectinload(self.repository.model.file),
+            ],
+        )
+        if not sap_request:
+            raise AppExceptionResponse.not_found("Заявка SAP не найдена")
+        if not sap_request.file and sap_request.pdf:
+            await self._move_pdf_to_file(sap_request)
+        await self.validate(sap_request=sap_request)
+        return sap_request.file
+
+    async def validate(self, sap_request: SapRequestModel):
+        if not sap_request.file or not await FileService.exists(sap_request.file):
+            raise AppExceptionResponse.not_found("PDF заказа не найден")
+
+    async def _move_pdf_to_file(self, sap_request: SapRequestModel) -> None:
+        """Старая запись с PDF в base64 переносится в файл при первом скачивании."""
+        content = SapPdfHelper.decode(sap_request.pdf)
+        if not content:
+            return
+        async with unit_of_work(self.repository.db):
+            sap_request.file = await self.file_service.save_content(
+                content=content,
+                filename=SapPdfHelper.get_filename(
+                    zakaz=sap_request.zakaz, order_id=sap_request.order_id
+                ),
+                uploaded_folder=AppFileExtensionConstants.SapRequestFolderName,
+                content_type=SapPdfHelper.CONTENT_TYPE,
+            )
+            sap_request.pdf = None
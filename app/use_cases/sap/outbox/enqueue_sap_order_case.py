@@ -0,0 +1,42 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.sap.sap_outbox_dto import SapOutboxCDTO, SapOutboxRDTO
+from app.adapters.repositories.sap_outbox.sap_outbox_repository import (
+    SapOutboxRepository,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.shared.db_constants import AppDbValueConstants
+from app.use_cases.base_case import BaseUseCase
+
+
+class EnqueueSapOrderCase(BaseUseCase[SapOutboxRDTO]):
+    """
+    Запись в outbox заявки на создание заказа в SAP. Вызывается в той же
+    единице работы, что и создание заказа: заказ без заявки не появится.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.repository = SapOutboxRepository(db)
+
+    async def execute(self, order_id: int) -> SapOutboxRDTO:
+        dto = await self.transform(order_id=order_id)
+        model = await self.repository.create(obj=self.repository.model(**dto.dict()))
+        if not model:
+            raise AppExceptionResponse.internal_error(
+                message="Ошибка постановки заказа в очередь отправки в SAP"
+            )
+        return SapOutboxRDTO.from_orm(model)
+
+    async def validate(self):
+        pass
+
+    async def transform(self, order_id: int) -> SapOutboxCDTO:
+        return SapOutboxCDTO(
+            order_id=order_id,
+            sap_request_id=None,
+            status=AppDbValueConstants.SAP_OUTBOX_PENDING_STATUS,
+            attempts=0,
+            next_attempt_at=None,
+            last_error=None,
+            sent_at=None,
+        )
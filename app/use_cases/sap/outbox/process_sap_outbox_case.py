@@ -0,0 +1,223 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.sap.sap_outbox_dto import SapOrderStatusDTO
+from app.adapters.repositories.order.order_repository import OrderRepository
+from app.adapters.repositories.sap_outbox.sap_outbox_repository import (
+    SapOutboxRepository,
+)
+from app.adapters.repositories.sap_request.sap_request_repository import (
+    SapRequestRepository,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.entities import OrderModel, SapOutboxModel
+from app.infrastructure.api_clients.sap.sap_create_order_client import (
+    is_order_outcome_unknown,
+)
+from app.infrastructure.config import app_config
+from app.infrastructure.services.reference_registry import reference_registry
+from app.infrastructure.services.sap_outbox_queue import sap_outbox_queue
+from app.infrastructure.unit_of_work import is_commit_deferred, unit_of_work
+from app.shared.db_constants import AppDbValueConstants
+from app.use_cases.base_case import BaseUseCase
+from app.use_cases.order.client.add_sap_id_to_order_case import AddSapIdToOrderCase
+from app.use_cases.sap.client.create_client_sap_order_case import (
+    CreateClientSapOrderCase,
+)
+from app.use_cases.sap.client.get_client_sap_order_status_case import (
+    GetClientSapOrderStatusCase,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessSapOutboxCase(BaseUseCase[Optional[SapOrderStatusDTO]]):
+    """
+    Отправка одной записи outbox в SAP 088 (вызывается воркером).
+
+    - Запись захватывается атомарно на `sap_outbox_lease_sec`; если воркер
+      упадет, запись снова станет доступной по истечении аренды.
+    - Заявка уходит в SAP в общем пакете с заявками, которые воркер
+      обрабатывает параллельно (SapOrderBatcher). На время ожидания ответа
+      транзакция закрыта и соединение возвращено в пул.
+    - Ответ SAP (и успешный, и с отказом по заказу) фиксируется вместе с
+      заявкой SapRequestModel и статусом заказа в одной транзакции.
+    - Ошибки, при которых заявка до SAP не дошла или была отклонена,
+      повторяются с экспоненциальной задержкой; после
+      `sap_outbox_max_attempts` попыток заказ переводится в статус ошибки
+      формирования счета, откуда клиент может отправить его повторно.
+    - Заявка 088 создает заказ и не идемпотентна: на дедупликацию по
+      ORDER_ID на стороне SAP не рассчитываем, а поиска заказа по ORDER_ID
+      в интерфейсе нет. Поэтому если заказ мог быть создан, но ответа нет
+      (таймаут или разрыв после отправки, нечитаемый ответ, истекшая аренда
+      предыдущей попытки), запись не повторяется, а переводится в `review`
+      для ручной сверки с SAP.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = SapOutboxRepository(db)
+        self.order_repository = OrderRepository(db)
+        self.sap_request_repository = SapRequestRepository(db)
+        self.sap_case = CreateClientSapOrderCase(db)
+        self.add_sap_id_case = AddSapIdToOrderCase(db)
+        self.status_case = GetClientSapOrderStatusCase(db)
+
+    async def execute(self, outbox_id: int) -> Optional[SapOrderStatusDTO]:
+        now = datetime.now()
+        lease_until = now + timedelta(seconds=app_config.sap_outbox_lease_sec)
+        claimed_from = await self.repository.claim(
+            outbox_id, now=now, lease_until=lease_until
+        )
+        if not claimed_from:
+            # Запись уже обработана, не подошел срок или ее взял другой воркер
+            return None
+        outbox = await self.repository.get(id=outbox_id)
+        order_id, attempts = outbox.order_id, outbox.attempts
+        order = await self.order_repository.get(id=order_id)
+        try:
+            await self.validate(order=order)
+        except HTTPException as exc:
+            # Повторять нечего: заказ уже сформирован (например, повторной
+            # отправкой клиента) или ушел на другой этап
+            if order and order.sap_id:
+                await self._finish(
+                    outbox_id,
+                    status=AppDbValueConstants.SAP_OUTBOX_SENT_STATUS,
+                    sap_request_id=order.sap_id,
+                )
+            else:
+                await self._finish(
+                    outbox_id,
+                    status=AppDbValueConstants.SAP_OUTBOX_FAILED_STATUS,
+                    last_error=str(exc.detail),
+                )
+            return await self._publish(order)
+        if claimed_from == AppDbValueConstants.SAP_OUTBOX_PROCESSING_STATUS:
+            # Предыдущая попытка не завершилась: заявка могла уйти в SAP
+            await self._hold_for_review(
+                outbox_id,
+                order_id=order_id,
+                error="Аренда истекла до конца отправки: заказ мог быть создан в SAP",
+            )
+            return await self._publish(order)
+        # Чтение закончено: не держим соединение в транзакции до ответа SAP
+        await self.db.commit()
+        try:
+            response = await self.sap_case.send(order=order, batched=True)
+            async with unit_of_work(self.db):
+                sap_request = await self.sap_case.save(order=order, response=response)
+                await self.add_sap_id_case.apply(
+                    order=order,
+                    sap_request=await self.sap_request_repository.get(
+                        id=sap_request.id
+                    ),
+                )
+                await self._finish(
+                    outbox_id,
+                    status=AppDbValueConstants.SAP_OUTBOX_SENT_STATUS,
+                    sap_request_id=sap_request.id,
+                    sent_at=datetime.now(),
+                )
+        except Exception as exc:
+            # После отката объекты сессии устарели, дальше работаем по id
+            await self._retry_or_fail(
+                outbox_id, order_id=order_id, attempts=attempts, exc=exc
+            )
+        return await self._publish(order)
+
+    async def validate(self, order: Optional[OrderModel]):
+        if not order:
+            raise AppExceptionResponse.not_found(message="Заказ не найден")
+        CreateClientSapOrderCase.validate_state(order)
+
+    async def _retry_or_fail(
+        self, outbox_id: int, order_id: int, attempts: int, exc: Exception
+    ) -> None:
+        error = str(exc.detail) if isinstance(exc, HTTPException) else str(exc)
+        if is_order_outcome_unknown(exc):
+            await self._hold_for_review(outbox_id, order_id=order_id, error=error)
+            return
+        if attempts >= app_config.sap_outbox_max_attempts:
+            logger.error(
+                f"Заказ {order_id} не отправлен в SAP после {attempts} попыток: {error}"
+            )
+            async with unit_of_work(self.db):
+                await self._set_order_error_status(order_id)
+                await self._finish(
+                    outbox_id,
+                    status=AppDbValueConstants.SAP_OUTBOX_FAILED_STATUS,
+                    last_error=error,
+                )
+            return
+        delay = min(
+            app_config.sap_outbox_retry_base_sec * 2 ** (attempts - 1),
+            app_config.sap_outbox_retry_max_sec,
+        )
+        logger.warning(
+            f"Заказ {order_id}: попытка {attempts} отправки в SAP не удалась, "
+            f"повтор через {delay:.0f} с: {error}"
+        )
+        await self._finish(
+            outbox_id,
+            status=AppDbValueConstants.SAP_OUTBOX_PENDING_STATUS,
+            last_error=error,
+            next_attempt_at=datetime.now() + timedelta(seconds=delay),
+        )
+
+    async def _hold_for_review(self, outbox_id: int, order_id: int, error: str) -> None:
+        """
+        Исход неизвестен: повтор может создать в SAP второй заказ. Запись
+        ждет сверки — оператор находит заказ в SAP по ORDER_ID и либо
+        проставляет номер, либо возвращает запись в pending.
+        """
+        logger.error(
+            f"Заказ {order_id}: неизвестно, создан ли заказ в SAP, "
+            f"нужна ручная сверка: {error}"
+        )
+        await self._finish(
+            outbox_id,
+            status=AppDbValueConstants.SAP_OUTBOX_REVIEW_STATUS,
+            last_error=error,
+        )
+
+    async def _set_order_error_status(self, order_id: int) -> None:
+        error_status = await reference_registry.get_order_status_by_value(
+            AppDbValueConstants.INVOICE_CREATION_ERROR_STATUS
+        )
+        if not error_status:
+            raise AppExceptionResponse.bad_request(message="Статус не найден")
+        await self.db.execute(
+            update(OrderModel)
+            .where(
+                OrderModel.id == order_id,
+                OrderModel.status
+                == AppDbValueConstants.WAITING_FOR_INVOICE_CREATION_STATUS,
+            )
+            .values(status_id=error_status.id, status=error_status.value)
+        )
+
+    async def _finish(self, outbox_id: int, **values) -> None:
+        values.setdefault("next_attempt_at", None)
+        await self.db.execute(
+            update(SapOutboxModel)
+            .where(SapOutboxModel.id == outbox_id)
+            .values(updated_at=datetime.now(), **values)
+        )
+        if not is_commit_deferred(self.db):
+            await self.db.commit()
+
+    async def _publish(
+        self, order: Optional[OrderModel]
+    ) -> Optional[SapOrderStatusDTO]:
+        if not order:
+            return None
+        await self.db.refresh(order)
+        status = await self.status_case.get_status(order)
+        await sap_outbox_queue.publish(status)
+        return status
@@ -1,18 +1,17 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.dto.operation.operation_dto import OperationRDTO
 from app.adapters.dto.order.order_dto import OrderCDTO
 from app.adapters.dto.schedule.create_schedule_dto import CreateScheduleDTO
 from app.adapters.dto.schedule.schedule_dto import ScheduleWithRelationsDTO, ScheduleRDTO, ScheduleCDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
 from app.adapters.dto.workshop_schedule.workshop_schedule_by_day_dto import WorkshopScheduleByDayDTO
 from app.adapters.dto.workshop_schedule.workshop_schedule_space_dto import WorkshopScheduleSpaceDTO
-from app.adapters.repositories.operation.operation_repository import OperationRepository
 from app.adapters.repositories.order.order_repository import OrderRepository
-from app.adapters.repositories.order_status.order_status_repository import OrderStatusRepository
 from app.adapters.repositories.organization.organization_repository import OrganizationRepository
 from app.adapters.repositories.organization_employee.organization_employee_repository import \
     OrganizationEmployeeRepository
@@ -21,8 +20,12 @@ from app.adapters.repositories.user.user_repository import UserRepository
 from app.adapters.repositories.vehicle.vehicle_repository import VehicleRepository
 from app.adapters.repositories.workshop_schdedule.workshop_schedule_repository import WorkshopScheduleRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import OrderModel, OrganizationModel, VehicleModel, ScheduleModel, OperationModel
+from app.entities import OrderModel, OrganizationModel, VehicleModel, ScheduleModel, \
+    WorkshopScheduleModel
 from app.infrastructure.config import app_config
+from app.infrastructure.services.reference_registry import reference_registry
+from app.infrastructure.services.slot_occupancy_service import SlotOccupancyService
+from app.infrastructure.unit_of_work import unit_of_work
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 from app.use_cases.order.recalculate_order_by_id_case import RecalculateOrderByIdCase
@@ -39,16 +42,16 @@ class CreateClientScheduleCase(BaseUseCase[ScheduleWithRelationsDTO]):
         self.get_workshop_schedule_by_day_case = GetWorkshopScheduleByDayCase(db)
         self.recalculate_order_by_id_case = RecalculateOrderByIdCase(db)
         self.order_repository = OrderRepository(db)
-        self.order_status_repository = OrderStatusRepository(db)
-        self.operation_repository = OperationRepository(db)
         self.workshop_schedule_repository = WorkshopScheduleRepository(db)
+        self.slot_occupancy_service = SlotOccupancyService(db)
         #Global Variables
         self.order:Optional[OrderModel] = None
         self.driver = None
         self.organization:Optional[OrganizationModel] = None
         self.vehicle:Optional[VehicleModel] = None
         self.trailer:Optional[VehicleModel] = None
-        self.operation:Optional[OperationModel] = None
+        self.operation:Optional[OperationRDTO] = None
+        self.workshop_schedule:Optional[WorkshopScheduleModel] = None
 
 
     async def execute(
@@ -57,26 +60,53 @@ class CreateClientScheduleCase(BaseUseCase[ScheduleWithRelationsDTO]):
         dto: CreateScheduleDTO,
     ):
         await self.validate(dto=dto, user=user)
-        operation = await self.operation_repository.get_first_with_filters(
-            filters=[
-                and_(
-                    self.operation_repository.model.value == AppDbValueConstants.ENTRY_CHECKPOINT,
-                )
-            ]
-        )
+        operation = await reference_registry.get_operation_by_value(AppDbValueConstants.ENTRY_CHECKPOINT)
         if not operation:
             raise AppExceptionResponse.bad_request(message="Операция вход в контрольную точку не найдена")
         self.operation = operation
         cdto = await self.transform(dto=dto,user=user)
-        model = await self.repository.create(obj=ScheduleModel(**cdto.dict()))
-        if not model:
-            raise AppExceptionResponse.internal_error(message="Произошла ошибка при создании расписания")
-        await self._update_order()
-        await self.recalculate_order_by_id_case.execute(id=self.order.id)
+        model = await self._create_with_reserved_slot(cdto=cdto)
         model = await self.repository.get(id=model.id,options=self.repository.default_relationships())
         return ScheduleWithRelationsDTO.from_orm(model)
 
 
+    async def _create_with_reserved_slot(self, cdto: ScheduleCDTO) -> ScheduleModel:
+        # Место в слоте занимается атомарно до вставки, поэтому параллельные
+        # бронирования не превысят machine_at_one_time
+        reservation = await self.slot_occupancy_service.reserve(
+            workshop_schedule_id=cdto.workshop_schedule_id,
+            start_at=cdto.start_at,
+            capacity=self.workshop_schedule.machine_at_one_time,
+        )
+        if not reservation.reserved:
+            raise AppExceptionResponse.conflict(message="Недостаточно места в выбранное время")
+        try:
+            # Бронь, смена статуса заказа и пересчет заказа — одна транзакция
+            async with unit_of_work(self.repository.db):
+                # Redis мог занизить занятость — перепроверяем по БД под
+                # блокировкой расписания цеха до фиксации брони
+                has_capacity = await self.slot_occupancy_service.has_capacity_in_db(
+                    workshop_schedule_id=cdto.workshop_schedule_id,
+                    start_at=cdto.start_at,
+                    capacity=self.workshop_schedule.machine_at_one_time,
+                )
+                if not has_capacity:
+                    raise AppExceptionResponse.conflict(message="Недостаточно места в выбранное время")
+                model = await self.repository.create(obj=ScheduleModel(**cdto.dict()))
+                if not model:
+                    raise AppExceptionResponse.internal_error(message="Произошла ошибка при создании расписания")
+                await self._update_order()
+                await self.recalculate_order_by_id_case.execute(id=self.order.id)
+        except Exception:
+            # Компенсация: возвращаем занятое место, если транзакция откатилась.
+            # Место, захваченное по БД (Redis недоступен), в индексе не учтено
+            if reservation.needs_release:
+                await self.slot_occupancy_service.release(
+                    workshop_schedule_id=cdto.workshop_schedule_id, start_at=cdto.start_at
+                )
+            raise
+        return model
+
     async def transform(self, dto: CreateScheduleDTO, user: UserWithRelationsDTO)->ScheduleCDTO:
        return ScheduleCDTO(
             order_id = dto.order_id,
@@ -131,6 +161,7 @@ class CreateClientScheduleCase(BaseUseCase[ScheduleWithRelationsDTO]):
 
         # Проверяем расписание
         workshop_schedule = await self._validate_schedule(dto)
+        self.workshop_schedule = workshop_schedule
 
         # Проверяем доступное время
         await self._validate_available_times(dto, workshop_schedule)
@@ -150,28 +181,15 @@ class CreateClientScheduleCase(BaseUseCase[ScheduleWithRelationsDTO]):
         if self.order:
             if self.order.status == AppDbValueConstants.PAID_WAITING_FOR_BOOKING_STATUS:
                 order_dto = OrderCDTO.from_orm(self.order)
-                next_order = await self.order_status_repository.get_first_with_filters(
-                    filters=[
-                        and_(
-                            func.lower(self.order_status_repository.model.value) == AppDbValueConstants.IN_PROGRESS_STATUS
-                        )
-                    ],
-                )
+                next_order = await reference_registry.get_order_status_by_value(AppDbValueConstants.IN_PROGRESS_STATUS)
                 order_dto.status = next_order.value
                 order_dto.status_id = next_order.id
                 self.order = await self.order_repository.update(obj=self.order,dto=order_dto)
 
 
     async def _validate_order_access(self, dto: CreateScheduleDTO, user: UserWithRelationsDTO):
-        available_order_statuses = await self.order_status_repository.get_with_filters(
-            filters=[
-                and_(
-                    self.order_status_repository.model.value.in_(
-                        [AppDbValueConstants.PAID_WAITING_FOR_BOOKING_STATUS, AppDbValueConstants.IN_PROGRESS_STATUS]
-                    ),
-                    self.order_status_repository.model.status == True
-                )
-            ],
+        available_order_statuses = await reference_registry.get_order_statuses_by_values(
+            [AppDbValueConstants.PAID_WAITING_FOR_BOOKING_STATUS, AppDbValueConstants.IN_PROGRESS_STATUS]
         )
         available_order_statuses_ids = [order_status.id for order_status in available_order_statuses]
         organization_ids = [organization.id for organization in user.organizations if organization.is_verified]
@@ -211,8 +229,10 @@ class CreateClientScheduleCase(BaseUseCase[ScheduleWithRelationsDTO]):
             dto=get_free_space_dto)
         if not available_times:
             raise AppExceptionResponse.bad_request(message="В выбранную дату нет свободного времени")
+        # Здесь проверяется только существование слота; вместимость
+        # проверяется атомарно при захвате места в _create_with_reserved_slot
         for available_time in available_times:
-            if available_time.start_at == dto.start_at or available_time.end_at == dto.end_at or available_time.free_space > 0:
+            if available_time.start_at == dto.start_at and available_time.end_at == dto.end_at:
                 return True
         raise AppExceptionResponse.bad_request(message="Недостаточно места в выбранное время")
 
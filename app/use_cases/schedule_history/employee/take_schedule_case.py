@@ -4,14 +4,15 @@ from typing import Optional
 from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.dto.operation.operation_dto import OperationRDTO
 from app.adapters.dto.schedule.schedule_dto import ScheduleCDTO
 from app.adapters.dto.schedule_history.schedule_history_dto import ScheduleHistoryWithRelationsDTO, ScheduleHistoryCDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsDTO
-from app.adapters.repositories.operation.operation_repository import OperationRepository
 from app.adapters.repositories.schedule.schedule_repository import ScheduleRepository
 from app.adapters.repositories.schedule_history.schedule_history_repository import ScheduleHistoryRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import ScheduleModel, OperationModel, ScheduleHistoryModel
+from app.entities import ScheduleModel, ScheduleHistoryModel
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.db_constants import AppDbValueConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -20,10 +21,9 @@ class TakeScheduleCase(BaseUseCase[ScheduleHistoryWithRelationsDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = ScheduleHistoryRepository(db)
         self.schedule_repository = ScheduleRepository(db)
-        self.operation_repository = OperationRepository(db)
         #Global Variables
         self.schedule: Optional[ScheduleModel] = None
-        self.operation: Optional[OperationModel] = None
+        self.operation: Optional[OperationRDTO] = None
         self.user: Optional[UserWithRelationsDTO] = None
         self.schedule_history: Optional[ScheduleHistoryModel] = None
 
@@ -35,7 +35,7 @@ class TakeScheduleCase(BaseUseCase[ScheduleHistoryWithRelationsDTO]):
     ) -> ScheduleHistoryWithRelationsDTO:
         self.user = user
         self.schedule = await self.schedule_repository.get(id=schedule_id,options=self.schedule_repository.default_relationships())
-        self.operation = await self.operation_repository.get(id=self.schedule.current_operation_id if self.schedule else 0)
+        self.operation = await reference_registry.get_operation(id=self.schedule.current_operation_id if self.schedule else 0)
         await self.validate()
         await self.transform()
         self.schedule_history = await self.repository.get_with_filters(
@@ -5,13 +5,12 @@ from sqlalchemy import func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.user.user_dto import UserCDTO, UserRDTO, UserWithRelationsDTO
-from app.adapters.repositories.role.role_repository import RoleRepository
 from app.adapters.repositories.user.user_repository import UserRepository
-from app.adapters.repositories.user_type.user_type_repository import UserTypeRepository
 from app.core.app_exception_response import AppExceptionResponse
 from app.core.auth_core import get_password_hash
 from app.entities import FileModel
 from app.infrastructure.services.file_service import FileService
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_cases.base_case import BaseUseCase
 
@@ -19,8 +18,6 @@ from app.use_cases.base_case import BaseUseCase
 class CreateUserCase(BaseUseCase[UserWithRelationsDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = UserRepository(db)
-        self.role_repository = RoleRepository(db)
-        self.user_type_repository = UserTypeRepository(db)
         self.service = FileService(db)
         self.extensions = AppFileExtensionConstants.IMAGE_EXTENSIONS
 
@@ -36,15 +33,14 @@ class CreateUserCase(BaseUseCase[UserWithRelationsDTO]):
                 extensions=self.extensions,
             )
         dto = await self.transform(dto=dto, file=file_model)
-        model = await self.repository.create(obj=self.repository.model(**dto.dict()))
+        model = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
+            options=self.repository.default_relationships(),
+        )
         if not model:
             raise AppExceptionResponse.internal_error(
                 message="Ошибка создания пользователя"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
         return UserWithRelationsDTO.from_orm(model)
 
     async def validate(self, dto: UserCDTO):
@@ -69,10 +65,10 @@ class CreateUserCase(BaseUseCase[UserWithRelationsDTO]):
             raise AppExceptionResponse.bad_request(
                 f"Пользователь с такими данными уже существует:{existed_column}"
             )
-        existed_role = await self.role_repository.get(id=dto.role_id)
+        existed_role = await reference_registry.get_role(id=dto.role_id)
         if not existed_role:
             raise AppExceptionResponse.bad_request("Роль не найдена")
-        existed_user_type = await self.user_type_repository.get(id=dto.type_id)
+        existed_user_type = await reference_registry.get_user_type(id=dto.type_id)
         if not existed_user_type:
             raise AppExceptionResponse.bad_request("Тип пользователя не найден")
 
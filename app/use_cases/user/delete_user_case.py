@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.repositories.user.user_repository import UserRepository
 from app.core.app_exception_response import AppExceptionResponse
 from app.infrastructure.services.file_service import FileService
+from app.use_cases.auth.get_current_user_case import invalidate_current_user
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -15,6 +16,7 @@ class DeleteUserCase(BaseUseCase[bool]):
     async def execute(self, id: int) -> bool:
         await self.validate(id=id)
         data = await self.repository.delete(id=id)
+        invalidate_current_user(id)
         return data
 
     async def validate(self, id: int):
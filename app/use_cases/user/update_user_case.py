@@ -5,22 +5,20 @@ from sqlalchemy import and_, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.user.user_dto import UserCDTO, UserWithRelationsDTO
-from app.adapters.repositories.role.role_repository import RoleRepository
 from app.adapters.repositories.user.user_repository import UserRepository
-from app.adapters.repositories.user_type.user_type_repository import UserTypeRepository
 from app.core.app_exception_response import AppExceptionResponse
 from app.core.auth_core import get_password_hash
 from app.entities import FileModel, UserModel
 from app.infrastructure.services.file_service import FileService
+from app.infrastructure.services.reference_registry import reference_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
+from app.use_cases.auth.get_current_user_case import invalidate_current_user
 from app.use_cases.base_case import BaseUseCase
 
 
 class UpdateUserCase(BaseUseCase[UserWithRelationsDTO]):
     def __init__(self, db: AsyncSession):
         self.repository = UserRepository(db)
-        self.role_repository = RoleRepository(db)
-        self.user_type_repository = UserTypeRepository(db)
         self.service = FileService(db)
         self.extensions = AppFileExtensionConstants.IMAGE_EXTENSIONS
 
@@ -36,15 +34,14 @@ class UpdateUserCase(BaseUseCase[UserWithRelationsDTO]):
                 extensions=self.extensions,
             )
         dto = await self.transform(model=model, dto=dto, file=file_model)
-        model = await self.repository.update(obj=model, dto=dto)
+        model = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not model:
             raise AppExceptionResponse.internal_error(
                 message="Ошибка при обновлении пользователя"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
+        invalidate_current_user(model.id)
         return UserWithRelationsDTO.from_orm(model)
 
     async def validate(self, id: int, dto: UserCDTO):
@@ -81,10 +78,10 @@ class UpdateUserCase(BaseUseCase[UserWithRelationsDTO]):
             raise AppExceptionResponse.bad_request(
                 f"Пользователь с такими данными уже существует:{existed_column}"
             )
-        existed_role = await self.role_repository.get(id=dto.role_id)
+        existed_role = await reference_registry.get_role(id=dto.role_id)
         if not existed_role:
             raise AppExceptionResponse.bad_request("Роль не найдена")
-        existed_user_type = await self.user_type_repository.get(id=dto.type_id)
+        existed_user_type = await reference_registry.get_user_type(id=dto.type_id)
         if not existed_user_type:
             raise AppExceptionResponse.bad_request("Тип пользователя не найден")
         return model
@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.user_type.user_type_dto import UserTypeCDTO, UserTypeRDTO
 from app.adapters.repositories.user_type.user_type_repository import UserTypeRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.services.reference_registry import reference_registry
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -16,6 +17,7 @@ class CreateUserTypeCase(BaseUseCase[UserTypeRDTO]):
     async def execute(self, dto: UserTypeCDTO) -> UserTypeRDTO:
         obj = await self.validate(dto=dto)
         data = await self.repository.create(obj=obj)
+        await reference_registry.invalidate()
         return UserTypeRDTO.from_orm(data)
 
     async def validate(self, dto: UserTypeCDTO):
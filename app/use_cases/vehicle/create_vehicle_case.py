@@ -45,15 +45,14 @@ class CreateVehicleCase(BaseUseCase[VehicleWithRelationsDTO]):
                 extensions=self.extensions,
             )
         dto = await self.transform(dto=dto, file=file_model)
-        model = await self.repository.create(obj=self.repository.model(**dto.dict()))
+        model = await self.repository.create(
+            obj=self.repository.model(**dto.dict()),
+            options=self.repository.default_relationships(),
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при создании транспорта"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
         return VehicleWithRelationsDTO.from_orm(model)
 
     async def validate(self, dto: VehicleCDTO):
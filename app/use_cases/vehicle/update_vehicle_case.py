@@ -45,15 +45,13 @@ class UpdateVehicleCase(BaseUseCase[VehicleWithRelationsDTO]):
                 extensions=self.extensions,
             )
         dto = await self.transform(model=model, dto=dto, file=file_model)
-        model = await self.repository.update(obj=model, dto=dto)
+        model = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not model:
             raise AppExceptionResponse().internal_error(
                 message="Произошла ошибка при обновлении транспорта"
             )
-        model = await self.repository.get(
-            id=model.id,
-            options=self.repository.default_relationships(),
-        )
         return VehicleWithRelationsDTO.from_orm(model)
 
     async def validate(self, id: int, dto: VehicleCDTO) -> VehicleModel:
@@ -19,16 +19,14 @@ class CreateVerifiedUserCase(BaseUseCase[VerifiedUserWithRelationsDTO]):
 
     async def execute(self, dto: VerifiedUserCDTO) -> VerifiedUserWithRelationsDTO:
         obj = await self.validate(dto=dto)
-        data = await self.repository.create(obj=obj)
+        data = await self.repository.create(
+            obj=obj, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.internal_error(
                 "Проверенный пользователь не создан"
             )
-        existed = await self.repository.get(
-            id=data.id,
-            options=self.repository.default_relationships(),
-        )
-        return VerifiedUserWithRelationsDTO.from_orm(existed)
+        return VerifiedUserWithRelationsDTO.from_orm(data)
 
     async def validate(self, dto: VerifiedUserCDTO):
         existed_user = await self.user_repository.get(id=dto.user_id)
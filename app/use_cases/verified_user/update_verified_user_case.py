@@ -23,16 +23,14 @@ class UpdateVerifiedUserCase(BaseUseCase[VerifiedUserWithRelationsDTO]):
     ) -> VerifiedUserWithRelationsDTO:
         model = await self.validate(id=id, dto=dto)
         dto = await self.transform(model=model, dto=dto)
-        data = await self.repository.update(obj=model, dto=dto)
+        data = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.internal_error(
                 "Проверенный пользователь не обновлен"
             )
-        existed = await self.repository.get(
-            id=data.id,
-            options=self.repository.default_relationships(),
-        )
-        return VerifiedUserWithRelationsDTO.from_orm(existed)
+        return VerifiedUserWithRelationsDTO.from_orm(data)
 
     async def validate(self, id: int, dto: VerifiedUserCDTO) -> VerifiedUserModel:
         model = await self.repository.get(id=id)
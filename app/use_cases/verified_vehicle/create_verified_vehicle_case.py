@@ -22,14 +22,12 @@ class CreateVerifiedVehicleCase(BaseUseCase[VerifiedVehicleWithRelationsDTO]):
         self, dto: VerifiedVehicleCDTO
     ) -> VerifiedVehicleWithRelationsDTO:
         obj = await self.validate(dto=dto)
-        data = await self.repository.create(obj=obj)
+        data = await self.repository.create(
+            obj=obj, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.internal_error("Проверенное ТС не создано")
-        existed = await self.repository.get(
-            id=data.id,
-            options=self.repository.default_relationships(),
-        )
-        return VerifiedVehicleWithRelationsDTO.from_orm(existed)
+        return VerifiedVehicleWithRelationsDTO.from_orm(data)
 
     async def validate(self, dto: VerifiedVehicleCDTO):
         existed = await self.vehicle_repository.get(id=dto.vehicle_id)
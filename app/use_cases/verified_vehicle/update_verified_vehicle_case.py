@@ -24,16 +24,14 @@ class UpdateVerifiedVehicleCase(BaseUseCase[VerifiedVehicleWithRelationsDTO]):
     ) -> VerifiedVehicleWithRelationsDTO:
         model = await self.validate(id=id, dto=dto)
         dto = await self.transform(model=model, dto=dto)
-        data = await self.repository.update(obj=model, dto=dto)
+        data = await self.repository.update(
+            obj=model, dto=dto, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.internal_error(
                 "Проверенный Транспорт не обновлен"
             )
-        existed = await self.repository.get(
-            id=data.id,
-            options=self.repository.default_relationships(),
-        )
-        return VerifiedVehicleWithRelationsDTO.from_orm(existed)
+        return VerifiedVehicleWithRelationsDTO.from_orm(data)
 
     async def validate(self, id: int, dto: VerifiedVehicleCDTO) -> VerifiedVehicleModel:
         model = await self.repository.get(id=id)
@@ -29,10 +29,8 @@ class UpdateWorkshopCase(BaseUseCase[WorkshopWithRelationsDTO]):
     ) -> WorkshopWithRelationsDTO:
         model = await self.validate(id=id, dto=dto)
         updated_dto = await self.transform(dto=dto, model=model, file=file)
-        existed = await self.repository.update(obj=model, dto=updated_dto)
-        existed = await self.repository.get(
-            id=existed.id,
-            options=self.repository.default_relationships(),
+        existed = await self.repository.update(
+            obj=model, dto=updated_dto, options=self.repository.default_relationships()
         )
         return WorkshopWithRelationsDTO.from_orm(existed)
 
@@ -22,14 +22,12 @@ class CreateWorkshopScheduleCase(BaseUseCase[WorkshopScheduleWithRelationsDTO]):
         self, dto: WorkshopScheduleCDTO
     ) -> WorkshopScheduleWithRelationsDTO:
         obj = await self.validate(dto=dto)
-        data = await self.repository.create(obj=obj)
+        data = await self.repository.create(
+            obj=obj, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.bad_request(message="Расписание не создано")
-        existed = await self.repository.get(
-            id=data.id,
-            options=self.repository.default_relationships(),
-        )
-        return WorkshopScheduleWithRelationsDTO.from_orm(existed)
+        return WorkshopScheduleWithRelationsDTO.from_orm(data)
 
     async def validate(self, dto: WorkshopScheduleCDTO):
         existed = await self.repository.get_first_with_filters(
@@ -1,5 +1,5 @@
-from datetime import date, datetime, time, timedelta
-from typing import List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
 
 from sqlalchemy import and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,13 +10,13 @@ from app.adapters.dto.workshop_schedule.workshop_schedule_by_day_dto import (
 from app.adapters.dto.workshop_schedule.workshop_schedule_space_dto import (
     WorkshopScheduleSpaceDTO,
 )
-from app.adapters.repositories.schedule.schedule_repository import ScheduleRepository
 from app.adapters.repositories.workshop.workshop_repository import WorkshopRepository
 from app.adapters.repositories.workshop_schdedule.workshop_schedule_repository import (
     WorkshopScheduleRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import WorkshopModel, WorkshopScheduleModel
+from app.infrastructure.services.slot_occupancy_service import SlotOccupancyService
 from app.use_cases.base_case import BaseUseCase
 
 
@@ -25,16 +25,28 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
     def __init__(self, db: AsyncSession):
         self.repository = WorkshopScheduleRepository(db)
         self.workshop_repository = WorkshopRepository(db)
-        self.schedule_repository = ScheduleRepository(db)
+        self.slot_occupancy_service = SlotOccupancyService(db)
 
     async def execute(
         self, dto: WorkshopScheduleByDayDTO
     ) -> list[WorkshopScheduleSpaceDTO]:
+        active_workshop_schedule = await self.get_active_schedule(
+            workshop_sap_id=dto.workshop_sap_id
+        )
+        if not active_workshop_schedule:
+            return []
+        return await self.transform(
+            dto=dto, active_workshop_schedule=active_workshop_schedule
+        )
+
+    async def get_active_schedule(
+        self, workshop_sap_id: str
+    ) -> Optional[WorkshopScheduleModel]:
         workshop = await self.workshop_repository.get_first_with_filters(
             filters=[
                 and_(
                     func.lower(self.workshop_repository.model.sap_id)
-                    == dto.workshop_sap_id.lower(),
+                    == workshop_sap_id.lower(),
                     self.workshop_repository.model.status == True,
                 )
             ]
@@ -43,7 +55,7 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
             filters=[
                 and_(
                     func.lower(self.repository.model.workshop_sap_id)
-                    == dto.workshop_sap_id.lower(),
+                    == workshop_sap_id.lower(),
                     self.repository.model.is_active == True,
                     # func.DATE(self.repository.model.start_at) <= dto.schedule_date,
                     # func.DATE(self.repository.model.end_at) >= dto.schedule_date,
@@ -51,22 +63,11 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
             ]
         )
         if not active_workshop_schedule:
-            return []
-        await self.validate(
-            dto=dto,
-            workshop=workshop,
-            active_workshop_schedule=active_workshop_schedule,
-        )
-        return await self.transform(
-            dto=dto, active_workshop_schedule=active_workshop_schedule
-        )
+            return None
+        await self.validate(workshop=workshop)
+        return active_workshop_schedule
 
-    async def validate(
-        self,
-        dto: WorkshopScheduleByDayDTO,
-        workshop: Optional[WorkshopModel],
-        active_workshop_schedule: WorkshopScheduleModel,
-    ):
+    async def validate(self, workshop: Optional[WorkshopModel]):
         if not workshop:
             raise AppExceptionResponse.bad_request("Цех не активен либо не найден")
 
@@ -82,23 +83,25 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
     async def _generate_schedule(
         self, schedule_date: date, active_schedule: WorkshopScheduleModel
     ) -> List[WorkshopScheduleSpaceDTO]:
-        time_start = time(0, 0, 59)
-        time_end = time(23, 59, 59)
-        date_start = datetime.combine(schedule_date, time_start)
-        date_end = datetime.combine(schedule_date, time_end)
-
-        # Получение расписаний с фильтрацией
-        schedules = await self.schedule_repository.get_with_filters(
-            filters=[
-                and_(
-                    self.schedule_repository.model.is_active.is_(True),
-                    self.schedule_repository.model.start_at >= date_start,
-                    self.schedule_repository.model.start_at <= date_end,
-                )
-            ]
+        # Занятость слотов только этого расписания цеха: {"HH:MM:SS": количество}
+        occupancy = await self.slot_occupancy_service.get_day_occupancy(
+            workshop_schedule_id=active_schedule.id, schedule_date=schedule_date
+        )
+        return self.build_day_slots(
+            schedule_date=schedule_date,
+            active_schedule=active_schedule,
+            occupancy=occupancy,
         )
 
-        planned_schedules = []
+    def build_day_slots(
+        self,
+        schedule_date: date,
+        active_schedule: WorkshopScheduleModel,
+        occupancy: Dict[str, int],
+    ) -> List[WorkshopScheduleSpaceDTO]:
+        """
+        Свободные слоты дня по готовой занятости, без обращений к БД.
+        """
         current_time_dt = datetime.combine(datetime.today(), datetime.now().time())
 
         # Корректировка времени для указанной даты
@@ -114,12 +117,10 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
             )
 
         # Генерация расписания
-        planned_schedules = self._create_schedule_intervals(
-            current_time_dt, schedule_date, active_schedule, schedules
+        return self._create_schedule_intervals(
+            current_time_dt, schedule_date, active_schedule, occupancy
         )
 
-        return planned_schedules
-
     def _adjust_current_time(self, current_time_dt, active_schedule):
         """
         Корректирует текущее время для расписания на сегодня.
@@ -140,7 +141,11 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
         return start_time_dt
 
     def _create_schedule_intervals(
-        self, current_time_dt, schedule_date, active_schedule, schedules
+        self,
+        current_time_dt,
+        schedule_date,
+        active_schedule,
+        occupancy: Dict[str, int],
     ):
         """
         Генерация расписания на основе интервалов работы.
@@ -158,16 +163,10 @@ class GetWorkshopScheduleByDayCase(BaseUseCase[list[WorkshopScheduleSpaceDTO]]):
             if service_end_time.time() > active_schedule.end_at:
                 break
 
-            # Фильтрация записей для текущего интервала
-            filtered_items = [
-                item
-                for item in schedules
-                if item.start_at
-                == datetime.combine(schedule_date, current_time_dt.time())
-            ]
-            free_space = max(
-                0, active_schedule.machine_at_one_time - len(filtered_items)
+            booked = occupancy.get(
+                SlotOccupancyService.slot_field(current_time_dt.time()), 0
             )
+            free_space = max(0, active_schedule.machine_at_one_time - booked)
 
             if free_space > 0:
                 planned_schedules.append(
@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.workshop_schedule.workshop_schedule_calendar_dto import (
+    WorkshopScheduleCalendarDTO,
+    WorkshopScheduleCalendarFilterDTO,
+    WorkshopScheduleCalendarSlotDTO,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.config import app_config
+from app.infrastructure.services.slot_occupancy_service import SlotOccupancyService
+from app.use_cases.base_case import BaseUseCase
+from app.use_cases.workshop_schedule.get_workshop_schedule_by_day_case import (
+    GetWorkshopScheduleByDayCase,
+)
+
+
+class GetWorkshopScheduleCalendarCase(BaseUseCase[WorkshopScheduleCalendarDTO]):
+    """
+    Свободные слоты цеха сразу за несколько дней: цех и расписание ищутся
+    один раз, занятость за весь период берется одним GROUP BY запросом.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.get_workshop_schedule_by_day_case = GetWorkshopScheduleByDayCase(db)
+        self.slot_occupancy_service = SlotOccupancyService(db)
+
+    async def execute(
+        self, dto: WorkshopScheduleCalendarFilterDTO
+    ) -> WorkshopScheduleCalendarDTO:
+        await self.validate(dto=dto)
+        date_from = max(
+            dto.date_from or app_config.get_scheduled_date_from_now(),
+            app_config.get_scheduled_date_from_now(),
+        )
+        date_to = min(
+            dto.date_to or app_config.get_max_scheduled_date_from_now(),
+            app_config.get_max_scheduled_date_from_now(),
+        )
+        calendar = WorkshopScheduleCalendarDTO(
+            workshop_schedule_id=None, date_from=date_from, date_to=date_to
+        )
+        if date_from > date_to:
+            return calendar
+
+        active_schedule = (
+            await self.get_workshop_schedule_by_day_case.get_active_schedule(
+                workshop_sap_id=dto.workshop_sap_id
+            )
+        )
+        if not active_schedule:
+            return calendar
+        calendar.workshop_schedule_id = active_schedule.id
+
+        occupancy = await self.slot_occupancy_service.get_range_occupancy(
+            workshop_schedule_id=active_schedule.id,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        schedule_date = date_from
+        while schedule_date <= date_to:
+            slots = self.get_workshop_schedule_by_day_case.build_day_slots(
+                schedule_date=schedule_date,
+                active_schedule=active_schedule,
+                occupancy=occupancy.get(schedule_date, {}),
+            )
+            calendar.days[schedule_date] = [
+                WorkshopScheduleCalendarSlotDTO(
+                    start_at=slot.start_at,
+                    end_at=slot.end_at,
+                    free_space=slot.free_space,
+                )
+                for slot in slots
+            ]
+            schedule_date += timedelta(days=1)
+        return calendar
+
+    async def validate(self, dto: WorkshopScheduleCalendarFilterDTO):
+        if not dto.workshop_sap_id:
+            raise AppExceptionResponse.bad_request("Укажите SAP ID цеха")
+        if dto.date_from and dto.date_to and dto.date_from > dto.date_to:
+            raise AppExceptionResponse.bad_request(
+                "Начало периода не может быть позже конца периода"
+            )
@@ -23,14 +23,12 @@ class UpdateWorkshopScheduleCase(BaseUseCase[WorkshopScheduleWithRelationsDTO]):
         self, id: int, dto: WorkshopScheduleCDTO
     ) -> WorkshopScheduleWithRelationsDTO:
         obj = await self.validate(id=id, dto=dto)
-        data = await self.repository.update(obj=obj, dto=dto)
+        data = await self.repository.update(
+            obj=obj, dto=dto, options=self.repository.default_relationships()
+        )
         if not data:
             raise AppExceptionResponse.bad_request(message="Расписание не обновлено")
-        existed = await self.repository.get(
-            id=data.id,
-            options=self.repository.default_relationships(),
-        )
-        return WorkshopScheduleWithRelationsDTO.from_orm(existed)
+        return WorkshopScheduleWithRelationsDTO.from_orm(data)
 
     async def validate(self, id: int, dto: WorkshopScheduleCDTO):
         existed_schedule = self.repository.get(id)
@@ -0,0 +1,119 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Optional
+
+from app.adapters.repositories.sap_outbox.sap_outbox_repository import (
+    SapOutboxRepository,
+)
+from app.infrastructure.config import app_config
+from app.infrastructure.database import AsyncSessionLocal
+from app.infrastructure.http_transport import http_transport
+from app.infrastructure.redis_client import close_redis
+from app.infrastructure.services.reference_registry import reference_registry
+from app.infrastructure.services.sap_order_batcher import sap_order_batcher
+from app.infrastructure.services.sap_outbox_queue import sap_outbox_queue
+from app.use_cases.sap.outbox.process_sap_outbox_case import ProcessSapOutboxCase
+
+logger = logging.getLogger(__name__)
+
+
+class SapOutboxWorker:
+    """
+    Воркер outbox SAP 088: забирает записи из очереди Redis и раз в
+    `sap_outbox_poll_interval_sec` обходит таблицу в поисках записей,
+    которым подошел срок повтора, истекла аренда или не дошло сообщение.
+
+    Запускается внутри приложения (`sap_outbox_worker_in_app`) или
+    отдельным процессом: `python -m app.workers.sap_outbox_worker`.
+    Несколько воркеров безопасны: запись захватывает только один из них.
+    Записи обрабатываются параллельно группами по `sap_088_batch_size`,
+    чтобы их заявки ушли в SAP одним пакетом.
+    """
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+        self._last_sweep = 0.0
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        await sap_order_batcher.stop()
+
+    async def run(self) -> None:
+        logger.info("Воркер outbox SAP запущен")
+        while True:
+            try:
+                ids = await self._next_ids()
+                size = max(1, app_config.sap_088_batch_size)
+                for start in range(0, len(ids), size):
+                    await asyncio.gather(
+                        *(
+                            self.process(outbox_id)
+                            for outbox_id in ids[start : start + size]
+                        )
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Ошибка цикла воркера outbox SAP: {e}")
+                await asyncio.sleep(app_config.sap_outbox_poll_interval_sec)
+
+    async def process(self, outbox_id: int) -> None:
+        async with AsyncSessionLocal() as session:
+            try:
+                await ProcessSapOutboxCase(session).execute(outbox_id=outbox_id)
+            except Exception as e:
+                logger.error(f"Не удалось обработать outbox SAP {outbox_id}: {e}")
+
+    async def _next_ids(self) -> List[int]:
+        loop = asyncio.get_running_loop()
+        if loop.time() - self._last_sweep >= app_config.sap_outbox_poll_interval_sec:
+            self._last_sweep = loop.time()
+            ids = await self._due_ids()
+            if ids:
+                return ids
+        outbox_id = await sap_outbox_queue.pop(
+            timeout=app_config.sap_outbox_poll_interval_sec
+        )
+        if not outbox_id:
+            return []
+        # Пока ждали первую запись, могли прийти еще: отправим их вместе
+        return [outbox_id] + await sap_outbox_queue.pop_many(
+            limit=app_config.sap_088_batch_size - 1
+        )
+
+    @staticmethod
+    async def _due_ids() -> List[int]:
+        async with AsyncSessionLocal() as session:
+            return await SapOutboxRepository(session).get_due_ids(
+                now=datetime.now(), limit=app_config.sap_outbox_sweep_batch_size
+            )
+
+
+sap_outbox_worker = SapOutboxWorker()
+
+
+async def main() -> None:
+    await reference_registry.start()
+    try:
+        await sap_outbox_worker.run()
+    finally:
+        await sap_order_batcher.stop()
+        await reference_registry.stop()
+        await http_transport.close()
+        await close_redis()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,165 @@
+"""
+Circuit breaker и правила повторов внешних HTTP-вызовов
+(app/infrastructure/http_resilience.py). Чистая логика: без сети и настроек.
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from app.infrastructure import http_resilience
+from app.infrastructure.http_resilience import (
+    CircuitBreaker,
+    CircuitState,
+    HttpBulkheadFullError,
+    HttpCircuitOpenError,
+    backoff_delay,
+    is_retryable_error,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(http_resilience.time, "monotonic", clock)
+    return clock
+
+
+def make_breaker(threshold: int = 3, reset_timeout: float = 10.0) -> CircuitBreaker:
+    return CircuitBreaker(
+        "test", failure_threshold=threshold, reset_timeout=reset_timeout
+    )
+
+
+def open_breaker(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_breaker_opens_after_threshold_failures(clock):
+    breaker = make_breaker(threshold=3)
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened_total == 1
+
+
+def test_success_resets_failure_count(clock):
+    breaker = make_breaker(threshold=2)
+    breaker.before_request()
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_success()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_open_breaker_rejects_until_reset_timeout(clock):
+    breaker = make_breaker(reset_timeout=10.0)
+    open_breaker(breaker)
+
+    clock.now += 9
+    with pytest.raises(HttpCircuitOpenError) as exc_info:
+        breaker.before_request()
+    assert exc_info.value.retry_in == pytest.approx(1.0)
+    assert breaker.rejected_total == 1
+
+    clock.now += 1
+    breaker.before_request()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_half_open_allows_single_trial(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request()
+    with pytest.raises(HttpCircuitOpenError):
+        breaker.before_request()
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 0
+    breaker.before_request()
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = make_breaker(threshold=5)
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.opened_at == clock.now
+    with pytest.raises(HttpCircuitOpenError):
+        breaker.before_request()
+
+
+def test_release_frees_cancelled_trial(clock):
+    breaker = make_breaker()
+    open_breaker(breaker)
+    clock.now += breaker.reset_timeout
+
+    breaker.before_request()
+    breaker.release()
+    assert breaker.state == CircuitState.HALF_OPEN
+    # Отмененный пробный запрос не блокирует следующий
+    breaker.before_request()
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        aiohttp.ServerDisconnectedError(),
+        aiohttp.ClientConnectionError(),
+        aiohttp.ClientPayloadError(),
+        asyncio.TimeoutError(),
+    ],
+)
+def test_connection_errors_and_timeouts_are_retryable(error):
+    assert is_retryable_error(error)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        HttpCircuitOpenError("test", retry_in=1.0),
+        HttpBulkheadFullError("test"),
+        aiohttp.ClientResponseError(request_info=None, history=(), status=400),
+        ValueError("not a transport error"),
+    ],
+)
+def test_rejections_and_response_errors_are_not_retryable(error):
+    assert not is_retryable_error(error)
+
+
+@pytest.mark.parametrize("attempt", [1, 2, 3, 10])
+def test_backoff_delay_is_capped(attempt):
+    for _ in range(50):
+        delay = backoff_delay(attempt, base_delay=0.5, max_delay=2.0)
+        assert 0 <= delay <= min(2.0, 0.5 * 2 ** (attempt - 1))
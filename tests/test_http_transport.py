@@ -0,0 +1,185 @@
+"""
+Повторы и circuit breaker общего HTTP-транспорта
+(app/infrastructure/http_transport.py) на локальном aiohttp-сервере.
+
+Нужны настройки приложения (.env или переменные окружения); без них тест
+пропускается.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+from aiohttp import web
+from pydantic import ValidationError
+
+try:
+    from app.infrastructure.config import app_config
+    from app.infrastructure.http_resilience import CircuitState, HttpCircuitOpenError
+    from app.infrastructure.http_transport import (
+        HttpDecodeError,
+        HttpStatusError,
+        HttpTransport,
+        HttpTransportResponse,
+        is_outcome_unknown,
+    )
+except ValidationError:
+    pytest.skip("Настройки приложения не заданы", allow_module_level=True)
+
+UPSTREAM = "test"
+
+
+class Upstream:
+    """Отвечает статусами из `statuses` по очереди, затем 200."""
+
+    def __init__(self, statuses: List[int], delay: float = 0.0) -> None:
+        self.statuses = list(statuses)
+        self.delay = delay
+        self.calls = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        status = self.statuses.pop(0) if self.statuses else 200
+        return web.json_response({"status": status}, status=status)
+
+
+async def call(upstream: Upstream, method: str, **kwargs):
+    """Запрос через новый HttpTransport; возвращает ответ и транспорт."""
+    app = web.Application()
+    app.router.add_route("*", "/", upstream.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    transport = HttpTransport()
+    try:
+        response = await transport.request(
+            UPSTREAM, method, f"http://127.0.0.1:{port}/", **kwargs
+        )
+        return response, transport
+    finally:
+        await transport.close()
+        await runner.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(app_config, "http_retry_attempts", 2)
+    monkeypatch.setattr(app_config, "http_retry_base_delay_sec", 0.0)
+    monkeypatch.setattr(app_config, "http_retry_max_delay_sec", 0.0)
+    monkeypatch.setattr(app_config, "http_circuit_failure_threshold", 5)
+
+
+def test_get_is_retried_on_retryable_status():
+    upstream = Upstream([503, 502])
+    response, transport = asyncio.run(call(upstream, "GET"))
+    assert response.status == 200
+    assert upstream.calls == 3
+    assert transport.get_stats()[UPSTREAM]["retries_total"] == 2
+
+
+def test_get_returns_last_response_when_attempts_exhausted():
+    upstream = Upstream([503, 503, 503, 503])
+    response, _ = asyncio.run(call(upstream, "GET"))
+    assert response.status == 503
+    assert upstream.calls == 3
+
+
+def test_post_is_not_retried_by_default():
+    upstream = Upstream([503])
+    response, _ = asyncio.run(call(upstream, "POST"))
+    assert response.status == 503
+    assert upstream.calls == 1
+
+
+def test_post_marked_idempotent_is_retried():
+    upstream = Upstream([503])
+    response, _ = asyncio.run(call(upstream, "POST", idempotent=True))
+    assert response.status == 200
+    assert upstream.calls == 2
+
+
+def test_client_error_status_is_not_retried():
+    upstream = Upstream([404])
+    response, transport = asyncio.run(call(upstream, "GET"))
+    assert response.status == 404
+    assert upstream.calls == 1
+    # 4xx — ошибка запроса: цепь не размыкается
+    assert transport.get_stats()[UPSTREAM]["circuit_failures"] == 0
+
+
+def test_open_circuit_stops_retries(monkeypatch):
+    monkeypatch.setattr(app_config, "http_circuit_failure_threshold", 1)
+    upstream = Upstream([503, 503, 503])
+    response, transport = asyncio.run(call(upstream, "GET"))
+    # Повтор отклонила бы разомкнутая цепь: отдается настоящий ответ сервиса
+    assert response.status == 503
+    assert upstream.calls == 1
+    assert transport.get_stats()[UPSTREAM]["circuit_state"] == CircuitState.OPEN
+
+
+def test_read_timeout_is_retried_for_get():
+    upstream = Upstream([], delay=0.3)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(call(upstream, "GET", read_timeout=0.05))
+    assert upstream.calls == 3
+
+
+def test_read_timeout_is_not_retried_for_post():
+    upstream = Upstream([], delay=0.3)
+    with pytest.raises(asyncio.TimeoutError) as exc_info:
+        asyncio.run(call(upstream, "POST", read_timeout=0.05))
+    assert upstream.calls == 1
+    # Запрос мог выполниться: повторять создание нельзя
+    assert is_outcome_unknown(exc_info.value)
+
+
+def test_cancelled_trial_request_releases_half_open_breaker():
+    async def scenario():
+        upstream = Upstream([], delay=1.0)
+        app = web.Application()
+        app.router.add_route("*", "/", upstream.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        transport = HttpTransport()
+        try:
+            breaker = transport._get_breaker(UPSTREAM)
+            breaker.state = CircuitState.HALF_OPEN
+            task = asyncio.create_task(
+                transport.get(UPSTREAM, f"http://127.0.0.1:{port}/")
+            )
+            await asyncio.sleep(0.1)
+            with pytest.raises(HttpCircuitOpenError):
+                breaker.before_request()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # Отмена не оставляет пробный запрос «в полете»
+            breaker.before_request()
+        finally:
+            await transport.close()
+            await runner.cleanup()
+
+    asyncio.run(scenario())
+
+
+def test_non_json_body_raises_transport_error():
+    response = HttpTransportResponse(
+        status=200, url="http://sap/088", headers={}, body=b"<html>Bad gateway</html>"
+    )
+    with pytest.raises(HttpDecodeError):
+        response.json()
+
+
+@pytest.mark.parametrize(
+    "status, unknown", [(500, False), (502, False), (503, False), (504, True)]
+)
+def test_only_gateway_timeout_status_is_outcome_unknown(status, unknown):
+    error = HttpStatusError(status=status, url="http://sap/088", message="")
+    assert is_outcome_unknown(error) is unknown
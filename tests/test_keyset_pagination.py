@@ -0,0 +1,175 @@
+"""
+Keyset-пагинация BaseRepository.paginate (курсор PaginationCursor и условие
+`_keyset_filter`): обход страниц по курсору совпадает с OFFSET-выборкой,
+в том числе при NULL и повторяющихся значениях поля сортировки.
+
+Запросы выполняются в SQLite в памяти; порядок NULL проверяется для обеих
+веток `_apply_order_by` (MySQL и PostgreSQL). Нужны настройки приложения
+(.env или переменные окружения); без них тест пропускается.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Optional
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel, ConfigDict, ValidationError
+from sqlalchemy import DateTime, Integer, Numeric, String
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+try:
+    from app.adapters.repositories.base_repository import BaseRepository
+    from app.adapters.repositories.pagination_cursor import PaginationCursor
+    from app.infrastructure.config import app_config
+except ValidationError:
+    pytest.skip("Настройки приложения не заданы", allow_module_level=True)
+
+PER_PAGE = 3
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class ItemModel(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    price: Mapped[Optional[Decimal]] = mapped_column(Numeric(10, 2), nullable=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class ItemDTO(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+def make_items() -> List[ItemModel]:
+    """Повторы и NULL в каждом поле сортировки, id вперемешку с порядком."""
+    start = datetime(2026, 1, 1, 12, 0)
+    names = ["b", None, "a", "b", None, "c", "a", "b", None, "a", "c"]
+    prices = [
+        None,
+        "10.50",
+        "10.50",
+        "1.00",
+        None,
+        "99.99",
+        "1.00",
+        None,
+        "5",
+        "5",
+        "7",
+    ]
+    return [
+        ItemModel(
+            id=id,
+            name=names[index],
+            price=Decimal(prices[index]) if prices[index] else None,
+            created_at=(
+                None if index % 4 == 1 else start + timedelta(minutes=index % 3)
+            ),
+        )
+        for index, id in enumerate([7, 3, 11, 1, 9, 5, 2, 10, 4, 8, 6])
+    ]
+
+
+async def collect_pages(order_by: str, order_direction: str):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        sessions = async_sessionmaker(engine, class_=AsyncSession)
+        async with sessions() as db:
+            db.add_all(make_items())
+            await db.commit()
+            repository = BaseRepository(ItemModel, db)
+            expected = await repository.paginate(
+                dto=ItemDTO,
+                per_page=100,
+                order_by=order_by,
+                order_direction=order_direction,
+            )
+            pages = []
+            cursor = None
+            while True:
+                page = await repository.paginate(
+                    dto=ItemDTO,
+                    per_page=PER_PAGE,
+                    order_by=order_by,
+                    order_direction=order_direction,
+                    cursor=cursor,
+                )
+                pages.append(page)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+        return expected, pages
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("database", ["mysql", "postgresql"])
+@pytest.mark.parametrize("order_direction", ["asc", "desc"])
+@pytest.mark.parametrize("order_by", ["id", "name", "price", "created_at"])
+def test_cursor_pages_match_offset_order(
+    monkeypatch, database, order_direction, order_by
+):
+    monkeypatch.setattr(app_config, "app_database", database)
+    expected, pages = asyncio.run(collect_pages(order_by, order_direction))
+
+    expected_ids = [item.id for item in expected.items]
+    cursor_ids = [item.id for page in pages for item in page.items]
+    assert cursor_ids == expected_ids
+    assert len(cursor_ids) == len(make_items())
+    assert [page.current_page for page in pages] == list(range(1, len(pages) + 1))
+    assert all(page.total_items == len(expected_ids) for page in pages)
+
+
+@pytest.mark.parametrize("database", ["mysql", "postgresql"])
+def test_nulls_last_on_asc_and_first_on_desc(monkeypatch, database):
+    monkeypatch.setattr(app_config, "app_database", database)
+    items = {item.id: item for item in make_items()}
+
+    expected, _ = asyncio.run(collect_pages("name", "asc"))
+    names = [items[item.id].name for item in expected.items]
+    assert names[-3:] == [None, None, None]
+
+    expected, _ = asyncio.run(collect_pages("name", "desc"))
+    names = [items[item.id].name for item in expected.items]
+    assert names[:3] == [None, None, None]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, 42, "text", Decimal("10.50"), datetime(2026, 1, 1, 12, 30, 15)],
+)
+def test_cursor_round_trip_restores_value_type(value):
+    column = {
+        type(None): ItemModel.name,
+        int: ItemModel.id,
+        str: ItemModel.name,
+        Decimal: ItemModel.price,
+        datetime: ItemModel.created_at,
+    }[type(value)]
+    cursor = PaginationCursor(
+        order_by=column.key,
+        order_direction="desc",
+        last_value=value,
+        last_id=5,
+        page=2,
+        total_items=11,
+    )
+    assert PaginationCursor.decode(cursor.encode(), column=column) == cursor
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "bnVsbA"])
+def test_malformed_cursor_is_bad_request(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        PaginationCursor.decode(cursor, column=ItemModel.id)
+    assert exc_info.value.status_code == 400
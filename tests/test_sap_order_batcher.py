@@ -0,0 +1,135 @@
+"""
+Пакетная отправка заявок SAP 088 (SapOrderBatcher): раскладка ответа по
+ORDER_ID, заказ без элемента в ответе, ошибка вызова целиком, повторная
+заявка в том же пакете. SAP подменяется заглушкой клиента.
+
+Нужны настройки приложения (.env или переменные окружения); без них тест
+пропускается.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+try:
+    from app.adapters.dto.sap.create_sap_order_dto import (
+        CreateLegalSapOrderDTO,
+        SapOrderStatusItemDTO,
+        SapStatusDTO,
+    )
+    from app.infrastructure.api_clients.sap.sap_create_order_client import (
+        is_order_outcome_unknown,
+    )
+    from app.infrastructure.config import app_config
+    from app.infrastructure.services.sap_order_batcher import SapOrderBatcher
+except ValidationError:
+    pytest.skip("Настройки приложения не заданы", allow_module_level=True)
+
+
+class FakeSapClient:
+    """Отвечает элементом на каждый заказ пакета, кроме `missing`."""
+
+    def __init__(self, missing=(), error: Exception = None) -> None:
+        self.missing = set(missing)
+        self.error = error
+        self.batches: List[List[int]] = []
+
+    async def create_sap_orders(self, orders) -> SapStatusDTO:
+        self.batches.append([order.ORDER_ID for order in orders])
+        if self.error:
+            raise self.error
+        # Порядок элементов в ответе SAP не обязан совпадать с запросом
+        return SapStatusDTO(
+            items=[
+                SapOrderStatusItemDTO(
+                    STATUS=1, ZAKAZ=f"Z{order.ORDER_ID}", ORDER_ID=order.ORDER_ID
+                )
+                for order in reversed(orders)
+                if order.ORDER_ID not in self.missing
+            ]
+        )
+
+    async def create_sap_order(self, order) -> SapStatusDTO:
+        return await self.create_sap_orders([order])
+
+
+def make_order(order_id: int) -> CreateLegalSapOrderDTO:
+    return CreateLegalSapOrderDTO(DOGOVOR="D1", MATNR="M1", QUAN=30, ORDER_ID=order_id)
+
+
+def make_batcher(client: FakeSapClient) -> SapOrderBatcher:
+    batcher = SapOrderBatcher()
+    batcher.client = client
+    return batcher
+
+
+@pytest.fixture(autouse=True)
+def batch_settings(monkeypatch):
+    monkeypatch.setattr(app_config, "sap_088_batch_size", 3)
+    monkeypatch.setattr(app_config, "sap_088_batch_window_sec", 0.05)
+
+
+async def submit(batcher: SapOrderBatcher, order_ids: List[int]):
+    try:
+        return await asyncio.gather(
+            *[batcher.create_sap_order(make_order(id)) for id in order_ids],
+            return_exceptions=True,
+        )
+    finally:
+        await batcher.stop()
+
+
+def test_orders_in_window_share_one_call_and_get_own_item():
+    client = FakeSapClient()
+    results = asyncio.run(submit(make_batcher(client), [1, 2]))
+
+    assert client.batches == [[1, 2]]
+    assert [result.items[0].ZAKAZ for result in results] == ["Z1", "Z2"]
+    assert all(len(result.items) == 1 for result in results)
+
+
+def test_full_batch_is_sent_without_waiting_for_window():
+    client = FakeSapClient()
+    results = asyncio.run(submit(make_batcher(client), [1, 2, 3, 4]))
+
+    assert client.batches == [[1, 2, 3], [4]]
+    assert [result.items[0].ORDER_ID for result in results] == [1, 2, 3, 4]
+
+
+def test_missing_item_fails_only_its_order_as_outcome_unknown():
+    client = FakeSapClient(missing=[2])
+    results = asyncio.run(submit(make_batcher(client), [1, 2, 3]))
+
+    assert results[0].items[0].ORDER_ID == 1
+    assert results[2].items[0].ORDER_ID == 3
+    assert isinstance(results[1], HTTPException)
+    # Пакет SAP принял: заказ мог быть создан, повторять его нельзя
+    assert is_order_outcome_unknown(results[1])
+
+
+def test_call_failure_is_returned_to_every_order_of_batch():
+    error = RuntimeError("SAP 088 недоступен")
+    client = FakeSapClient(error=error)
+    results = asyncio.run(submit(make_batcher(client), [1, 2]))
+
+    assert results == [error, error]
+
+
+def test_same_order_twice_in_batch_is_sent_once():
+    client = FakeSapClient()
+    results = asyncio.run(submit(make_batcher(client), [1, 1]))
+
+    assert client.batches == [[1]]
+    assert [result.items[0].ORDER_ID for result in results] == [1, 1]
+
+
+def test_batch_size_one_calls_client_directly(monkeypatch):
+    monkeypatch.setattr(app_config, "sap_088_batch_size", 1)
+    client = FakeSapClient()
+    results = asyncio.run(submit(make_batcher(client), [1, 2]))
+
+    assert client.batches == [[1], [2]]
+    assert [result.items[0].ORDER_ID for result in results] == [1, 2]